@@ -18,24 +18,28 @@ from the UI or ask your administrator to increase the access token timeout in Ke
 """
 
 import argparse
+import asyncio
 import base64
 import json
 import logging
+import re
 import sys
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote
 
-import requests
+import httpx
+import orjson
 
-# Add project root to path to import constants
+# Project root is added to the path lazily, only when registry constants are needed
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from registry.constants import REGISTRY_CONSTANTS
 
 logging.basicConfig(
     level=logging.INFO,
@@ -43,22 +47,100 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO, which would interleave with the test report
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 
 DEFAULT_BASE_URL: str = "http://localhost"
-AGENTS_API_VERSION: str = REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION
 
+# Compression is requested explicitly; httpx decompresses gzip/deflate bodies transparently
+_CLIENT_HEADERS: dict[str, str] = {"Accept-Encoding": "gzip, deflate"}
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=8)
+_INVALID_TOKEN_HEADERS: dict[str, str] = {
+    "X-Authorization": "Bearer invalid_token_here",
+    "Content-Type": "application/json",
+}
+
+# Names made only of RFC 3986 unreserved characters need no percent-encoding
+_SAFE_NAME_PATTERN = re.compile(r"[A-Za-z0-9._~\-]+\Z")
+
+# Built on first use and reused when main() runs more than once in a process
+_PARSER: argparse.ArgumentParser | None = None
+
+# Last ETag and decoded body per (method, endpoint, params), used to send
+# If-None-Match on repeat requests; None disables conditional requests (--no-cache)
+_ETAG_CACHE: dict[tuple[str, str, tuple[tuple[str, Any], ...]], tuple[str, Any]] | None = {}
 
+
+@dataclass(slots=True)
 class TestResult:
     """Container for test results."""
 
-    def __init__(self, test_name: str) -> None:
-        """Initialize test result."""
-        self.test_name = test_name
-        self.passed = False
-        self.duration_ms = 0
-        self.response = None
-        self.error = None
-        self.message = ""
+    test_name: str
+    passed: bool = False
+    duration_ms: int = 0
+    response: Any = None
+    error: str | None = None
+    message: str = ""
+
+
+@cache
+def _agents_api_version() -> str:
+    """
+    Read the A2A Agents API version from the registry constants.
+
+    The registry package is imported on first call rather than at module load,
+    so --help and other early exits do not pay for it.
+
+    Returns:
+        API version string (e.g. "v0.1")
+    """
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from registry.constants import REGISTRY_CONSTANTS
+
+    return REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION
+
+
+@cache
+def _agents_base() -> str:
+    """
+    Get the agents endpoint prefix for the configured API version.
+
+    Returns:
+        Endpoint prefix such as "/v0.1/agents"
+    """
+    return f"/{_agents_api_version()}/agents"
+
+
+@lru_cache(maxsize=128)
+def _quote_name(name: str) -> str:
+    """
+    URL-encode an agent name for use as a path segment.
+
+    Args:
+        name: Agent name (URL-encoded or plain)
+
+    Returns:
+        Name safe to embed in a URL path
+    """
+    if _SAFE_NAME_PATTERN.match(name):
+        return name
+    return quote(name, safe="")
+
+
+@contextmanager
+def _timed(result: TestResult) -> Iterator[None]:
+    """
+    Record the elapsed time of the enclosed block on a test result.
+
+    Args:
+        result: Test result whose duration_ms is set when the block exits
+    """
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        result.duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
 
 def _check_token_expiration(access_token: str) -> None:
@@ -69,15 +151,17 @@ def _check_token_expiration(access_token: str) -> None:
         access_token: JWT access token to check
     """
     try:
-        parts = access_token.split(".")
-        if len(parts) != 3:
+        token_bytes = access_token.encode()
+        first_dot = token_bytes.find(b".")
+        second_dot = token_bytes.find(b".", first_dot + 1)
+        if first_dot < 0 or second_dot < 0 or token_bytes.find(b".", second_dot + 1) >= 0:
             logger.warning("Invalid JWT format, cannot check expiration")
             return
 
-        payload = parts[1]
+        payload = token_bytes[first_dot + 1 : second_dot]
         padding = len(payload) % 4
         if padding:
-            payload += "=" * (4 - padding)
+            payload += b"=" * (4 - padding)
 
         decoded = base64.urlsafe_b64decode(payload)
         token_data = json.loads(decoded)
@@ -138,10 +222,25 @@ def _load_token_file(token_file_path: Path) -> dict[str, Any]:
         sys.exit(1)
 
 
-def _make_api_request(
+def _create_client(base_url: str) -> httpx.AsyncClient:
+    """
+    Create the HTTP client shared by all tests in a run.
+
+    Args:
+        base_url: Base URL for the API
+
+    Returns:
+        Async HTTP client with pooled keep-alive connections
+    """
+    return httpx.AsyncClient(
+        base_url=base_url, headers=_CLIENT_HEADERS, timeout=10.0, limits=_CLIENT_LIMITS
+    )
+
+
+async def _make_api_request(
     endpoint: str,
-    access_token: str,
-    base_url: str,
+    headers: dict[str, str],
+    client: httpx.AsyncClient,
     method: str = "GET",
     params: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
@@ -150,35 +249,52 @@ def _make_api_request(
 
     Args:
         endpoint: API endpoint
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
         method: HTTP method
         params: Query parameters
 
     Returns:
         Response JSON or None if request fails
     """
-    url = f"{base_url}{endpoint}"
-    headers = {"X-Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+    cache_key = (method, endpoint, tuple(sorted(params.items())) if params else ())
+    cached = _ETAG_CACHE.get(cache_key) if _ETAG_CACHE is not None else None
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
 
     try:
-        logger.debug(f"Making {method} request to: {url}")
-        response = requests.request(
-            method=method, url=url, headers=headers, params=params, timeout=10
-        )
+        logger.debug(f"Making {method} request to: {client.base_url}{endpoint}")
+        response = await client.request(method, endpoint, headers=headers, params=params)
 
         if response.status_code == 401:
             logger.warning("Received 401 Unauthorized")
             return None
 
+        if response.status_code == 304 and cached:
+            logger.debug(f"Not modified, reusing cached response for: {endpoint}")
+            return cached[1]
+
         response.raise_for_status()
-        return response.json()
+        data = orjson.loads(response.content)
+
+        etag = response.headers.get("ETag")
+        if etag and _ETAG_CACHE is not None:
+            _ETAG_CACHE[cache_key] = (etag, data)
+
+        return data
+
+    except orjson.JSONDecodeError as e:
+        logger.debug(f"Failed to decode response body: {e}")
+        return None
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPStatusError as e:
+        logger.debug(f"API request failed: {e}")
+        logger.debug(f"Response status: {e.response.status_code}")
+        logger.debug(f"Response body: {e.response.text}")
+        return None
+
+    except httpx.HTTPError as e:
         logger.debug(f"API request failed: {e}")
-        if hasattr(e, "response") and e.response is not None:
-            logger.debug(f"Response status: {e.response.status_code}")
-            logger.debug(f"Response body: {e.response.text}")
         return None
 
 
@@ -193,9 +309,10 @@ def _format_json_output(data: Any, verbose: bool = False) -> str:
     Returns:
         Formatted JSON string
     """
-    if verbose:
-        return json.dumps(data, indent=2)
-    return json.dumps(data, indent=2)[:200] + ("..." if len(json.dumps(data)) > 200 else "")
+    formatted = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if verbose or len(formatted) <= 200:
+        return formatted.decode()
+    return formatted[:200].decode(errors="ignore") + "..."
 
 
 def _print_test_result(result: TestResult, verbose: bool = False) -> None:
@@ -221,27 +338,26 @@ def _print_test_result(result: TestResult, verbose: bool = False) -> None:
     print()
 
 
-def _test_list_agents(access_token: str, base_url: str, limit: int = 10) -> TestResult:
+async def _test_list_agents(
+    headers: dict[str, str], client: httpx.AsyncClient, limit: int = 10
+) -> TestResult:
     """
     Test listing agents endpoint.
 
     Args:
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
         limit: Number of agents to list
 
     Returns:
         Test result object
     """
     result = TestResult("list-agents")
-    start_time = time.time()
 
-    endpoint = f"/{AGENTS_API_VERSION}/agents"
-    response = _make_api_request(
-        endpoint=endpoint, access_token=access_token, base_url=base_url, params={"limit": limit}
-    )
-
-    result.duration_ms = int((time.time() - start_time) * 1000)
+    with _timed(result):
+        response = await _make_api_request(
+            endpoint=_agents_base(), headers=headers, client=client, params={"limit": limit}
+        )
 
     if response:
         result.response = response
@@ -257,27 +373,26 @@ def _test_list_agents(access_token: str, base_url: str, limit: int = 10) -> Test
     return result
 
 
-def _test_list_agents_paginated(access_token: str, base_url: str, limit: int = 3) -> TestResult:
+async def _test_list_agents_paginated(
+    headers: dict[str, str], client: httpx.AsyncClient, limit: int = 3
+) -> TestResult:
     """
     Test pagination endpoint.
 
     Args:
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
         limit: Number of agents per page
 
     Returns:
         Test result object
     """
     result = TestResult("list-agents-paginated")
-    start_time = time.time()
 
-    endpoint = f"/{AGENTS_API_VERSION}/agents"
-    response = _make_api_request(
-        endpoint=endpoint, access_token=access_token, base_url=base_url, params={"limit": limit}
-    )
-
-    result.duration_ms = int((time.time() - start_time) * 1000)
+    with _timed(result):
+        response = await _make_api_request(
+            endpoint=_agents_base(), headers=headers, client=client, params={"limit": limit}
+        )
 
     if response:
         result.response = response
@@ -293,26 +408,26 @@ def _test_list_agents_paginated(access_token: str, base_url: str, limit: int = 3
     return result
 
 
-def _test_get_agent(access_token: str, base_url: str, agent_name: str) -> TestResult:
+async def _test_get_agent(
+    headers: dict[str, str], client: httpx.AsyncClient, agent_name: str
+) -> TestResult:
     """
     Test getting specific agent endpoint.
 
     Args:
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
         agent_name: Agent name (URL-encoded or plain)
 
     Returns:
         Test result object
     """
     result = TestResult(f"get-agent ({agent_name})")
-    start_time = time.time()
-
-    encoded_name = quote(agent_name, safe="")
-    endpoint = f"/{AGENTS_API_VERSION}/agents/{encoded_name}"
-    response = _make_api_request(endpoint=endpoint, access_token=access_token, base_url=base_url)
 
-    result.duration_ms = int((time.time() - start_time) * 1000)
+    encoded_name = _quote_name(agent_name)
+    endpoint = f"{_agents_base()}/{encoded_name}"
+    with _timed(result):
+        response = await _make_api_request(endpoint=endpoint, headers=headers, client=client)
 
     if response:
         result.response = response
@@ -329,26 +444,26 @@ def _test_get_agent(access_token: str, base_url: str, agent_name: str) -> TestRe
     return result
 
 
-def _test_get_agent_versions(access_token: str, base_url: str, agent_name: str) -> TestResult:
+async def _test_get_agent_versions(
+    headers: dict[str, str], client: httpx.AsyncClient, agent_name: str
+) -> TestResult:
     """
     Test getting agent versions endpoint.
 
     Args:
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
         agent_name: Agent name (URL-encoded or plain)
 
     Returns:
         Test result object
     """
     result = TestResult(f"get-agent-versions ({agent_name})")
-    start_time = time.time()
-
-    encoded_name = quote(agent_name, safe="")
-    endpoint = f"/{AGENTS_API_VERSION}/agents/{encoded_name}/versions"
-    response = _make_api_request(endpoint=endpoint, access_token=access_token, base_url=base_url)
 
-    result.duration_ms = int((time.time() - start_time) * 1000)
+    encoded_name = _quote_name(agent_name)
+    endpoint = f"{_agents_base()}/{encoded_name}/versions"
+    with _timed(result):
+        response = await _make_api_request(endpoint=endpoint, headers=headers, client=client)
 
     if response:
         result.response = response
@@ -361,54 +476,54 @@ def _test_get_agent_versions(access_token: str, base_url: str, agent_name: str)
     return result
 
 
-def _test_pagination_flow(access_token: str, base_url: str) -> TestResult:
+async def _test_pagination_flow(headers: dict[str, str], client: httpx.AsyncClient) -> TestResult:
     """
     Test full pagination flow through pages.
 
     Args:
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
 
     Returns:
         Test result object
     """
     result = TestResult("pagination-flow")
-    start_time = time.time()
 
-    endpoint = f"/{AGENTS_API_VERSION}/agents"
-    all_agents = []
+    preview: list[Any] = []
+    total_collected = 0
     cursor = None
     page_count = 0
     max_pages = 5
 
     try:
-        while page_count < max_pages:
-            params = {"limit": 3}
-            if cursor:
-                params["cursor"] = cursor
-
-            response = _make_api_request(
-                endpoint=endpoint, access_token=access_token, base_url=base_url, params=params
-            )
-
-            if not response:
-                result.error = "Failed to fetch page"
-                break
-
-            agents = response.get("agents", [])
-            all_agents.extend(agents)
-            page_count += 1
-
-            cursor = response.get("metadata", {}).get("nextCursor")
-            if not cursor:
-                break
-
-        result.duration_ms = int((time.time() - start_time) * 1000)
-
-        if all_agents:
-            result.response = {"agents": all_agents[:3], "total_collected": len(all_agents)}
+        with _timed(result):
+            while page_count < max_pages:
+                params = {"limit": 3}
+                if cursor:
+                    params["cursor"] = cursor
+
+                response = await _make_api_request(
+                    endpoint=_agents_base(), headers=headers, client=client, params=params
+                )
+
+                if not response:
+                    result.error = "Failed to fetch page"
+                    break
+
+                agents = response.get("agents", [])
+                total_collected += len(agents)
+                if len(preview) < 3:
+                    preview.extend(agents[: 3 - len(preview)])
+                page_count += 1
+
+                cursor = response.get("metadata", {}).get("nextCursor")
+                if not cursor:
+                    break
+
+        if total_collected:
+            result.response = {"agents": preview, "total_collected": total_collected}
             result.passed = True
-            result.message = f"Collected {len(all_agents)} agents across {page_count} pages"
+            result.message = f"Collected {total_collected} agents across {page_count} pages"
         else:
             result.error = "No agents found"
 
@@ -418,126 +533,118 @@ def _test_pagination_flow(access_token: str, base_url: str) -> TestResult:
     return result
 
 
-def _test_error_invalid_token(base_url: str) -> TestResult:
+async def _test_error_invalid_token(client: httpx.AsyncClient) -> TestResult:
     """
     Test error handling with invalid token.
 
     Args:
-        base_url: Base URL for the API
+        client: HTTP client bound to the API base URL
 
     Returns:
         Test result object
     """
     result = TestResult("error-invalid-token")
-    start_time = time.time()
-
-    endpoint = f"/{AGENTS_API_VERSION}/agents"
-    url = f"{base_url}{endpoint}"
-    headers = {"X-Authorization": "Bearer invalid_token_here", "Content-Type": "application/json"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        result.duration_ms = int((time.time() - start_time) * 1000)
+        with _timed(result):
+            response = await client.get(_agents_base(), headers=_INVALID_TOKEN_HEADERS)
 
         if response.status_code == 401:
             result.passed = True
             result.message = "Correctly returned 401 Unauthorized"
-            result.response = response.json() if response.text else {}
+            result.response = orjson.loads(response.content) if response.content else {}
         else:
             result.error = f"Expected 401, got {response.status_code}"
 
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         result.error = str(e)
 
     return result
 
 
-def _test_error_missing_agent(access_token: str, base_url: str) -> TestResult:
+async def _test_error_missing_agent(
+    headers: dict[str, str], client: httpx.AsyncClient
+) -> TestResult:
     """
     Test error handling with non-existent agent.
 
     Args:
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
 
     Returns:
         Test result object
     """
     result = TestResult("error-missing-agent")
-    start_time = time.time()
-
-    endpoint = f"/{AGENTS_API_VERSION}/agents/non-existent-agent-xyz-123"
-    url = f"{base_url}{endpoint}"
-    headers = {"X-Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        result.duration_ms = int((time.time() - start_time) * 1000)
+        with _timed(result):
+            response = await client.get(
+                f"{_agents_base()}/non-existent-agent-xyz-123", headers=headers
+            )
 
         if response.status_code == 404:
             result.passed = True
             result.message = "Correctly returned 404 Not Found"
-            result.response = response.json() if response.text else {}
+            result.response = orjson.loads(response.content) if response.content else {}
         else:
             result.error = f"Expected 404, got {response.status_code}"
 
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         result.error = str(e)
 
     return result
 
 
-def _run_all_tests(
-    access_token: str, base_url: str, agent_name: str | None = None, verbose: bool = False
+async def _run_all_tests(
+    headers: dict[str, str],
+    client: httpx.AsyncClient,
+    agent_name: str | None = None,
+    verbose: bool = False,
+    serial: bool = False,
 ) -> list[TestResult]:
     """
     Run all API tests.
 
+    Tests run concurrently over the shared client unless serial is set, in which
+    case they run one at a time with a short pause between them.
+
     Args:
-        access_token: JWT access token
-        base_url: Base URL for the API
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
         agent_name: Optional agent name for specific tests
         verbose: Show verbose output
+        serial: Run tests one at a time instead of concurrently
 
     Returns:
         List of test results
     """
     logger.info("Running all API tests...")
-    results = []
-
-    results.append(_test_list_agents(access_token, base_url, limit=10))
-    _print_test_result(results[-1], verbose)
-
-    time.sleep(0.5)
-
-    results.append(_test_list_agents_paginated(access_token, base_url, limit=3))
-    _print_test_result(results[-1], verbose)
-
-    time.sleep(0.5)
-
-    results.append(_test_pagination_flow(access_token, base_url))
-    _print_test_result(results[-1], verbose)
-
-    time.sleep(0.5)
+    tests = [
+        _test_list_agents(headers, client, limit=10),
+        _test_list_agents_paginated(headers, client, limit=3),
+        _test_pagination_flow(headers, client),
+    ]
 
     if agent_name:
-        results.append(_test_get_agent(access_token, base_url, agent_name))
-        _print_test_result(results[-1], verbose)
-
-        time.sleep(0.5)
-
-        results.append(_test_get_agent_versions(access_token, base_url, agent_name))
-        _print_test_result(results[-1], verbose)
-
-        time.sleep(0.5)
-
-    results.append(_test_error_invalid_token(base_url))
-    _print_test_result(results[-1], verbose)
-
-    time.sleep(0.5)
-
-    results.append(_test_error_missing_agent(access_token, base_url))
-    _print_test_result(results[-1], verbose)
+        tests.append(_test_get_agent(headers, client, agent_name))
+        tests.append(_test_get_agent_versions(headers, client, agent_name))
+
+    tests.append(_test_error_invalid_token(client))
+    tests.append(_test_error_missing_agent(headers, client))
+
+    if serial:
+        results = []
+        for index, test in enumerate(tests):
+            if index:
+                await asyncio.sleep(0.5)
+            results.append(await test)
+            _print_test_result(results[-1], verbose)
+        return results
+
+    results = list(await asyncio.gather(*tests))
+    for result in results:
+        _print_test_result(result, verbose)
 
     return results
 
@@ -561,15 +668,15 @@ def _print_summary(results: list[TestResult]) -> None:
         print(f"  {result.test_name:<40} {status_str:<8} {result.duration_ms}ms")
 
 
-def _parse_arguments() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser.
 
     Returns:
-        Parsed arguments
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
-        description=f"Test A2A Agents API {AGENTS_API_VERSION}",
+        description="Test A2A Agents API endpoints",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -623,78 +730,117 @@ token lifetime in Keycloak: Realm Settings → Tokens → Access Token Lifespan
         "--verbose", action="store_true", help="Show detailed output including full responses"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-fetch responses instead of sending If-None-Match with cached ETags",
+    )
+
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run tests one at a time instead of concurrently (useful when debugging)",
+    )
+
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
-    return parser.parse_args()
+    return parser
+
+
+def _parse_arguments() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER.parse_args()
+
 
+async def _run_single_test(
+    test_name: str,
+    headers: dict[str, str],
+    client: httpx.AsyncClient,
+    agent_name: str | None,
+) -> TestResult:
+    """
+    Run one named test.
 
-def _execute_test(
-    test_name: str, access_token: str, base_url: str, agent_name: str | None, verbose: bool
+    Args:
+        test_name: Name of test to run
+        headers: Request headers including the authorization header
+        client: HTTP client bound to the API base URL
+        agent_name: Optional agent name
+
+    Returns:
+        Test result object
+    """
+    if test_name in ("get-agent", "get-agent-versions") and not agent_name:
+        logger.error(f"--agent-name required for {test_name} test")
+        sys.exit(1)
+
+    if test_name == "list-agents":
+        return await _test_list_agents(headers, client)
+    if test_name == "list-agents-paginated":
+        return await _test_list_agents_paginated(headers, client)
+    if test_name == "get-agent":
+        return await _test_get_agent(headers, client, agent_name)
+    if test_name == "get-agent-versions":
+        return await _test_get_agent_versions(headers, client, agent_name)
+    if test_name == "pagination-flow":
+        return await _test_pagination_flow(headers, client)
+    if test_name == "error-invalid-token":
+        return await _test_error_invalid_token(client)
+    return await _test_error_missing_agent(headers, client)
+
+
+async def _execute_test(
+    test_name: str,
+    headers: dict[str, str],
+    base_url: str,
+    agent_name: str | None,
+    verbose: bool,
+    serial: bool = False,
 ) -> list[TestResult]:
     """
     Execute a single test based on test name.
 
     Args:
         test_name: Name of test to execute
-        access_token: JWT access token
+        headers: Request headers including the authorization header
         base_url: Base URL for API
         agent_name: Optional agent name
         verbose: Verbose output flag
+        serial: Run tests one at a time instead of concurrently
 
     Returns:
         List of test results
     """
-    results = []
+    async with _create_client(base_url) as client:
+        if test_name == "all":
+            return await _run_all_tests(headers, client, agent_name, verbose, serial)
+        result = await _run_single_test(test_name, headers, client, agent_name)
 
-    if test_name == "all":
-        results = _run_all_tests(access_token, base_url, agent_name, verbose)
-    elif test_name == "list-agents":
-        result = _test_list_agents(access_token, base_url)
-        results.append(result)
-        _print_test_result(result, verbose)
-    elif test_name == "list-agents-paginated":
-        result = _test_list_agents_paginated(access_token, base_url)
-        results.append(result)
-        _print_test_result(result, verbose)
-    elif test_name == "get-agent":
-        if not agent_name:
-            logger.error("--agent-name required for get-agent test")
-            sys.exit(1)
-        result = _test_get_agent(access_token, base_url, agent_name)
-        results.append(result)
-        _print_test_result(result, verbose)
-    elif test_name == "get-agent-versions":
-        if not agent_name:
-            logger.error("--agent-name required for get-agent-versions test")
-            sys.exit(1)
-        result = _test_get_agent_versions(access_token, base_url, agent_name)
-        results.append(result)
-        _print_test_result(result, verbose)
-    elif test_name == "pagination-flow":
-        result = _test_pagination_flow(access_token, base_url)
-        results.append(result)
-        _print_test_result(result, verbose)
-    elif test_name == "error-invalid-token":
-        result = _test_error_invalid_token(base_url)
-        results.append(result)
-        _print_test_result(result, verbose)
-    elif test_name == "error-missing-agent":
-        result = _test_error_missing_agent(access_token, base_url)
-        results.append(result)
-        _print_test_result(result, verbose)
-
-    return results
+    _print_test_result(result, verbose)
+    return [result]
 
 
 def main():
     """Main entry point."""
+    global _ETAG_CACHE
     args = _parse_arguments()
 
+    if args.no_cache:
+        _ETAG_CACHE = None
+
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
     logger.info("=" * 80)
-    logger.info(f"A2A Agents API {AGENTS_API_VERSION} Test Tool")
+    logger.info(f"A2A Agents API {_agents_api_version()} Test Tool")
     logger.info("=" * 80)
 
     token_file_path = Path(args.token_file)
@@ -719,7 +865,10 @@ def main():
 
     _check_token_expiration(access_token)
 
-    results = _execute_test(args.test, access_token, args.base_url, args.agent_name, args.verbose)
+    headers = {"X-Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+    results = asyncio.run(
+        _execute_test(args.test, headers, args.base_url, args.agent_name, args.verbose, args.serial)
+    )
 
     if results:
         _print_summary(results)
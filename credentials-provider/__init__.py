@@ -13,43 +13,46 @@ Submodules:
 - agentcore-auth: AgentCore Gateway authentication
 """
 
-from .constants import (
-    DEFAULT_COGNITO_TOKEN_EXPIRY,
-    DEFAULT_ENTRA_TOKEN_EXPIRY,
-    DEFAULT_KEYCLOAK_TOKEN_EXPIRY,
-    DEFAULT_REDIRECT_PORT,
-    LOGGING_FORMAT,
-    TOKEN_EXPIRY_MARGIN,
-)
-from .exceptions import (
-    ConfigurationError,
-    CredentialsProviderError,
-    TokenExpiredError,
-    TokenRequestError,
-)
-from .utils import (
-    generate_api_key,
-    generate_request_id,
-    redact_sensitive_value,
-    setup_logging,
-)
-
-__all__ = [
-    # Constants
-    "DEFAULT_COGNITO_TOKEN_EXPIRY",
-    "DEFAULT_ENTRA_TOKEN_EXPIRY",
-    "DEFAULT_KEYCLOAK_TOKEN_EXPIRY",
-    "DEFAULT_REDIRECT_PORT",
-    "LOGGING_FORMAT",
-    "TOKEN_EXPIRY_MARGIN",
-    # Exceptions
-    "ConfigurationError",
-    "CredentialsProviderError",
-    "TokenExpiredError",
-    "TokenRequestError",
-    # Utilities
-    "generate_api_key",
-    "generate_request_id",
-    "redact_sensitive_value",
-    "setup_logging",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .constants import *  # noqa: F403
+    from .exceptions import *  # noqa: F403
+    from .utils import *  # noqa: F403
+
+# Each submodule's __all__ defines its public names; the package re-exports their
+# union. Names are resolved on first access (PEP 562) so importing the package does
+# not load utils/logging for callers that only need a constant.
+_SUBMODULES: tuple[str, ...] = (".constants", ".exceptions", ".utils")
+
+
+def _public_names() -> list[str]:
+    """Return the union of the submodules' __all__ lists."""
+    return [
+        name
+        for module_name in _SUBMODULES
+        for name in importlib.import_module(module_name, __name__).__all__
+    ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name (or __all__) from its submodule and cache it on the package."""
+    if name == "__all__":
+        value: Any = _public_names()
+    else:
+        for module_name in _SUBMODULES:
+            module = importlib.import_module(module_name, __name__)
+            if name in module.__all__:
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(_public_names()))
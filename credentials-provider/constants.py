@@ -1,26 +1,48 @@
 """Constants for credentials-provider package."""
 
+from typing import Final
+
+__all__ = [
+    "DEFAULT_AGENTCORE_TOKEN_EXPIRY",
+    "DEFAULT_CALLBACK_TIMEOUT",
+    "DEFAULT_COGNITO_TOKEN_EXPIRY",
+    "DEFAULT_ENTRA_TOKEN_EXPIRY",
+    "DEFAULT_KEYCLOAK_SCOPES",
+    "DEFAULT_KEYCLOAK_TOKEN_EXPIRY",
+    "DEFAULT_REDIRECT_PORT",
+    "ENTRA_LOGIN_BASE_URL",
+    "HTTP_REQUEST_TIMEOUT",
+    "KEYCLOAK_REFRESH_AT",
+    "LOGGING_FORMAT",
+    "TOKEN_EXPIRY_MARGIN",
+]
+
 # Token expiry defaults (in seconds)
-DEFAULT_COGNITO_TOKEN_EXPIRY: int = 10800  # 3 hours
-DEFAULT_ENTRA_TOKEN_EXPIRY: int = 3599  # ~1 hour (Entra default)
-DEFAULT_KEYCLOAK_TOKEN_EXPIRY: int = 300  # 5 minutes (Keycloak default)
-DEFAULT_AGENTCORE_TOKEN_EXPIRY: int = 10800  # 3 hours
+DEFAULT_COGNITO_TOKEN_EXPIRY: Final[int] = 10800  # 3 hours
+DEFAULT_ENTRA_TOKEN_EXPIRY: Final[int] = 3599  # ~1 hour (Entra default)
+DEFAULT_KEYCLOAK_TOKEN_EXPIRY: Final[int] = 300  # 5 minutes (Keycloak default)
+DEFAULT_AGENTCORE_TOKEN_EXPIRY: Final[int] = 10800  # 3 hours
 
 # Token refresh margin (refresh token before expiry)
-TOKEN_EXPIRY_MARGIN: int = 300  # 5 minutes
+TOKEN_EXPIRY_MARGIN: Final[int] = 300  # 5 minutes
+
+# Seconds after issue at which a default-lifetime Keycloak token is due for refresh
+KEYCLOAK_REFRESH_AT: Final[int] = DEFAULT_KEYCLOAK_TOKEN_EXPIRY - TOKEN_EXPIRY_MARGIN
 
 # OAuth callback server
-DEFAULT_REDIRECT_PORT: int = 8080
-DEFAULT_CALLBACK_TIMEOUT: int = 300  # 5 minutes
+DEFAULT_REDIRECT_PORT: Final[int] = 8080
+DEFAULT_CALLBACK_TIMEOUT: Final[int] = 300  # 5 minutes
 
 # HTTP request timeout
-HTTP_REQUEST_TIMEOUT: int = 30  # seconds
+HTTP_REQUEST_TIMEOUT: Final[int] = 30  # seconds
 
 # Logging format (consistent across all modules)
-LOGGING_FORMAT: str = "%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s"
+LOGGING_FORMAT: Final[str] = (
+    "%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s"
+)
 
 # OAuth endpoints
-ENTRA_LOGIN_BASE_URL: str = "https://login.microsoftonline.com"
+ENTRA_LOGIN_BASE_URL: Final[str] = "https://login.microsoftonline.com"
 
 # Default scopes
-DEFAULT_KEYCLOAK_SCOPES: str = "openid email profile"
+DEFAULT_KEYCLOAK_SCOPES: Final[str] = "openid email profile"
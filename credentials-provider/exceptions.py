@@ -1,5 +1,14 @@
 """Custom exceptions for credentials-provider package."""
 
+__all__ = [
+    "CallbackError",
+    "ConfigurationError",
+    "CredentialsProviderError",
+    "ProviderNotSupportedError",
+    "TokenExpiredError",
+    "TokenRequestError",
+]
+
 
 class CredentialsProviderError(Exception):
     """Base exception for credentials-provider package."""
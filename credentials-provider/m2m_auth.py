@@ -4,11 +4,17 @@ This module provides a unified interface for M2M authentication across
 different OAuth providers (Cognito, Keycloak, Entra ID).
 """
 
+from __future__ import annotations
+
+import hashlib
 import logging
+import threading
 import time
-from typing import Any
+from enum import IntEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import requests
+import orjson
 
 from .constants import (
     DEFAULT_COGNITO_TOKEN_EXPIRY,
@@ -18,36 +24,315 @@ from .constants import (
 )
 from .exceptions import TokenRequestError
 
+if TYPE_CHECKING:
+    # httpx (and its certifi/httpcore imports) is loaded on the first token request
+    # so that importing this module for build_token_result or the URL helpers stays cheap
+    import httpx
+
 __all__ = [
+    "Provider",
     "build_token_result",
+    "invalidate_m2m_token",
     "perform_m2m_authentication",
 ]
 
 logger = logging.getLogger(__name__)
 
 
-def perform_m2m_authentication(
+class Provider(IntEnum):
+    """OAuth providers with known default token lifetimes."""
+
+    OTHER = 0
+    COGNITO = 1
+    KEYCLOAK = 2
+    ENTRA = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase provider name used in logs and token results."""
+        return self.name.lower()
+
+
+# Default token lifetime by provider; Provider.OTHER falls back to _FALLBACK_TOKEN_EXPIRY
+_PROVIDER_EXPIRY: dict[Provider, int] = {
+    Provider.COGNITO: DEFAULT_COGNITO_TOKEN_EXPIRY,
+    Provider.KEYCLOAK: DEFAULT_KEYCLOAK_TOKEN_EXPIRY,
+    Provider.ENTRA: DEFAULT_ENTRA_TOKEN_EXPIRY,
+}
+_FALLBACK_TOKEN_EXPIRY: int = 3600  # 1 hour
+
+_TOKEN_REQUEST_HEADERS: dict[str, str] = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "application/json",
+}
+
+# Connection pool shared by all token requests; transient gateway errors are retried
+_MAX_CONNECTIONS: int = 32
+_MAX_KEEPALIVE_CONNECTIONS: int = 16
+_RETRY_STATUS_CODES: frozenset[int] = frozenset({502, 503, 504})
+_MAX_RETRIES: int = 2
+_RETRY_BACKOFF_FACTOR: float = 0.2  # seconds, doubled on each retry
+
+# Longest slice of a non-JSON error body included in error messages
+_ERROR_BODY_MAX_BYTES: int = 512
+
+
+@lru_cache(maxsize=32)
+def _provider_from_name(
+    provider_name: str,
+) -> Provider:
+    """Map a free-form provider name to a Provider by case-insensitive substring."""
+    name = provider_name.lower()
+    return next(
+        (provider for provider in _PROVIDER_EXPIRY if provider.label in name),
+        Provider.OTHER,
+    )
+
+
+def _resolve_default_expiry(
+    provider: Provider | str,
+) -> int:
+    """Look up the default token expiry for a provider."""
+    if not isinstance(provider, Provider):
+        provider = _provider_from_name(provider)
+    return _PROVIDER_EXPIRY.get(provider, _FALLBACK_TOKEN_EXPIRY)
+
+
+def _create_http_client() -> httpx.Client:
+    """Create a pooled HTTP client for token requests.
+
+    Returns:
+        Client that keeps connections to token endpoints alive between calls
+        and retries failed connection attempts.
+    """
+    import httpx
+
+    return httpx.Client(
+        timeout=HTTP_REQUEST_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=_MAX_CONNECTIONS,
+            max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        transport=httpx.HTTPTransport(retries=_MAX_RETRIES),
+    )
+
+
+# Created on first use by _get_http_client
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared token request client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = _create_http_client()
+    return _http_client
+
+
+# Cached token results keyed by (token_url, client_id, secret digest, extra payload),
+# each stored with the time.monotonic() deadlines after which it must be re-fetched
+# and at which it expires. Monotonic time keeps wall-clock steps (NTP, VM resume)
+# from extending a token's life
+_TOKEN_CACHE_MAX_SAFETY_BUFFER: int = 300  # seconds
+_token_cache: dict[tuple[Any, ...], tuple[float, float, dict[str, Any]]] = {}
+_token_cache_lock = threading.RLock()
+
+
+def _token_cache_key(
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    additional_payload: dict[str, Any] | None,
+) -> tuple[Any, ...]:
+    """Build the token cache key for a client credentials request.
+
+    The client secret is stored only as a SHA-256 digest so the raw secret
+    is never kept in the cache.
+    """
+    secret_digest = hashlib.sha256(client_secret.encode()).hexdigest()
+    extra = tuple(sorted((additional_payload or {}).items()))
+    return (token_url, client_id, secret_digest, extra)
+
+
+def _get_cached_token(
+    key: tuple[Any, ...],
+) -> dict[str, Any] | None:
+    """Return a copy of a cached token result if it is still fresh.
+
+    The copy's expires_in is the token's remaining lifetime, not the lifetime
+    reported when it was issued.
+    """
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+
+        refresh_at, expires_at, result = entry
+        now = time.monotonic()
+        if now < refresh_at:
+            return {**result, "expires_in": int(expires_at - now)}
+
+        del _token_cache[key]
+        return None
+
+
+def _store_cached_token(
+    key: tuple[Any, ...],
+    result: dict[str, Any],
+) -> None:
+    """Cache a token result until shortly before it expires."""
+    expires_in = result["expires_in"]
+    safety_buffer = min(_TOKEN_CACHE_MAX_SAFETY_BUFFER, expires_in * 0.1)
+    expires_at = time.monotonic() + expires_in
+    with _token_cache_lock:
+        _token_cache[key] = (expires_at - safety_buffer, expires_at, dict(result))
+
+
+def _build_token_payload(
     token_url: str,
     client_id: str,
     client_secret: str,
+    additional_payload: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the client credentials form payload and log the outgoing request."""
+    payload = {
+        "grant_type": "client_credentials",
+        "client_id": client_id,
+        "client_secret": client_secret,
+    }
+
+    if additional_payload:
+        payload.update(additional_payload)
+
+    logger.info(f"Requesting M2M token from {token_url}")
+    logger.debug(f"Using client_id: {client_id[:10]}..." if client_id else "No client_id")
+    return payload
+
+
+def _post_token_request(
+    client: httpx.Client,
+    token_url: str,
+    payload: dict[str, Any],
+    timeout: int,
+) -> httpx.Response:
+    """POST a token request, retrying transient gateway errors with backoff."""
+    for attempt in range(_MAX_RETRIES + 1):
+        response = client.post(
+            token_url,
+            data=payload,
+            headers=_TOKEN_REQUEST_HEADERS,
+            timeout=timeout,
+        )
+        if response.status_code not in _RETRY_STATUS_CODES or attempt == _MAX_RETRIES:
+            return response
+        time.sleep(_RETRY_BACKOFF_FACTOR * 2**attempt)
+    return response
+
+
+def _process_token_response(
+    response: httpx.Response,
     provider_name: str,
+    default_expiry: int,
+) -> dict[str, Any]:
+    """Validate a token endpoint response and build the standardized result.
+
+    Raises:
+        TokenRequestError: If the response is an error or lacks an access token.
+    """
+    raw = response.content
+
+    if not response.is_success:
+        error_msg = f"Token request failed with status {response.status_code}"
+        error_snippet = raw[:_ERROR_BODY_MAX_BYTES].decode("utf-8", "replace")
+        try:
+            error_data = orjson.loads(raw)
+            error_detail = error_data.get(
+                "error_description",
+                error_data.get("error", error_snippet),
+            )
+            error_msg = f"{error_msg}: {error_detail}"
+        except Exception:
+            error_msg = f"{error_msg}: {error_snippet}"
+
+        logger.error(error_msg)
+        raise TokenRequestError(error_msg)
+
+    try:
+        token_data = orjson.loads(raw)
+    except ValueError as e:
+        error_msg = f"Invalid JSON in token response: {e}"
+        logger.error(error_msg)
+        raise TokenRequestError(error_msg) from e
+
+    if "access_token" not in token_data:
+        error_msg = f"Access token not found in response. Keys: {list(token_data.keys())}"
+        logger.error(error_msg)
+        raise TokenRequestError(error_msg)
+
+    # Build standardized result
+    result = build_token_result(
+        token_data=token_data,
+        provider_name=provider_name,
+        default_expiry=default_expiry,
+    )
+
+    logger.info(f"M2M token obtained successfully from {provider_name}!")
+
+    if result.get("expires_at"):
+        expires_in = int(result["expires_at"] - time.time())
+        logger.info(f"Token expires in: {expires_in} seconds")
+
+    return result
+
+
+def invalidate_m2m_token(
+    client_id: str | None = None,
+) -> None:
+    """Drop cached M2M tokens so the next request fetches a new one.
+
+    Args:
+        client_id: Only drop tokens for this client. None drops every cached token.
+    """
+    with _token_cache_lock:
+        if client_id is None:
+            _token_cache.clear()
+            return
+
+        for key in [key for key in _token_cache if key[1] == client_id]:
+            del _token_cache[key]
+
+
+def perform_m2m_authentication(
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    provider_name: str | Provider,
     additional_payload: dict[str, Any] | None = None,
     default_expiry: int | None = None,
     timeout: int = HTTP_REQUEST_TIMEOUT,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Perform M2M (client credentials) OAuth 2.0 authentication.
 
     This is a generic function that works with Cognito, Keycloak, Entra ID,
     and other OAuth providers that support the client_credentials grant.
 
+    Tokens are cached in-process per (token_url, client_id, client_secret,
+    additional_payload) and reused until shortly before they expire.
+
     Args:
         token_url: The OAuth token endpoint URL.
         client_id: The OAuth client ID.
         client_secret: The OAuth client secret.
-        provider_name: Name of the provider (for logging and result metadata).
+        provider_name: Provider, or a provider name matched case-insensitively
+            against the known providers; also used for logging and result metadata.
         additional_payload: Additional fields to include in the token request.
         default_expiry: Default token expiry in seconds if not in response.
         timeout: HTTP request timeout in seconds.
+        use_cache: If False, always request a new token and skip the cache.
 
     Returns:
         Dictionary containing token data with standardized fields:
@@ -62,83 +347,35 @@ def perform_m2m_authentication(
     """
     # Determine default expiry based on provider if not specified
     if default_expiry is None:
-        if "cognito" in provider_name.lower():
-            default_expiry = DEFAULT_COGNITO_TOKEN_EXPIRY
-        elif "keycloak" in provider_name.lower():
-            default_expiry = DEFAULT_KEYCLOAK_TOKEN_EXPIRY
-        elif "entra" in provider_name.lower():
-            default_expiry = DEFAULT_ENTRA_TOKEN_EXPIRY
-        else:
-            default_expiry = 3600  # 1 hour fallback
-
-    # Build the token request payload
-    payload = {
-        "grant_type": "client_credentials",
-        "client_id": client_id,
-        "client_secret": client_secret,
-    }
+        default_expiry = _resolve_default_expiry(provider_name)
+    if isinstance(provider_name, Provider):
+        provider_name = provider_name.label
 
-    if additional_payload:
-        payload.update(additional_payload)
+    cache_key = _token_cache_key(token_url, client_id, client_secret, additional_payload)
+    if use_cache:
+        cached = _get_cached_token(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached M2M token for {provider_name}")
+            return cached
 
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Accept": "application/json",
-    }
+    import httpx
 
-    logger.info(f"Requesting M2M token from {token_url}")
-    logger.debug(f"Using client_id: {client_id[:10]}..." if client_id else "No client_id")
+    payload = _build_token_payload(token_url, client_id, client_secret, additional_payload)
 
     try:
-        response = requests.post(
-            token_url,
-            data=payload,
-            headers=headers,
-            timeout=timeout,
-        )
-
-        if not response.ok:
-            error_msg = f"Token request failed with status {response.status_code}"
-            try:
-                error_data = response.json()
-                error_detail = error_data.get(
-                    "error_description",
-                    error_data.get("error", response.text),
-                )
-                error_msg = f"{error_msg}: {error_detail}"
-            except Exception:
-                error_msg = f"{error_msg}: {response.text}"
-
-            logger.error(error_msg)
-            raise TokenRequestError(error_msg)
-
-        token_data = response.json()
-
-        if "access_token" not in token_data:
-            error_msg = f"Access token not found in response. Keys: {list(token_data.keys())}"
-            logger.error(error_msg)
-            raise TokenRequestError(error_msg)
-
-        # Build standardized result
-        result = build_token_result(
-            token_data=token_data,
-            provider_name=provider_name,
-            default_expiry=default_expiry,
-        )
-
-        logger.info(f"M2M token obtained successfully from {provider_name}!")
-
-        if result.get("expires_at"):
-            expires_in = int(result["expires_at"] - time.time())
-            logger.info(f"Token expires in: {expires_in} seconds")
-
-        return result
-
-    except requests.exceptions.RequestException as e:
+        response = _post_token_request(_get_http_client(), token_url, payload, timeout)
+    except httpx.HTTPError as e:
         error_msg = f"Network error during M2M token request: {e}"
         logger.error(error_msg)
         raise TokenRequestError(error_msg) from e
 
+    result = _process_token_response(response, provider_name, default_expiry)
+
+    if use_cache:
+        _store_cached_token(cache_key, result)
+
+    return result
+
 
 def build_token_result(
     token_data: dict[str, Any],
@@ -181,6 +418,7 @@ def build_token_result(
     return result
 
 
+@lru_cache(maxsize=64)
 def get_cognito_token_url(
     user_pool_id: str,
     region: str,
@@ -199,6 +437,7 @@ def get_cognito_token_url(
     return f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token"
 
 
+@lru_cache(maxsize=64)
 def get_keycloak_token_url(
     keycloak_url: str,
     realm: str,
@@ -215,6 +454,7 @@ def get_keycloak_token_url(
     return f"{keycloak_url}/realms/{realm}/protocol/openid-connect/token"
 
 
+@lru_cache(maxsize=64)
 def get_entra_token_url(
     tenant_id: str,
     login_base_url: str = "https://login.microsoftonline.com",
@@ -2,9 +2,11 @@
 
 This module provides a thread-safe container for OAuth callback state,
 replacing global mutable variables with a proper state management pattern.
+State is stored in a context variable, so it is isolated per thread and
+per asyncio task.
 """
 
-import threading
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -18,7 +20,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class CallbackState:
     """Thread-safe callback state container for OAuth flows.
 
@@ -71,28 +73,29 @@ class CallbackState:
         self.callback_received = True
 
 
-# Thread-local storage for callback state
-_callback_state_local = threading.local()
-
-# Lock for thread-safe access
-_state_lock = threading.Lock()
+# Context-local storage for callback state; each thread starts with an empty
+# context and each asyncio task sees the state of the context it was created in
+_callback_state_var: ContextVar[CallbackState | None] = ContextVar(
+    "callback_state",
+    default=None,
+)
 
 
 def get_callback_state() -> CallbackState:
-    """Get the callback state for the current thread.
+    """Get the callback state for the current thread or task.
 
     Returns:
-        The CallbackState instance for the current thread.
+        The CallbackState instance for the current context.
     """
-    if not hasattr(_callback_state_local, "state"):
-        with _state_lock:
-            if not hasattr(_callback_state_local, "state"):
-                _callback_state_local.state = CallbackState()
-    return _callback_state_local.state
+    state = _callback_state_var.get()
+    if state is None:
+        state = CallbackState()
+        _callback_state_var.set(state)
+    return state
 
 
 def reset_callback_state() -> None:
-    """Reset the callback state for the current thread."""
+    """Reset the callback state for the current thread or task."""
     state = get_callback_state()
     state.reset()
 
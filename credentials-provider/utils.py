@@ -1,11 +1,18 @@
 """Utility functions for credential providers."""
 
+import base64
 import logging
+import os
 import re
-import secrets
+import threading
 
 from .constants import LOGGING_FORMAT
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 __all__ = [
     "generate_api_key",
     "generate_request_id",
@@ -14,6 +21,61 @@ __all__ = [
     "setup_logging",
 ]
 
+# One pass per key, in this order. A single alternation would let one match
+# consume the next key (e.g. "token=abc;password=x") and leave its value exposed
+_CREDENTIAL_PATTERNS = tuple(
+    re.compile(rf'({key}["\s]*[:=]["\s]*)([^"\s]+)', re.IGNORECASE)
+    for key in ("access_token", "client_secret", "secret", "password", "token")
+)
+
+# Every key in _CREDENTIAL_PATTERNS contains one of these, so text without any of
+# them cannot match and skips the regex
+_CREDENTIAL_KEYWORDS = ("token", "secret", "password")
+
+# With the optional hyperscan package, a compiled DFA detects credential-bearing
+# text in one vectorized scan. It matches a keyword followed later by ":" or "=",
+# a superset of _CREDENTIAL_PATTERNS, and only decides whether to run the regex
+_CREDENTIAL_SCAN_EXPRESSION = rb"(token|secret|password)[^:=]*[:=]"
+_scan_scratch = threading.local()
+
+
+def _compile_credential_database() -> "hyperscan.Database | None":
+    """Compile the hyperscan credential database, or None without hyperscan."""
+    if hyperscan is None:
+        return None
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[_CREDENTIAL_SCAN_EXPRESSION],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH],
+    )
+    return database
+
+
+_CREDENTIAL_DATABASE = _compile_credential_database()
+
+
+def _may_contain_credentials(
+    text: str,
+) -> bool:
+    """Cheaply check whether text can contain a redactable credential."""
+    if _CREDENTIAL_DATABASE is None:
+        lowered = text.lower()
+        return any(keyword in lowered for keyword in _CREDENTIAL_KEYWORDS)
+
+    # Scratch space is per thread; a hyperscan scratch cannot be shared by concurrent scans
+    scratch = getattr(_scan_scratch, "scratch", None)
+    if scratch is None:
+        scratch = _scan_scratch.scratch = hyperscan.Scratch(_CREDENTIAL_DATABASE)
+
+    matches = []
+    _CREDENTIAL_DATABASE.scan(
+        text.encode(),
+        match_event_handler=lambda *args: matches.append(args),
+        scratch=scratch,
+    )
+    return bool(matches)
+
 
 def setup_logging(
     verbose: bool = False,
@@ -76,26 +138,15 @@ def redact_credentials_in_text(
     Returns:
         Text with credentials redacted.
     """
-    # Patterns to redact (case insensitive)
-    patterns = [
-        r'(access_token["\s]*[:=]["\s]*)([^"\s]+)',
-        r'(client_secret["\s]*[:=]["\s]*)([^"\s]+)',
-        r'(secret["\s]*[:=]["\s]*)([^"\s]+)',
-        r'(password["\s]*[:=]["\s]*)([^"\s]+)',
-        r'(token["\s]*[:=]["\s]*)([^"\s]+)',
-    ]
+    if not _may_contain_credentials(text):
+        return text
 
-    result = text
-    for pattern in patterns:
-
-        def replace_match(match: re.Match) -> str:
-            prefix = match.group(1)
-            value = match.group(2)
-            redacted = redact_sensitive_value(value, show_chars)
-            return f"{prefix}{redacted}"
-
-        result = re.sub(pattern, replace_match, result, flags=re.IGNORECASE)
+    def replace_match(match: re.Match) -> str:
+        return f"{match.group(1)}{redact_sensitive_value(match.group(2), show_chars)}"
 
+    result = text
+    for pattern in _CREDENTIAL_PATTERNS:
+        result = pattern.sub(replace_match, result)
     return result
 
 
@@ -105,7 +156,9 @@ def generate_api_key() -> str:
     Returns:
         A securely generated API key with mcp_creds_ prefix.
     """
-    return f"mcp_creds_{secrets.token_urlsafe(32)}"
+    # Same output as secrets.token_urlsafe(32), without the extra indirection
+    token = base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("ascii")
+    return f"mcp_creds_{token}"
 
 
 def generate_request_id() -> str:
@@ -114,4 +167,4 @@ def generate_request_id() -> str:
     Returns:
         A unique request ID with req_ prefix.
     """
-    return f"req_{secrets.token_hex(8)}"
+    return f"req_{os.urandom(8).hex()}"
@@ -39,6 +39,19 @@ EXTERNAL_DIRS = (
     ".scratchpad",
 )
 
+# Rough share of source links per directory in docs/; the regex tries directories
+# in descending order of this weight so common links match on the first alternatives
+_DIR_LINK_FREQUENCY = {
+    "registry": 40,
+    "auth_server": 18,
+    "agents": 7,
+    "credentials-provider": 4,
+    "terraform": 3,
+    "tests": 2,
+    "cli": 2,
+    "api": 2,
+}
+
 # Root-level files that should be transformed
 ROOT_FILES = (
     "README.md",
@@ -55,68 +68,72 @@ ROOT_FILES = (
 )
 
 
-def _build_file_pattern() -> re.Pattern:
-    """Build regex pattern to match relative links to external files."""
-    # Match href or src attributes with relative paths starting with ../
-    # that point to known external directories WITH a file path
-    dirs_pattern = "|".join(re.escape(d) for d in EXTERNAL_DIRS)
+def _build_link_pattern() -> re.Pattern:
+    """Build a single regex pattern matching every kind of external link."""
+    # Most linked first, then longest first so no directory is shadowed by a prefix
+    ordered_dirs = sorted(
+        EXTERNAL_DIRS,
+        key=lambda d: (-_DIR_LINK_FREQUENCY.get(d, 0), -len(d)),
+    )
+    dirs_pattern = "|".join(re.escape(d) for d in ordered_dirs)
+    files_pattern = "|".join(re.escape(f) for f in ROOT_FILES)
 
     # Pattern explanation:
-    # (href|src)="          - Match href or src attribute
-    # ((?:\.\./){1,})       - Match one or more ../ sequences
-    # (dir1|dir2|...)       - Match known external directories
-    # /([^"]+)              - Match the rest of the path (file)
-    # "                     - Closing quote
-    pattern = rf'(href|src)="((?:\.\./){{1,}})({dirs_pattern})/([^"]+)"'
-
-    return re.compile(pattern, re.IGNORECASE)
-
-
-def _build_dir_pattern() -> re.Pattern:
-    """Build regex pattern to match relative links to external directories only."""
-    dirs_pattern = "|".join(re.escape(d) for d in EXTERNAL_DIRS)
-
-    # Match directory-only links like ../auth_server/ or ../agents/
-    pattern = rf'(href|src)="((?:\.\./){{1,}})({dirs_pattern})/?\"'
+    # (?P<attr>href|src)="                       - Match href or src attribute
+    # (?:\.\./)+(?P<file_dir>dirs)/(?P<file_path>[^"]+)
+    #                                            - File inside a known external directory
+    # |(?:\.\./)+(?P<dir>dirs)/?                 - Directory-only link like ../auth_server/
+    # |\.\./(?P<root_file>files(?:#[^"]*)?)      - Root-level file, optionally with an anchor
+    # "                                          - Closing quote
+    #
+    # Alternatives are tried in that order at each position, matching the order
+    # the separate file, directory and root-file passes used to run in.
+    pattern = (
+        r'(?P<attr>href|src)="(?:'
+        rf'(?:\.\./)+(?P<file_dir>{dirs_pattern})/(?P<file_path>[^"]+)'
+        rf"|(?:\.\./)+(?P<dir>{dirs_pattern})/?"
+        rf'|\.\./(?P<root_file>(?:{files_pattern})(?:#[^"]*)?)'
+        r')"'
+    )
 
     return re.compile(pattern, re.IGNORECASE)
 
 
-def _build_root_file_pattern() -> re.Pattern:
-    """Build regex pattern to match relative links to root-level files."""
-    files_pattern = "|".join(re.escape(f) for f in ROOT_FILES)
+# Compile pattern once at module load
+EXTERNAL_LINK_PATTERN = _build_link_pattern()
 
-    # Match root file links like ../README.md or ../CLAUDE.md
-    # Also handle anchors like ../README.md#section
-    pattern = rf'(href|src)="\.\./(({files_pattern})(?:#[^"]*)?)"'
-
-    return re.compile(pattern, re.IGNORECASE)
+# Always use 'main' as the default branch
+# MkDocs may auto-generate edit_uri with 'master' but most repos now use 'main'
+DEFAULT_BRANCH = "main"
 
+# GitHub URL prefixes for the current build, set once per build in on_config
+_blob_base: str | None = None
+_tree_base: str | None = None
 
-# Compile patterns once at module load
-EXTERNAL_FILE_PATTERN = _build_file_pattern()
-EXTERNAL_DIR_PATTERN = _build_dir_pattern()
-ROOT_FILE_PATTERN = _build_root_file_pattern()
 
+def on_config(config: dict) -> dict:
+    """
+    Precompute the GitHub URL prefixes used by on_page_content.
 
-def _get_github_blob_url(repo_url: str, branch: str, directory: str, path: str) -> str:
-    """Construct GitHub blob URL for a source file."""
-    # Remove trailing slash from repo_url
-    repo_url = repo_url.rstrip("/")
-
-    # Handle anchors in the path (e.g., file.py#L14-L76)
-    if "#" in path:
-        file_path, anchor = path.split("#", 1)
-        # GitHub uses #L for line numbers, keep as-is
-        return f"{repo_url}/blob/{branch}/{directory}/{file_path}#{anchor}"
+    Args:
+        config: MkDocs configuration dictionary
 
-    return f"{repo_url}/blob/{branch}/{directory}/{path}"
+    Returns:
+        The unchanged configuration
+    """
+    global _blob_base, _tree_base
 
+    repo_url = config.get("repo_url") or ""
+    if not repo_url:
+        log.warning("No repo_url configured in mkdocs.yml - external links will not be transformed")
+        _blob_base = _tree_base = None
+        return config
 
-def _get_github_tree_url(repo_url: str, branch: str, directory: str) -> str:
-    """Construct GitHub tree URL for a directory."""
-    repo_url = repo_url.rstrip("/")
-    return f"{repo_url}/tree/{branch}/{directory}"
+    # GitHub keeps anchors (e.g. file.py#L14-L76) as-is, so paths are appended verbatim
+    repo_base = repo_url.rstrip("/")
+    _blob_base = f"{repo_base}/blob/{DEFAULT_BRANCH}"
+    _tree_base = f"{repo_base}/tree/{DEFAULT_BRANCH}"
+    return config
 
 
 @mkdocs.plugins.event_priority(50)
@@ -136,68 +153,30 @@ def on_page_content(html: str, page: Any, config: dict, files: Any) -> str:
     Returns:
         Modified HTML with transformed links
     """
-    repo_url = config.get("repo_url", "")
-
-    if not repo_url:
-        log.warning("No repo_url configured in mkdocs.yml - external links will not be transformed")
+    # Every transformed link starts with ../, so most pages can skip the regex entirely
+    if _blob_base is None or "../" not in html:
         return html
 
-    # Always use 'main' as the default branch
-    # MkDocs may auto-generate edit_uri with 'master' but most repos now use 'main'
-    branch = "main"
-
+    blob_base = _blob_base
+    tree_base = _tree_base
     transform_count = 0
 
-    def replace_file_link(match: re.Match) -> str:
-        """Replace a single external file link with GitHub blob URL."""
-        nonlocal transform_count
-
-        attr = match.group(1)  # href or src
-        # parent_refs = match.group(2)  # ../ sequences (unused but captured)
-        directory = match.group(3)  # external directory name
-        path = match.group(4)  # rest of the path (file)
-
-        github_url = _get_github_blob_url(repo_url, branch, directory, path)
-        transform_count += 1
-
-        return f'{attr}="{github_url}"'
-
-    def replace_dir_link(match: re.Match) -> str:
-        """Replace a single external directory link with GitHub tree URL."""
+    def replace_link(match: re.Match) -> str:
+        """Replace a single external link with the matching GitHub URL."""
         nonlocal transform_count
-
-        attr = match.group(1)  # href or src
-        # parent_refs = match.group(2)  # ../ sequences (unused but captured)
-        directory = match.group(3)  # external directory name
-
-        github_url = _get_github_tree_url(repo_url, branch, directory)
         transform_count += 1
 
-        return f'{attr}="{github_url}"'
-
-    def replace_root_file_link(match: re.Match) -> str:
-        """Replace a root-level file link with GitHub blob URL."""
-        nonlocal transform_count
-
-        attr = match.group(1)  # href or src
-        full_path = match.group(2)  # filename with optional anchor
-
-        # Handle anchors
-        if "#" in full_path:
-            filename, anchor = full_path.split("#", 1)
-            github_url = f"{repo_url.rstrip('/')}/blob/{branch}/{filename}#{anchor}"
+        attr = match["attr"]  # href or src
+        if match["file_dir"] is not None:
+            github_url = f"{blob_base}/{match['file_dir']}/{match['file_path']}"
+        elif match["dir"] is not None:
+            github_url = f"{tree_base}/{match['dir']}"
         else:
-            github_url = f"{repo_url.rstrip('/')}/blob/{branch}/{full_path}"
+            github_url = f"{blob_base}/{match['root_file']}"
 
-        transform_count += 1
         return f'{attr}="{github_url}"'
 
-    # Transform file links first (most specific pattern)
-    transformed_html = EXTERNAL_FILE_PATTERN.sub(replace_file_link, html)
-    # Then transform directory-only links
-    transformed_html = EXTERNAL_DIR_PATTERN.sub(replace_dir_link, transformed_html)
-    # Finally transform root-level files
-    transformed_html = ROOT_FILE_PATTERN.sub(replace_root_file_link, transformed_html)
+    transformed_html = EXTERNAL_LINK_PATTERN.sub(replace_link, html)
 
     if transform_count > 0:
         log.debug(f"Transformed {transform_count} external link(s) in {page.file.src_path}")
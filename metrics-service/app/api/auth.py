@@ -1,8 +1,10 @@
 import logging
+import time
 
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPBearer
 
+from ..config import settings
 from ..core.rate_limiter import rate_limiter
 from ..storage.database import get_storage
 from ..utils.helpers import hash_api_key
@@ -10,6 +12,28 @@ from ..utils.helpers import hash_api_key
 logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
+# key_hash -> (monotonic expiry, api_keys row) for recently verified keys
+_key_info_cache: dict[str, tuple[float, dict]] = {}
+
+
+async def _get_key_info(key_hash: str) -> dict | None:
+    """Look up an API key record, reusing it for API_KEY_CACHE_TTL_SECONDS."""
+    now = time.monotonic()
+    cached = _key_info_cache.get(key_hash)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    key_info = await get_storage().get_api_key(key_hash)
+    # Unknown keys are not cached so invalid headers cannot grow the cache
+    if key_info and settings.API_KEY_CACHE_TTL_SECONDS > 0:
+        _key_info_cache[key_hash] = (now + settings.API_KEY_CACHE_TTL_SECONDS, key_info)
+    return key_info
+
+
+def clear_api_key_cache():
+    """Drop cached API key records."""
+    _key_info_cache.clear()
+
 
 async def verify_api_key(request: Request) -> str:
     """Verify API key from X-API-Key header and check rate limits."""
@@ -22,8 +46,7 @@ async def verify_api_key(request: Request) -> str:
     key_hash = hash_api_key(api_key)
 
     # Verify against database
-    storage = get_storage()
-    key_info = await storage.get_api_key(key_hash)
+    key_info = await _get_key_info(key_hash)
 
     if not key_info:
         raise HTTPException(status_code=401, detail="Invalid API key")
@@ -47,11 +70,10 @@ async def verify_api_key(request: Request) -> str:
         )
 
     # Update last used timestamp
-    await storage.update_api_key_usage(key_hash)
+    await get_storage().update_api_key_usage(key_hash)
 
-    # Add rate limit headers
-    request.state.rate_limit_remaining = remaining
-    request.state.rate_limit_limit = rate_limit
+    # Rate limit header values (limit, remaining) for the route to copy onto the response
+    request.state.rate_limit_headers = (str(rate_limit), str(remaining))
 
     logger.debug(
         f"API key verified for service: {key_info['service_name']}, remaining: {remaining}"
@@ -64,8 +86,7 @@ async def get_rate_limit_status(api_key: str) -> dict:
     key_hash = hash_api_key(api_key)
 
     # Get key info from database
-    storage = get_storage()
-    key_info = await storage.get_api_key(key_hash)
+    key_info = await _get_key_info(key_hash)
 
     if not key_info:
         raise HTTPException(status_code=401, detail="Invalid API key")
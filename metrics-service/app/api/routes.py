@@ -1,10 +1,16 @@
+import asyncio
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 
 from ..api.auth import get_rate_limit_status, verify_api_key
+from ..config import settings
 from ..core.models import MetricRequest, MetricResponse
-from ..core.processor import MetricsProcessor
+from ..core.processor import MetricsBackpressureError, MetricsProcessor
 from ..core.retention import retention_manager
 from ..utils.helpers import generate_request_id
 
@@ -12,25 +18,87 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 processor = MetricsProcessor()
 
+# /metrics reads its body by hand, so FastAPI cannot infer the request schema
+_METRIC_REQUEST_BODY = {
+    "required": True,
+    "content": {"application/json": {"schema": MetricRequest.model_json_schema()}},
+}
 
-@router.post("/metrics", response_model=MetricResponse)
+# Pre-serialized once; flush responses never vary
+_FLUSH_SUCCESS_BODY = orjson.dumps({"status": "success", "message": "Metrics flushed to storage"})
+
+
+def _request_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"Request body exceeds {settings.MAX_REQUEST_SIZE}",
+    )
+
+
+async def _read_body(request: Request) -> bytearray:
+    """Read the request body chunk by chunk, enforcing MAX_REQUEST_SIZE.
+
+    Oversized uploads are rejected from Content-Length or as soon as the
+    streamed total crosses the limit, before the rest is read into memory.
+    """
+    limit = settings.MAX_REQUEST_BYTES
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > limit:
+        raise _request_too_large()
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise _request_too_large()
+    return body
+
+
+def _apply_rate_limit_headers(request: Request, response: Response):
+    """Copy the rate limit values recorded by verify_api_key onto the response."""
+    rate_limit_headers = getattr(request.state, "rate_limit_headers", None)
+    if rate_limit_headers:
+        limit, remaining = rate_limit_headers
+        response.headers["X-RateLimit-Limit"] = limit
+        response.headers["X-RateLimit-Remaining"] = remaining
+
+
+async def _parse_metric_request(request: Request) -> MetricRequest:
+    """Validate the raw /metrics body directly from JSON bytes.
+
+    Large bodies are validated in a worker thread so one big batch does not
+    hold up the event loop for the whole parse.
+    """
+    body = await _read_body(request)
+    try:
+        if len(body) >= settings.METRICS_PARSE_OFFLOAD_BYTES:
+            return await asyncio.to_thread(MetricRequest.model_validate_json, body)
+        return MetricRequest.model_validate_json(body)
+    except ValidationError as e:
+        # Match FastAPI's own body validation errors, whose loc starts with "body"
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+@router.post(
+    "/metrics",
+    response_model=MetricResponse,
+    openapi_extra={"requestBody": _METRIC_REQUEST_BODY},
+)
 async def collect_metrics(
-    metric_request: MetricRequest,
     request: Request,
-    response: Response,
     api_key: str = Depends(verify_api_key),
 ):
-    """Collect metrics from MCP components."""
+    """Collect metrics from MCP components.
+
+    The success body is serialized straight to JSON; response_model only
+    documents its shape.
+    """
+    metric_request = await _parse_metric_request(request)
     request_id = generate_request_id()
 
     try:
-        # Add rate limit headers
-        if hasattr(request.state, "rate_limit_remaining") and hasattr(
-            request.state, "rate_limit_limit"
-        ):
-            response.headers["X-RateLimit-Limit"] = str(request.state.rate_limit_limit)
-            response.headers["X-RateLimit-Remaining"] = str(request.state.rate_limit_remaining)
-
         # Process metrics
         result = await processor.process_metrics(metric_request, request_id, api_key)
 
@@ -38,34 +106,38 @@ async def collect_metrics(
             f"Processed {result.accepted} metrics from {metric_request.service} (request: {request_id})"
         )
 
-        return MetricResponse(
-            status="success",
-            accepted=result.accepted,
-            rejected=result.rejected,
-            errors=result.errors,
-            request_id=request_id,
+        response = ORJSONResponse(
+            {
+                "status": "success",
+                "accepted": result.accepted,
+                "rejected": result.rejected,
+                "errors": result.errors,
+                "request_id": request_id,
+            }
         )
+        _apply_rate_limit_headers(request, response)
+        return response
 
+    except MetricsBackpressureError as e:
+        logger.warning(f"Rejected metrics from {metric_request.service}: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail="Metrics queue is full, retry later",
+            headers={"Retry-After": str(settings.METRICS_FLUSH_INTERVAL_SECONDS)},
+        )
     except Exception as e:
         logger.error(f"Error processing metrics: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {e!s}")
 
 
 @router.post("/flush")
-async def flush_metrics(
-    request: Request, response: Response, api_key: str = Depends(verify_api_key)
-):
+async def flush_metrics(request: Request, api_key: str = Depends(verify_api_key)):
     """Force flush buffered metrics to storage."""
     try:
-        # Add rate limit headers
-        if hasattr(request.state, "rate_limit_remaining") and hasattr(
-            request.state, "rate_limit_limit"
-        ):
-            response.headers["X-RateLimit-Limit"] = str(request.state.rate_limit_limit)
-            response.headers["X-RateLimit-Remaining"] = str(request.state.rate_limit_remaining)
-
         await processor.force_flush()
-        return {"status": "success", "message": "Metrics flushed to storage"}
+        response = Response(_FLUSH_SUCCESS_BODY, media_type="application/json")
+        _apply_rate_limit_headers(request, response)
+        return response
     except Exception as e:
         logger.error(f"Error flushing metrics: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to flush metrics: {e!s}")
@@ -102,10 +174,21 @@ async def get_cleanup_preview(
 
 @router.post("/admin/retention/cleanup")
 async def run_cleanup(
-    table_name: str | None = None, dry_run: bool = True, api_key: str = Depends(verify_api_key)
+    response: Response,
+    table_name: str | None = None,
+    dry_run: bool = True,
+    api_key: str = Depends(verify_api_key),
 ):
-    """Run data cleanup according to retention policies."""
+    """Run data cleanup according to retention policies.
+
+    Dry runs return their counts directly; real cleanups are queued as a
+    background job whose status is served by /admin/retention/jobs/{job_id}.
+    """
     try:
+        if not dry_run:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return retention_manager.start_cleanup_job(table_name)
+
         if table_name:
             result = await retention_manager.cleanup_table(table_name, dry_run)
         else:
@@ -116,19 +199,20 @@ async def run_cleanup(
         raise HTTPException(status_code=500, detail=f"Failed to run cleanup: {e!s}")
 
 
+@router.get("/admin/retention/jobs/{job_id}")
+async def get_cleanup_job(job_id: str, api_key: str = Depends(verify_api_key)):
+    """Get the status of a queued cleanup job."""
+    job = retention_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Cleanup job not found: {job_id}")
+    return job
+
+
 @router.get("/admin/retention/policies")
 async def get_retention_policies(api_key: str = Depends(verify_api_key)):
     """Get current retention policies."""
     try:
-        policies = {}
-        for name, policy in retention_manager.policies.items():
-            policies[name] = {
-                "table_name": policy.table_name,
-                "retention_days": policy.retention_days,
-                "is_active": policy.is_active,
-                "timestamp_column": policy.timestamp_column,
-            }
-        return policies
+        return retention_manager.get_policies()
     except Exception as e:
         logger.error(f"Error getting retention policies: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get retention policies: {e!s}")
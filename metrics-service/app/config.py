@@ -1,8 +1,32 @@
 """Application configuration with validation using Pydantic Settings."""
 
-from pydantic import Field
+from functools import cached_property
+from typing import Literal
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_SIZE_UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "B": 1}
+
+
+def _parse_size(value: str) -> int:
+    """Convert a size such as "10MB" to a byte count, raising ValueError if malformed."""
+    size = value.strip().upper()
+    for unit, multiplier in _SIZE_UNITS.items():
+        if size.endswith(unit):
+            size = size[: -len(unit)].strip()
+            break
+    else:
+        multiplier = 1
+
+    try:
+        byte_count = int(float(size) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid size {value!r}; expected a number with optional B/KB/MB/GB")
+    if byte_count <= 0:
+        raise ValueError(f"Size must be positive, got {value!r}")
+    return byte_count
+
 
 class Settings(BaseSettings):
     """Application configuration with environment variable support and validation."""
@@ -37,6 +61,18 @@ class Settings(BaseSettings):
         le=20,
         description="Maximum database connection retries",
     )
+    DB_READ_POOL_SIZE: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum idle read-only connections kept for admin queries",
+    )
+    WAL_AUTOCHECKPOINT: int = Field(
+        default=1000,
+        ge=0,
+        le=1000000,
+        description="WAL pages written before an automatic checkpoint (0 disables)",
+    )
 
     # Service settings
     METRICS_SERVICE_PORT: int = Field(
@@ -77,9 +113,15 @@ class Settings(BaseSettings):
         le=100000,
         description="Default rate limit (requests per minute)",
     )
-    API_KEY_HASH_ALGORITHM: str = Field(
+    API_KEY_HASH_ALGORITHM: Literal["sha256", "blake2b"] = Field(
         default="sha256",
-        description="Hash algorithm for API keys",
+        description="Hash algorithm for API keys (changing it invalidates stored key hashes)",
+    )
+    API_KEY_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description="Seconds a verified API key record is reused before re-reading it (0 disables)",
     )
 
     # Performance
@@ -89,12 +131,24 @@ class Settings(BaseSettings):
         le=10000,
         description="Batch size for metrics processing",
     )
+    QUEUE_MAX_SIZE: int = Field(
+        default=10000,
+        ge=1,
+        le=1000000,
+        description="Maximum metrics queued for storage before requests get HTTP 429",
+    )
     FLUSH_INTERVAL_SECONDS: int = Field(
         default=30,
         ge=1,
         le=3600,
         description="Interval for flushing metrics buffer",
     )
+    METRICS_PARSE_OFFLOAD_BYTES: int = Field(
+        default=262144,
+        ge=1024,
+        le=104857600,
+        description="Request body size from which /metrics validation runs in a worker thread",
+    )
     MAX_REQUEST_SIZE: str = Field(
         default="10MB",
         description="Maximum request body size",
@@ -125,5 +179,17 @@ class Settings(BaseSettings):
         """Generate database URL from path."""
         return f"sqlite:///{self.SQLITE_DB_PATH}"
 
+    @field_validator("MAX_REQUEST_SIZE")
+    @classmethod
+    def _validate_max_request_size(cls, value: str) -> str:
+        # Fail at startup rather than on every /metrics upload
+        _parse_size(value)
+        return value
+
+    @cached_property
+    def MAX_REQUEST_BYTES(self) -> int:
+        """MAX_REQUEST_SIZE (e.g. "10MB") converted to a byte count."""
+        return _parse_size(self.MAX_REQUEST_SIZE)
+
 
 settings = Settings()
@@ -7,7 +7,7 @@ from .models import (
     MetricResponse,
     MetricType,
 )
-from .processor import MetricsProcessor, ProcessingResult
+from .processor import MetricsBackpressureError, MetricsProcessor, ProcessingResult
 from .rate_limiter import RateLimiter, rate_limiter
 from .retention import RetentionManager, RetentionPolicy, retention_manager
 from .validator import MetricsValidator, ValidationError, ValidationResult, validator
@@ -20,6 +20,7 @@ __all__ = [
     "MetricResponse",
     "MetricType",
     # Processor
+    "MetricsBackpressureError",
     "MetricsProcessor",
     "ProcessingResult",
     # Rate Limiter
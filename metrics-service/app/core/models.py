@@ -1,13 +1,9 @@
-from datetime import UTC, datetime
+import sys
+from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
-
-
-def _utc_now() -> datetime:
-    """Return current UTC datetime (timezone-aware)."""
-    return datetime.now(UTC)
+from pydantic import BaseModel, Field, field_validator
 
 
 class MetricType(str, Enum):
@@ -22,7 +18,8 @@ class MetricType(str, Enum):
 
 class Metric(BaseModel):
     type: MetricType
-    timestamp: datetime | None = Field(default_factory=_utc_now)
+    # Filled in at storage time when the client does not send one
+    timestamp: datetime | None = None
     value: float
     duration_ms: float | None = None
     dimensions: dict[str, Any] = Field(default_factory=dict)
@@ -35,6 +32,12 @@ class MetricRequest(BaseModel):
     instance_id: str | None = Field(None, max_length=50)
     metrics: list[Metric]
 
+    @field_validator("service", "version", "instance_id")
+    @classmethod
+    def _intern_identity(cls, value: str | None) -> str | None:
+        # Queued requests from the same service then share one string object
+        return sys.intern(value) if value is not None else None
+
 
 class MetricResponse(BaseModel):
     status: str
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 
+from ..config import settings
 from ..core.models import Metric, MetricRequest, MetricType
 from ..core.validator import validator
 from ..storage.database import get_storage
@@ -15,13 +16,22 @@ class ProcessingResult:
         self.errors = []
 
 
+class MetricsBackpressureError(Exception):
+    """Raised when the storage queue has no room for a request's metrics."""
+
+
 class MetricsProcessor:
-    """Core metrics processing engine."""
+    """Core metrics processing engine.
+
+    Accepted metrics go onto a bounded in-process queue. A single flusher task
+    drains it in batches, so request latency does not depend on disk writes.
+    """
 
     def __init__(self):
         self.storage = get_storage()
-        self._buffer = []
-        self._buffer_lock = asyncio.Lock()
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=settings.QUEUE_MAX_SIZE)
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
 
         # Try to initialize OTel instruments, but don't fail if it doesn't work
         self.otel = None
@@ -50,6 +60,13 @@ class MetricsProcessor:
         for warning in validation_result.warnings:
             logger.warning(f"Metrics validation warning: {warning}")
 
+        # Accept all of the request's metrics or none of them
+        free_slots = self._queue.maxsize - self._queue.qsize()
+        if len(request.metrics) > free_slots:
+            raise MetricsBackpressureError(
+                f"Metrics queue full ({self._queue.qsize()}/{self._queue.maxsize})"
+            )
+
         for metric in request.metrics:
             try:
                 # Additional runtime validation
@@ -65,8 +82,8 @@ class MetricsProcessor:
                     except Exception as e:
                         logger.warning(f"Failed to emit to OTel: {e}")
 
-                # Store in SQLite (buffered)
-                await self._buffer_for_storage(metric, request, request_id)
+                # Queue for batched SQLite storage
+                self._enqueue_for_storage(metric, request, request_id)
 
                 result.accepted += 1
 
@@ -121,32 +138,53 @@ class MetricsProcessor:
             if metric.duration_ms:
                 self.otel.health_histogram.record(metric.duration_ms / 1000, labels)
 
-    async def _buffer_for_storage(self, metric: Metric, request: MetricRequest, request_id: str):
-        """Buffer metric for batch SQLite storage."""
-        async with self._buffer_lock:
-            self._buffer.append({"metric": metric, "request": request, "request_id": request_id})
-
-            # Flush buffer if it's full
-            if len(self._buffer) >= 100:
-                await self._flush_buffer()
-
-    async def _flush_buffer(self):
-        """Flush buffered metrics to SQLite."""
-        if not self._buffer:
-            return
-
-        buffer_copy = self._buffer.copy()
-        self._buffer.clear()
+    def _enqueue_for_storage(self, metric: Metric, request: MetricRequest, request_id: str):
+        """Queue a metric for batched SQLite storage."""
+        self._queue.put_nowait({"metric": metric, "request": request, "request_id": request_id})
+
+        # Wake the flusher early once a full batch is waiting
+        if self._queue.qsize() >= settings.BATCH_SIZE:
+            self._flush_requested.set()
+
+    async def _flush_queue(self):
+        """Write queued metrics to SQLite in batches of up to BATCH_SIZE."""
+        async with self._flush_lock:
+            while not self._queue.empty():
+                batch = [
+                    self._queue.get_nowait()
+                    for _ in range(min(settings.BATCH_SIZE, self._queue.qsize()))
+                ]
+
+                try:
+                    await self.storage.store_metrics_batch(batch)
+                    logger.debug(f"Flushed {len(batch)} metrics to storage")
+                except Exception as e:
+                    logger.error(f"Failed to flush metrics queue: {e}")
+                    # Re-queue for retry on the next flush, dropping what no longer fits
+                    requeued = 0
+                    for item in batch:
+                        if self._queue.full():
+                            break
+                        self._queue.put_nowait(item)
+                        requeued += 1
+                    if requeued < len(batch):
+                        logger.error(f"Dropped {len(batch) - requeued} metrics, queue is full")
+                    return
+
+    async def run_flusher(self):
+        """Flush the queue every METRICS_FLUSH_INTERVAL_SECONDS or when a batch fills."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(),
+                    timeout=settings.METRICS_FLUSH_INTERVAL_SECONDS,
+                )
+            except TimeoutError:
+                pass
 
-        try:
-            await self.storage.store_metrics_batch(buffer_copy)
-            logger.debug(f"Flushed {len(buffer_copy)} metrics to storage")
-        except Exception as e:
-            logger.error(f"Failed to flush metrics buffer: {e}")
-            # Re-add to buffer for retry
-            self._buffer.extend(buffer_copy)
+            self._flush_requested.clear()
+            await self._flush_queue()
 
     async def force_flush(self):
-        """Force flush all buffered metrics."""
-        async with self._buffer_lock:
-            await self._flush_buffer()
+        """Force flush all queued metrics."""
+        await self._flush_queue()
@@ -13,6 +13,8 @@ class RateLimiter:
     def __init__(self):
         # In-memory token buckets: {key_hash: (tokens, last_refill, rate_limit)}
         self._buckets: dict[str, tuple[int, float, int]] = {}
+        # Keys with an empty bucket: {key_hash: time the next token is added}
+        self._blocked_until: dict[str, float] = {}
         self._lock = asyncio.Lock()
 
     async def check_rate_limit(self, key_hash: str, rate_limit: int) -> tuple[bool, int]:
@@ -26,6 +28,11 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, remaining_tokens)
         """
+        # Reject keys known to be out of tokens without taking the lock
+        blocked_until = self._blocked_until.get(key_hash)
+        if blocked_until is not None and time.time() < blocked_until:
+            return False, 0
+
         async with self._lock:
             now = time.time()
 
@@ -60,10 +67,12 @@ class RateLimiter:
             if tokens > 0:
                 tokens -= 1
                 self._buckets[key_hash] = (tokens, last_refill, rate_limit)
+                self._blocked_until.pop(key_hash, None)
                 logger.debug(f"Rate limit check passed. Remaining: {tokens}")
                 return True, tokens
             else:
                 self._buckets[key_hash] = (tokens, last_refill, rate_limit)
+                self._blocked_until[key_hash] = last_refill + 60.0 / rate_limit
                 logger.warning(f"Rate limit exceeded for key: {key_hash[:8]}...")
                 return False, 0
 
@@ -114,6 +123,10 @@ class RateLimiter:
             for key in old_keys:
                 del self._buckets[key]
 
+            self._blocked_until = {
+                key: until for key, until in self._blocked_until.items() if until > now
+            }
+
             if old_keys:
                 logger.info(f"Cleaned up {len(old_keys)} old rate limit buckets")
 
@@ -1,15 +1,22 @@
 """Data retention and cleanup policies for metrics service."""
 
+import asyncio
 import logging
+import secrets
 from datetime import datetime, timedelta
 from typing import Any
 
-import aiosqlite
-
 from ..storage.database import get_storage
 
 logger = logging.getLogger(__name__)
 
+# Rows deleted per write transaction, so ingest can take the writer in between
+CLEANUP_BATCH_SIZE = 10000
+# Truncate the WAL after this many delete batches
+CLEANUP_CHECKPOINT_EVERY = 10
+# Finished cleanup jobs kept for status lookups
+MAX_TRACKED_JOBS = 50
+
 
 class RetentionPolicy:
     """Represents a data retention policy for a table."""
@@ -28,14 +35,36 @@ class RetentionPolicy:
         self.cleanup_query = cleanup_query
         self.timestamp_column = timestamp_column
 
-    def get_cleanup_query(self) -> str:
-        """Get the cleanup query for this policy."""
+    def get_cleanup_query(self, limit: int | None = None) -> str:
+        """Get the cleanup query for this policy.
+
+        Args:
+            limit: Delete at most this many rows (ignored for custom queries)
+
+        Returns:
+            SQL DELETE statement
+        """
         if self.cleanup_query:
             return self.cleanup_query
 
         # Default cleanup query
         cutoff_date = f"datetime('now', '-{self.retention_days} days')"
-        return f"DELETE FROM {self.table_name} WHERE {self.timestamp_column} < {cutoff_date}"
+        where = f"{self.timestamp_column} < {cutoff_date}"
+        if limit is None:
+            return f"DELETE FROM {self.table_name} WHERE {where}"
+        return (
+            f"DELETE FROM {self.table_name} WHERE rowid IN "
+            f"(SELECT rowid FROM {self.table_name} WHERE {where} LIMIT {limit})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the policy for API responses."""
+        return {
+            "table_name": self.table_name,
+            "retention_days": self.retention_days,
+            "is_active": self.is_active,
+            "timestamp_column": self.timestamp_column,
+        }
 
     def get_count_query(self) -> str:
         """Get query to count records that would be deleted."""
@@ -51,6 +80,10 @@ class RetentionManager:
     def __init__(self):
         self.storage = get_storage()
         self.policies: dict[str, RetentionPolicy] = {}
+        self.jobs: dict[str, dict[str, Any]] = {}
+        # Serialized policies, rebuilt after the policies change
+        self._policies_cache: dict[str, dict[str, Any]] | None = None
+        self._job_tasks: set[asyncio.Task] = set()
         self._load_default_policies()
 
     def _load_default_policies(self):
@@ -96,7 +129,7 @@ class RetentionManager:
     async def load_policies_from_database(self):
         """Load retention policies from database."""
         try:
-            async with aiosqlite.connect(self.storage.db_path) as db:
+            async with self.storage.reader() as db:
                 cursor = await db.execute("""
                     SELECT table_name, retention_days, is_active
                     FROM retention_policies
@@ -119,6 +152,7 @@ class RetentionManager:
                             is_active=bool(is_active),
                         )
 
+                self._policies_cache = None
                 logger.info(f"Loaded {len(db_policies)} retention policies from database")
 
         except Exception as e:
@@ -128,8 +162,8 @@ class RetentionManager:
     async def save_policies_to_database(self):
         """Save current policies to database."""
         try:
-            async with aiosqlite.connect(self.storage.db_path) as db:
-                await db.execute("BEGIN TRANSACTION")
+            async with self.storage.writer() as db:
+                await db.execute("BEGIN IMMEDIATE")
 
                 for policy in self.policies.values():
                     await db.execute(
@@ -159,7 +193,7 @@ class RetentionManager:
                 continue
 
             try:
-                async with aiosqlite.connect(self.storage.db_path) as db:
+                async with self.storage.reader() as db:
                     # Count records to be deleted
                     cursor = await db.execute(policy.get_count_query())
                     count_result = await cursor.fetchone()
@@ -212,54 +246,65 @@ class RetentionManager:
             return {"table": table_name, "status": "skipped", "reason": "policy_inactive"}
 
         try:
-            async with aiosqlite.connect(self.storage.db_path) as db:
+            async with self.storage.reader() as db:
                 # Get preview first
                 cursor = await db.execute(policy.get_count_query())
                 count_result = await cursor.fetchone()
                 records_to_delete = count_result[0] if count_result else 0
 
-                if records_to_delete == 0:
-                    return {
-                        "table": table_name,
-                        "status": "completed",
-                        "records_deleted": 0,
-                        "reason": "no_records_to_delete",
-                    }
-
-                if dry_run:
-                    return {
-                        "table": table_name,
-                        "status": "dry_run",
-                        "records_would_delete": records_to_delete,
-                    }
-
-                # Execute cleanup
-                start_time = datetime.now()
-
-                await db.execute("BEGIN IMMEDIATE")
-                try:
-                    cursor = await db.execute(policy.get_cleanup_query())
-                    records_deleted = cursor.rowcount
+            if records_to_delete == 0:
+                return {
+                    "table": table_name,
+                    "status": "completed",
+                    "records_deleted": 0,
+                    "reason": "no_records_to_delete",
+                }
+
+            if dry_run:
+                return {
+                    "table": table_name,
+                    "status": "dry_run",
+                    "records_would_delete": records_to_delete,
+                }
+
+            # Execute cleanup in bounded batches, one transaction each
+            start_time = datetime.now()
+            query = policy.get_cleanup_query(limit=CLEANUP_BATCH_SIZE)
+            records_deleted = 0
+            batches = 0
+
+            while True:
+                async with self.storage.writer() as db:
+                    await db.execute("BEGIN IMMEDIATE")
+                    cursor = await db.execute(query)
+                    deleted = cursor.rowcount
                     await db.commit()
 
-                    end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
+                    records_deleted += deleted
+                    batches += 1
+                    if batches % CLEANUP_CHECKPOINT_EVERY == 0:
+                        await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
-                    logger.info(
-                        f"Cleaned up {records_deleted} records from {table_name} in {duration:.2f}s"
-                    )
+                # Custom queries are not batched and run exactly once
+                if policy.cleanup_query or deleted < CLEANUP_BATCH_SIZE:
+                    break
+                await asyncio.sleep(0)
 
-                    return {
-                        "table": table_name,
-                        "status": "completed",
-                        "records_deleted": records_deleted,
-                        "duration_seconds": duration,
-                        "retention_days": policy.retention_days,
-                    }
+            end_time = datetime.now()
+            duration = (end_time - start_time).total_seconds()
+
+            logger.info(
+                f"Cleaned up {records_deleted} records from {table_name} "
+                f"in {batches} batches, {duration:.2f}s"
+            )
 
-                except Exception as e:
-                    await db.rollback()
-                    raise e
+            return {
+                "table": table_name,
+                "status": "completed",
+                "records_deleted": records_deleted,
+                "duration_seconds": duration,
+                "retention_days": policy.retention_days,
+            }
 
         except Exception as e:
             logger.error(f"Failed to cleanup table {table_name}: {e}")
@@ -286,7 +331,7 @@ class RetentionManager:
         # Run VACUUM after cleanup to reclaim space
         if not dry_run and total_deleted > 0:
             try:
-                async with aiosqlite.connect(self.storage.db_path) as db:
+                async with self.storage.writer() as db:
                     logger.info("Running VACUUM to reclaim disk space...")
                     await db.execute("VACUUM")
                     logger.info("VACUUM completed successfully")
@@ -315,6 +360,64 @@ class RetentionManager:
 
         return summary
 
+    def start_cleanup_job(self, table_name: str | None = None) -> dict[str, Any]:
+        """Queue a cleanup run as a background task.
+
+        Args:
+            table_name: Table to clean up, or None for all tables with active policies
+
+        Returns:
+            Job record with job_id and status "queued"
+        """
+        if table_name is not None and table_name not in self.policies:
+            raise ValueError(f"No retention policy found for table: {table_name}")
+
+        job = {
+            "job_id": f"job_{secrets.token_hex(8)}",
+            "status": "queued",
+            "table_name": table_name,
+            "created_at": datetime.now().isoformat(),
+        }
+        self.jobs[job["job_id"]] = job
+
+        # Forget the oldest finished jobs once the history is full
+        finished = [j for j in self.jobs.values() if j["status"] in ("completed", "error")]
+        for old_job in finished[: max(0, len(self.jobs) - MAX_TRACKED_JOBS)]:
+            del self.jobs[old_job["job_id"]]
+
+        task = asyncio.create_task(self._run_cleanup_job(job))
+        self._job_tasks.add(task)
+        task.add_done_callback(self._job_tasks.discard)
+        return dict(job)
+
+    async def _run_cleanup_job(self, job: dict[str, Any]):
+        """Run a queued cleanup job and record its outcome."""
+        job["status"] = "running"
+        try:
+            if job["table_name"]:
+                job["result"] = await self.cleanup_table(job["table_name"])
+            else:
+                job["result"] = await self.cleanup_all_tables()
+            job["status"] = "completed"
+        except Exception as e:
+            logger.error(f"Cleanup job {job['job_id']} failed: {e}")
+            job["status"] = "error"
+            job["error"] = str(e)
+        job["completed_at"] = datetime.now().isoformat()
+
+    def get_job(self, job_id: str) -> dict[str, Any] | None:
+        """Get the status of a cleanup job."""
+        job = self.jobs.get(job_id)
+        return dict(job) if job else None
+
+    def get_policies(self) -> dict[str, dict[str, Any]]:
+        """Get all policies in their serialized form, built once per change."""
+        if self._policies_cache is None:
+            self._policies_cache = {
+                name: policy.to_dict() for name, policy in self.policies.items()
+            }
+        return self._policies_cache
+
     async def update_policy(self, table_name: str, retention_days: int, is_active: bool = True):
         """Update retention policy for a table."""
         if table_name in self.policies:
@@ -324,6 +427,7 @@ class RetentionManager:
             self.policies[table_name] = RetentionPolicy(
                 table_name=table_name, retention_days=retention_days, is_active=is_active
             )
+        self._policies_cache = None
 
         # Save to database
         await self.save_policies_to_database()
@@ -336,7 +440,7 @@ class RetentionManager:
         stats = {}
 
         try:
-            async with aiosqlite.connect(self.storage.db_path) as db:
+            async with self.storage.reader() as db:
                 # Get all table names
                 cursor = await db.execute("""
                     SELECT name FROM sqlite_master
@@ -433,7 +537,7 @@ class RetentionManager:
                 size_info = {"error": "Database file not found"}
 
             # Get SQLite page info
-            async with aiosqlite.connect(self.storage.db_path) as db:
+            async with self.storage.reader() as db:
                 cursor = await db.execute("PRAGMA page_count")
                 page_count = (await cursor.fetchone())[0]
 
@@ -180,8 +180,16 @@ class MetricsValidator:
         if metric.metadata:
             self._validate_metadata(metric.metadata, f"{field_prefix}.metadata", result)
 
-    def _validate_timestamp(self, timestamp: datetime, field: str, result: ValidationResult):
-        """Validate timestamp."""
+    def _validate_timestamp(
+        self,
+        timestamp: datetime | None,
+        field: str,
+        result: ValidationResult,
+    ):
+        """Validate timestamp (missing timestamps are stamped when stored)."""
+        if timestamp is None:
+            return
+
         if not isinstance(timestamp, datetime):
             result.add_error(
                 field, f"Timestamp must be datetime object, got {type(timestamp).__name__}"
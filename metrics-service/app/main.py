@@ -4,8 +4,10 @@ import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from .api.auth import clear_api_key_cache
 from .api.routes import router as api_router
 from .config import settings
 from .core.rate_limiter import rate_limiter
@@ -74,15 +76,22 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    # Write out metrics still queued, then close pooled database connections
+    from .api.routes import processor
+
+    await processor.force_flush()
+    await get_storage().close()
+
     logger.info("Shutting down Metrics Collection Service")
 
 
 async def rate_limit_cleanup_task():
-    """Background task to clean up old rate limit buckets."""
+    """Background task to clean up old rate limit buckets and cached API keys."""
     while True:
         try:
             await asyncio.sleep(settings.RATE_LIMIT_CLEANUP_INTERVAL_SECONDS)
             await rate_limiter.cleanup_old_buckets(max_age_hours=24)
+            clear_api_key_cache()
         except asyncio.CancelledError:
             break
         except Exception as e:
@@ -116,15 +125,13 @@ async def retention_cleanup_task():
 
 
 async def metrics_flush_task():
-    """Background task to flush metrics buffer periodically."""
+    """Background task that drains the metrics queue into the database."""
     # Import the shared processor instance from routes
     from .api.routes import processor
 
     while True:
         try:
-            await asyncio.sleep(settings.METRICS_FLUSH_INTERVAL_SECONDS)
-            await processor.force_flush()
-            logger.debug("Metrics buffer flushed to database")
+            await processor.run_flusher()
         except asyncio.CancelledError:
             break
         except Exception as e:
@@ -195,6 +202,7 @@ app = FastAPI(
     description="Centralized metrics collection for MCP Gateway Registry components",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Include API routes
@@ -1,15 +1,119 @@
 import asyncio
 import json
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
+import orjson
 
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning applied to every pooled connection. WAL lets readers run
+# alongside the single writer; synchronous=NORMAL only fsyncs at checkpoints.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",  # 1 GiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# Insert statements are module constants so that sqlite3's per-connection statement
+# cache keeps them prepared on the long-lived writer connection
+_INSERT_METRIC_SQL = """
+    INSERT INTO metrics (
+        request_id, service, service_version, instance_id,
+        metric_type, timestamp, value, duration_ms,
+        dimensions, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SPECIALIZED_BASE_COLUMNS = ("request_id", "timestamp", "service", "duration_ms")
+
+
+def _specialized_insert(
+    table: str,
+    dimension_keys: tuple[str, ...],
+    metadata_keys: tuple[str, ...],
+) -> tuple[str, tuple[str, ...], tuple[str, ...]]:
+    """Build a specialized table's INSERT statement and the keys that fill its row.
+
+    Args:
+        table: Specialized table name
+        dimension_keys: Metric dimension keys, stored in columns of the same name
+        metadata_keys: Metric metadata keys, stored in columns of the same name
+
+    Returns:
+        Tuple of (insert SQL, dimension keys, metadata keys)
+    """
+    columns = (*_SPECIALIZED_BASE_COLUMNS, *dimension_keys, *metadata_keys)
+    placeholders = ", ".join("?" * len(columns))
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    return sql, dimension_keys, metadata_keys
+
+
+# Specialized table insert per metric type; other types only go to the metrics table
+_SPECIALIZED_INSERTS = {
+    "auth_request": _specialized_insert(
+        "auth_metrics",
+        ("success", "method", "server", "user_hash"),
+        ("error_code",),
+    ),
+    "tool_discovery": _specialized_insert(
+        "discovery_metrics",
+        ("query", "results_count", "top_k_services", "top_n_tools"),
+        ("embedding_time_ms", "faiss_search_time_ms"),
+    ),
+    "tool_execution": _specialized_insert(
+        "tool_metrics",
+        (
+            "tool_name",
+            "server_path",
+            "server_name",
+            "success",
+            "client_name",
+            "client_version",
+            "method",
+            "user_hash",
+        ),
+        ("error_code", "input_size_bytes", "output_size_bytes"),
+    ),
+}
+
+
+def _dumps_json(value: dict[str, Any]) -> str:
+    """Serialize a dimensions/metadata dict for a JSON column."""
+    try:
+        return orjson.dumps(value).decode()
+    except TypeError:
+        # orjson rejects some values json accepts, such as integers beyond 64 bits
+        return json.dumps(value)
+
+
+async def _open_connection(
+    db_path: str,
+    read_only: bool = False,
+) -> aiosqlite.Connection:
+    """Open a tuned SQLite connection for the storage pool."""
+    if read_only:
+        db = await aiosqlite.connect(f"file:{db_path}?mode=ro", uri=True)
+    else:
+        db = await aiosqlite.connect(db_path)
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute(f"PRAGMA wal_autocheckpoint={settings.WAL_AUTOCHECKPOINT}")
+
+    for pragma in _CONNECTION_PRAGMAS:
+        await db.execute(pragma)
+    return db
+
 
 async def wait_for_database(max_retries: int = 10, delay: float = 2.0):
     """Wait for SQLite database container to be ready."""
@@ -184,19 +288,23 @@ async def init_database():
             CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON metrics(timestamp);
             CREATE INDEX IF NOT EXISTS idx_metrics_service_type ON metrics(service, metric_type);
             CREATE INDEX IF NOT EXISTS idx_metrics_type_timestamp ON metrics(metric_type, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_metrics_created_at ON metrics(created_at);
 
             CREATE INDEX IF NOT EXISTS idx_auth_timestamp ON auth_metrics(timestamp);
             CREATE INDEX IF NOT EXISTS idx_auth_success ON auth_metrics(success, timestamp);
             CREATE INDEX IF NOT EXISTS idx_auth_user ON auth_metrics(user_hash, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_auth_created_at ON auth_metrics(created_at);
 
             CREATE INDEX IF NOT EXISTS idx_discovery_timestamp ON discovery_metrics(timestamp);
             CREATE INDEX IF NOT EXISTS idx_discovery_results ON discovery_metrics(results_count, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_discovery_created_at ON discovery_metrics(created_at);
 
             CREATE INDEX IF NOT EXISTS idx_tool_timestamp ON tool_metrics(timestamp);
             CREATE INDEX IF NOT EXISTS idx_tool_name ON tool_metrics(tool_name, timestamp);
             CREATE INDEX IF NOT EXISTS idx_tool_success ON tool_metrics(success, timestamp);
             CREATE INDEX IF NOT EXISTS idx_tool_client ON tool_metrics(client_name, timestamp);
             CREATE INDEX IF NOT EXISTS idx_tool_method ON tool_metrics(method, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_tool_created_at ON tool_metrics(created_at);
 
             CREATE INDEX IF NOT EXISTS idx_api_keys_hash ON api_keys(key_hash);
             CREATE INDEX IF NOT EXISTS idx_api_keys_service ON api_keys(service_name);
@@ -225,48 +333,134 @@ def get_storage() -> "MetricsStorage":
 
 
 class MetricsStorage:
-    """SQLite storage handler for containerized database."""
+    """SQLite storage handler for containerized database.
+
+    All writes share one long-lived writer connection, serialized by a lock, and
+    reads borrow from a small pool of read-only connections so that admin
+    queries never wait behind the writer.
+    """
 
     def __init__(self):
         self.db_path = settings.SQLITE_DB_PATH
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._readers: list[aiosqlite.Connection] = []
+        # Path the pooled connections were opened for; db_path may be reassigned
+        self._pool_path: str | None = None
+
+    async def _ensure_pool(self) -> aiosqlite.Connection:
+        """Open the writer connection, reopening the pool if db_path changed."""
+        if self._pool_path != self.db_path:
+            await self.close()
+
+        if self._writer is None:
+            self._writer = await _open_connection(self.db_path)
+            self._pool_path = self.db_path
+        return self._writer
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow the shared writer connection for exclusive use.
+
+        A transaction left open by the caller because of an error is rolled back.
+        """
+        async with self._write_lock:
+            db = await self._ensure_pool()
+            try:
+                yield db
+            except BaseException:
+                if db.in_transaction:
+                    await db.rollback()
+                raise
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool."""
+        # The writer creates the database and its WAL files before any reader opens
+        if self._writer is None or self._pool_path != self.db_path:
+            async with self._write_lock:
+                await self._ensure_pool()
+        pool_path = self._pool_path
+        db = self._readers.pop() if self._readers else await _open_connection(pool_path, True)
+        try:
+            yield db
+        finally:
+            if pool_path == self._pool_path and len(self._readers) < settings.DB_READ_POOL_SIZE:
+                self._readers.append(db)
+            else:
+                await db.close()
+
+    async def close(self):
+        """Close the writer and all pooled reader connections."""
+        readers, self._readers = self._readers, []
+        for db in readers:
+            await db.close()
+
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            await writer.close()
+        self._pool_path = None
 
     async def store_metrics_batch(self, metrics_batch: list[dict[str, Any]]):
-        """Store a batch of metrics in the containerized database."""
+        """Store a batch of metrics in the containerized database.
+
+        Rows are grouped per table and written with one executemany per table
+        inside a single transaction.
+        """
         if not metrics_batch:
             return
 
-        async with aiosqlite.connect(self.db_path) as db:
-            try:
-                for metric_data in metrics_batch:
-                    metric = metric_data["metric"]
-                    request = metric_data["request"]
-                    request_id = metric_data["request_id"]
-
-                    # Store in main metrics table
-                    await db.execute(
-                        """
-                        INSERT INTO metrics (
-                            request_id, service, service_version, instance_id,
-                            metric_type, timestamp, value, duration_ms,
-                            dimensions, metadata
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            request_id,
-                            request.service,
-                            request.version,
-                            request.instance_id,
-                            metric.type.value,
-                            metric.timestamp.isoformat(),
-                            metric.value,
-                            metric.duration_ms,
-                            json.dumps(metric.dimensions),
-                            json.dumps(metric.metadata),
-                        ),
+        # One clock read per batch for metrics sent without a timestamp
+        batch_timestamp = datetime.fromtimestamp(time.time_ns() / 1e9, UTC).isoformat()
+
+        metric_rows = []
+        specialized_rows: dict[str, list[tuple]] = {
+            metric_type: [] for metric_type in _SPECIALIZED_INSERTS
+        }
+        for metric_data in metrics_batch:
+            metric = metric_data["metric"]
+            request = metric_data["request"]
+            request_id = metric_data["request_id"]
+            timestamp = (
+                metric.timestamp.isoformat() if metric.timestamp is not None else batch_timestamp
+            )
+
+            metric_rows.append(
+                (
+                    request_id,
+                    request.service,
+                    request.version,
+                    request.instance_id,
+                    metric.type.value,
+                    timestamp,
+                    metric.value,
+                    metric.duration_ms,
+                    _dumps_json(metric.dimensions),
+                    _dumps_json(metric.metadata),
+                )
+            )
+
+            specialized = _SPECIALIZED_INSERTS.get(metric.type.value)
+            if specialized is not None:
+                _, dimension_keys, metadata_keys = specialized
+                specialized_rows[metric.type.value].append(
+                    (
+                        request_id,
+                        timestamp,
+                        request.service,
+                        metric.duration_ms,
+                        *map(metric.dimensions.get, dimension_keys),
+                        *map(metric.metadata.get, metadata_keys),
                     )
+                )
 
-                    # Store in specialized table based on type
-                    await self._store_specialized_metric(db, metric, request, request_id)
+        async with self.writer() as db:
+            try:
+                await db.execute("BEGIN IMMEDIATE")
+                await db.executemany(_INSERT_METRIC_SQL, metric_rows)
+                for metric_type, rows in specialized_rows.items():
+                    if rows:
+                        await db.executemany(_SPECIALIZED_INSERTS[metric_type][0], rows)
 
                 await db.commit()
                 logger.debug(f"Stored batch of {len(metrics_batch)} metrics to container DB")
@@ -276,85 +470,10 @@ class MetricsStorage:
                 logger.error(f"Failed to store metrics batch: {e}")
                 raise
 
-    async def _store_specialized_metric(self, db, metric, request, request_id):
-        """Store metric in specialized table based on type."""
-        if metric.type.value == "auth_request":
-            await db.execute(
-                """
-                INSERT INTO auth_metrics (
-                    request_id, timestamp, service, duration_ms,
-                    success, method, server, user_hash, error_code
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    request_id,
-                    metric.timestamp.isoformat(),
-                    request.service,
-                    metric.duration_ms,
-                    metric.dimensions.get("success"),
-                    metric.dimensions.get("method"),
-                    metric.dimensions.get("server"),
-                    metric.dimensions.get("user_hash"),
-                    metric.metadata.get("error_code"),
-                ),
-            )
-
-        elif metric.type.value == "tool_discovery":
-            await db.execute(
-                """
-                INSERT INTO discovery_metrics (
-                    request_id, timestamp, service, duration_ms,
-                    query, results_count, top_k_services, top_n_tools,
-                    embedding_time_ms, faiss_search_time_ms
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    request_id,
-                    metric.timestamp.isoformat(),
-                    request.service,
-                    metric.duration_ms,
-                    metric.dimensions.get("query"),
-                    metric.dimensions.get("results_count"),
-                    metric.dimensions.get("top_k_services"),
-                    metric.dimensions.get("top_n_tools"),
-                    metric.metadata.get("embedding_time_ms"),
-                    metric.metadata.get("faiss_search_time_ms"),
-                ),
-            )
-
-        elif metric.type.value == "tool_execution":
-            await db.execute(
-                """
-                INSERT INTO tool_metrics (
-                    request_id, timestamp, service, duration_ms,
-                    tool_name, server_path, server_name, success,
-                    error_code, input_size_bytes, output_size_bytes,
-                    client_name, client_version, method, user_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    request_id,
-                    metric.timestamp.isoformat(),
-                    request.service,
-                    metric.duration_ms,
-                    metric.dimensions.get("tool_name"),
-                    metric.dimensions.get("server_path"),
-                    metric.dimensions.get("server_name"),
-                    metric.dimensions.get("success"),
-                    metric.metadata.get("error_code"),
-                    metric.metadata.get("input_size_bytes"),
-                    metric.metadata.get("output_size_bytes"),
-                    metric.dimensions.get("client_name"),
-                    metric.dimensions.get("client_version"),
-                    metric.dimensions.get("method"),
-                    metric.dimensions.get("user_hash"),
-                ),
-            )
-
     async def get_api_key(self, key_hash: str) -> dict[str, Any] | None:
         """Get API key details from database."""
         async with (
-            aiosqlite.connect(self.db_path) as db,
+            self.reader() as db,
             db.execute(
                 """
                 SELECT service_name, is_active, rate_limit, last_used_at
@@ -376,7 +495,7 @@ class MetricsStorage:
 
     async def update_api_key_usage(self, key_hash: str):
         """Update last_used_at timestamp for API key."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.writer() as db:
             await db.execute(
                 """
                 UPDATE api_keys
@@ -392,7 +511,7 @@ class MetricsStorage:
     ) -> bool:
         """Create a new API key in the database (idempotent - ignores if exists)."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.writer() as db:
                 # Use INSERT OR IGNORE for idempotent key setup on restarts
                 cursor = await db.execute(
                     """
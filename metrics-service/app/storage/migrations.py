@@ -371,6 +371,31 @@ class MigrationManager:
             )
         )
 
+        # Migration 6: Index the retention timestamp column
+        self.migrations.append(
+            Migration(
+                version=6,
+                name="add_retention_created_at_indexes",
+                up_sql="""
+                -- Retention cleanup, preview and stats filter on created_at
+                CREATE INDEX IF NOT EXISTS idx_metrics_created_at ON metrics(created_at);
+                CREATE INDEX IF NOT EXISTS idx_auth_created_at ON auth_metrics(created_at);
+                CREATE INDEX IF NOT EXISTS idx_discovery_created_at ON discovery_metrics(created_at);
+                CREATE INDEX IF NOT EXISTS idx_tool_created_at ON tool_metrics(created_at);
+                CREATE INDEX IF NOT EXISTS idx_metrics_hourly_created_at ON metrics_hourly(created_at);
+                CREATE INDEX IF NOT EXISTS idx_metrics_daily_created_at ON metrics_daily(created_at);
+            """,
+                down_sql="""
+                DROP INDEX IF EXISTS idx_metrics_daily_created_at;
+                DROP INDEX IF EXISTS idx_metrics_hourly_created_at;
+                DROP INDEX IF EXISTS idx_tool_created_at;
+                DROP INDEX IF EXISTS idx_discovery_created_at;
+                DROP INDEX IF EXISTS idx_auth_created_at;
+                DROP INDEX IF EXISTS idx_metrics_created_at;
+            """,
+            )
+        )
+
     async def get_current_version(self) -> int:
         """Get the current schema version from the database."""
         try:
@@ -2,6 +2,9 @@
 
 import hashlib
 import secrets
+import time
+
+from ..config import settings
 
 __all__ = [
     "generate_api_key",
@@ -16,10 +19,20 @@ def generate_api_key() -> str:
 
 
 def hash_api_key(api_key: str) -> str:
-    """Hash API key for storage."""
+    """Hash API key for storage with the configured API_KEY_HASH_ALGORITHM.
+
+    Both algorithms produce a 64-character hex digest in a single call.
+    """
+    if settings.API_KEY_HASH_ALGORITHM == "blake2b":
+        return hashlib.blake2b(api_key.encode(), digest_size=32).hexdigest()
     return hashlib.sha256(api_key.encode()).hexdigest()
 
 
 def generate_request_id() -> str:
-    """Generate a unique request ID."""
-    return f"req_{secrets.token_hex(8)}"
+    """Generate a unique, time-ordered request ID.
+
+    Like UUIDv7, the ID starts with a 48-bit millisecond timestamp followed
+    by random bits, so IDs sort by creation time and stay sequential if
+    request_id is ever indexed.
+    """
+    return f"req_{time.time_ns() // 1_000_000:012x}{secrets.token_hex(5)}"
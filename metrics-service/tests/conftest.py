@@ -15,8 +15,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from datetime import datetime
 
+from app.api.auth import clear_api_key_cache
 from app.config import settings
 from app.core.models import Metric, MetricRequest, MetricType
+from app.core.retention import retention_manager
 from app.storage.database import MetricsStorage, get_storage, init_database
 import app.storage.database as db_module
 from app.utils.helpers import hash_api_key
@@ -30,6 +32,36 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+async def close_storage_pools(monkeypatch):
+    """Close pooled storage connections after each test.
+
+    Pooled aiosqlite connections run on worker threads that must not outlive
+    the test's event loop, so every MetricsStorage the test creates is tracked.
+    """
+    storages = [retention_manager.storage, db_module._storage_instance]
+    original_init = MetricsStorage.__init__
+
+    def tracking_init(self):
+        original_init(self)
+        storages.append(self)
+
+    monkeypatch.setattr(MetricsStorage, "__init__", tracking_init)
+
+    yield
+
+    for storage in {id(s): s for s in storages if s is not None}.values():
+        await storage.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_api_key_cache():
+    """Start every test without cached API key records."""
+    clear_api_key_cache()
+    yield
+    clear_api_key_cache()
+
+
 @pytest.fixture
 def temp_db():
     """Create a temporary database for testing."""
@@ -1,8 +1,11 @@
 """Tests for API endpoints."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from app.config import settings
+from app.core.processor import MetricsBackpressureError
 from app.main import app
 from fastapi.testclient import TestClient
 
@@ -115,6 +118,8 @@ class TestMetricsEndpoint:
         assert data["rejected"] == 0
         assert data["errors"] == []
         assert "request_id" in data
+        assert response.headers["X-RateLimit-Limit"] == "1000"
+        assert "X-RateLimit-Remaining" in response.headers
 
     @patch("app.api.auth.get_storage")
     def test_metrics_with_invalid_payload(self, mock_get_storage, client):
@@ -183,6 +188,18 @@ class TestMetricsEndpoint:
 
         response = client.post("/metrics", json=invalid_payload, headers=headers)
         assert response.status_code == 422  # Validation error
+        assert [error["loc"] for error in response.json()["detail"]] == [
+            ["body", "metrics", 0, "type"]
+        ]
+
+    def test_metrics_request_body_documented(self):
+        """Test the /metrics request body schema is published in OpenAPI."""
+        operation = app.openapi()["paths"]["/metrics"]["post"]
+
+        schema = operation["requestBody"]["content"]["application/json"]["schema"]
+        assert operation["requestBody"]["required"] is True
+        assert schema["title"] == "MetricRequest"
+        assert {"service", "metrics"} <= set(schema["required"])
 
     @patch("app.api.auth.get_storage")
     @patch("app.api.routes.processor")
@@ -210,6 +227,91 @@ class TestMetricsEndpoint:
         assert response.status_code == 500
         assert "Internal server error" in response.json()["detail"]
 
+    @patch("app.api.auth.get_storage")
+    @patch("app.api.routes.processor")
+    def test_metrics_queue_full_returns_429(
+        self, mock_processor, mock_get_storage, client, valid_metric_request
+    ):
+        """Test metrics endpoint applies backpressure when the queue is full."""
+        mock_storage = AsyncMock()
+        mock_storage.get_api_key.return_value = {
+            "service_name": "test-service",
+            "is_active": True,
+            "rate_limit": 1000,
+            "last_used_at": None,
+        }
+        mock_storage.update_api_key_usage.return_value = None
+        mock_get_storage.return_value = mock_storage
+
+        mock_processor.process_metrics = AsyncMock(
+            side_effect=MetricsBackpressureError("Metrics queue full (10/10)")
+        )
+
+        headers = {"X-API-Key": "test_key_123"}
+        response = client.post("/metrics", json=valid_metric_request, headers=headers)
+
+        assert response.status_code == 429
+        assert "Retry-After" in response.headers
+
+    @patch("app.api.auth.get_storage")
+    @patch("app.api.routes.processor")
+    def test_large_metrics_body_validated_off_loop(
+        self, mock_processor, mock_get_storage, client, valid_metric_request, monkeypatch
+    ):
+        """Test bodies above the offload threshold are validated in a worker thread."""
+        mock_storage = AsyncMock()
+        mock_storage.get_api_key.return_value = {
+            "service_name": "test-service",
+            "is_active": True,
+            "rate_limit": 1000,
+            "last_used_at": None,
+        }
+        mock_storage.update_api_key_usage.return_value = None
+        mock_get_storage.return_value = mock_storage
+
+        mock_result = AsyncMock()
+        mock_result.accepted = 1
+        mock_result.rejected = 0
+        mock_result.errors = []
+        mock_processor.process_metrics = AsyncMock(return_value=mock_result)
+
+        monkeypatch.setattr(settings, "METRICS_PARSE_OFFLOAD_BYTES", 1)
+        with patch("app.api.routes.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            headers = {"X-API-Key": "test_key_123"}
+            response = client.post("/metrics", json=valid_metric_request, headers=headers)
+
+        assert response.status_code == 200
+        to_thread.assert_called_once()
+        parsed = mock_processor.process_metrics.call_args.args[0]
+        assert parsed.service == valid_metric_request["service"]
+
+    @patch("app.api.auth.get_storage")
+    @patch("app.api.routes.processor")
+    def test_oversized_metrics_body_returns_413(
+        self, mock_processor, mock_get_storage, client, valid_metric_request, monkeypatch
+    ):
+        """Test bodies over MAX_REQUEST_SIZE are rejected before processing."""
+        mock_storage = AsyncMock()
+        mock_storage.get_api_key.return_value = {
+            "service_name": "test-service",
+            "is_active": True,
+            "rate_limit": 1000,
+            "last_used_at": None,
+        }
+        mock_storage.update_api_key_usage.return_value = None
+        mock_get_storage.return_value = mock_storage
+        mock_processor.process_metrics = AsyncMock()
+
+        monkeypatch.setattr(settings, "MAX_REQUEST_SIZE", "1KB")
+        monkeypatch.setattr(settings, "MAX_REQUEST_BYTES", 1024)
+        valid_metric_request["metrics"] = valid_metric_request["metrics"] * 50
+
+        headers = {"X-API-Key": "test_key_123"}
+        response = client.post("/metrics", json=valid_metric_request, headers=headers)
+
+        assert response.status_code == 413
+        mock_processor.process_metrics.assert_not_called()
+
     @patch("app.api.auth.get_storage")
     @patch("app.api.routes.MetricsProcessor")
     def test_metrics_with_multiple_metrics(self, mock_processor_class, mock_get_storage, client):
@@ -3,7 +3,8 @@
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from app.api.auth import verify_api_key
+from app.api.auth import clear_api_key_cache, verify_api_key
+from app.config import settings
 from app.main import app
 from app.utils.helpers import hash_api_key
 from fastapi import HTTPException
@@ -121,6 +122,34 @@ class TestAPIKeyVerification:
         expected_hash = hash_api_key("test_key_123")
         mock_storage.update_api_key_usage.assert_called_once_with(expected_hash)
 
+    @patch("app.api.auth.get_storage")
+    async def test_verified_api_key_record_is_cached(self, mock_get_storage):
+        """Test that repeat verifications reuse the cached key record."""
+        mock_storage = AsyncMock()
+        mock_storage.get_api_key.return_value = {
+            "service_name": "test-service",
+            "is_active": True,
+            "rate_limit": 1000,
+            "last_used_at": None,
+        }
+        mock_get_storage.return_value = mock_storage
+
+        from unittest.mock import MagicMock
+
+        mock_request = MagicMock()
+        mock_request.headers = {"X-API-Key": "test_key_123"}
+
+        await verify_api_key(mock_request)
+        await verify_api_key(mock_request)
+
+        mock_storage.get_api_key.assert_called_once()
+        assert mock_storage.update_api_key_usage.call_count == 2
+
+        clear_api_key_cache()
+        await verify_api_key(mock_request)
+
+        assert mock_storage.get_api_key.call_count == 2
+
 
 class TestAPIKeyHashingHelpers:
     """Test API key hashing helper functions."""
@@ -150,6 +179,17 @@ class TestAPIKeyHashingHelpers:
         assert len(hash_result) == 64
         assert hash_result == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
+    def test_hash_with_blake2b(self, monkeypatch):
+        """Test BLAKE2b hashing when selected by API_KEY_HASH_ALGORITHM."""
+        sha256_hash = hash_api_key("test_key_12345")
+        monkeypatch.setattr(settings, "API_KEY_HASH_ALGORITHM", "blake2b")
+
+        blake2b_hash = hash_api_key("test_key_12345")
+
+        assert len(blake2b_hash) == 64
+        assert blake2b_hash != sha256_hash
+        assert blake2b_hash == hash_api_key("test_key_12345")
+
 
 class TestAuthenticationIntegration:
     """Test authentication integration with API endpoints."""
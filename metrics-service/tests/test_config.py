@@ -0,0 +1,23 @@
+"""Tests for application settings validation."""
+
+import pytest
+from app.config import Settings
+from pydantic import ValidationError
+
+
+class TestMaxRequestSize:
+    """Tests for MAX_REQUEST_SIZE parsing."""
+
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [("10MB", 10 * 1024**2), ("1kb", 1024), (" 2 GB ", 2 * 1024**3), ("512", 512)],
+    )
+    def test_valid_sizes_convert_to_bytes(self, size, expected):
+        """Test sizes with and without units convert to a byte count."""
+        assert Settings(MAX_REQUEST_SIZE=size).MAX_REQUEST_BYTES == expected
+
+    @pytest.mark.parametrize("size", ["10 MiB", "big", "", "0MB", "-1KB"])
+    def test_invalid_sizes_fail_at_startup(self, size):
+        """Test a malformed size is rejected when settings are loaded."""
+        with pytest.raises(ValidationError):
+            Settings(MAX_REQUEST_SIZE=size)
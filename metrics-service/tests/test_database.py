@@ -1,5 +1,9 @@
 """Tests for database storage layer."""
 
+import sqlite3
+from datetime import UTC, datetime
+
+import pytest
 from app.core.models import Metric, MetricRequest, MetricType
 from app.storage.database import MetricsStorage, init_database, wait_for_database
 from app.utils.helpers import hash_api_key
@@ -22,6 +26,16 @@ class TestDatabaseInitialization:
         storage = MetricsStorage()
         assert storage is not None
 
+    async def test_retention_scans_use_created_at_index(self, initialized_db):
+        """Test that retention's created_at filter is an index range scan."""
+        with sqlite3.connect(initialized_db) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT rowid FROM metrics "
+                "WHERE created_at < datetime('now', '-90 days') LIMIT 100"
+            ).fetchall()
+
+        assert "idx_metrics_created_at" in plan[0][3]
+
 
 class TestAPIKeyManagement:
     """Test API key storage and validation."""
@@ -147,3 +161,103 @@ class TestMetricsStorage:
 
         # Should store discovery metric without exceptions
         await storage.store_metrics_batch(metrics_batch)
+
+    async def test_store_batch_writes_every_table(self, initialized_db):
+        """Test that a mixed batch lands in the metrics and specialized tables."""
+        storage = MetricsStorage()
+
+        metrics = [
+            Metric(type=MetricType.AUTH_REQUEST, value=1.0, dimensions={"success": True}),
+            Metric(type=MetricType.AUTH_REQUEST, value=1.0, dimensions={"success": False}),
+            Metric(
+                type=MetricType.TOOL_EXECUTION,
+                value=1.0,
+                dimensions={"tool_name": "calc", "client_name": "cli"},
+                metadata={"output_size_bytes": 42},
+            ),
+            Metric(type=MetricType.HEALTH_CHECK, value=1.0, metadata={"big": 2**70}),
+        ]
+        request = MetricRequest(service="batch-service", metrics=metrics)
+
+        await storage.store_metrics_batch(
+            [{"metric": m, "request": request, "request_id": "batch_2"} for m in metrics]
+        )
+
+        async with storage.reader() as db:
+            counts = {}
+            for table in ("metrics", "auth_metrics", "tool_metrics", "discovery_metrics"):
+                cursor = await db.execute(f"SELECT COUNT(*) FROM {table}")
+                counts[table] = (await cursor.fetchone())[0]
+
+            cursor = await db.execute(
+                "SELECT tool_name, client_name, output_size_bytes, error_code FROM tool_metrics"
+            )
+            tool_row = await cursor.fetchone()
+
+        assert counts == {
+            "metrics": 4,
+            "auth_metrics": 2,
+            "tool_metrics": 1,
+            "discovery_metrics": 0,
+        }
+        assert tool_row == ("calc", "cli", 42, None)
+
+    async def test_store_batch_stamps_missing_timestamps(self, initialized_db):
+        """Test that metrics without a timestamp share one batch timestamp."""
+        storage = MetricsStorage()
+
+        sent_at = datetime(2024, 1, 1, tzinfo=UTC)
+        metrics = [
+            Metric(type=MetricType.CUSTOM, value=1.0),
+            Metric(type=MetricType.CUSTOM, value=2.0),
+            Metric(type=MetricType.CUSTOM, value=3.0, timestamp=sent_at),
+        ]
+        request = MetricRequest(service="stamp-service", metrics=metrics)
+
+        await storage.store_metrics_batch(
+            [{"metric": m, "request": request, "request_id": "batch_3"} for m in metrics]
+        )
+
+        async with storage.reader() as db:
+            cursor = await db.execute("SELECT timestamp FROM metrics ORDER BY value")
+            stamps = [row[0] for row in await cursor.fetchall()]
+
+        assert stamps[0] == stamps[1]
+        assert stamps[0] > sent_at.isoformat()
+        assert stamps[2] == sent_at.isoformat()
+
+
+class TestConnectionPool:
+    """Test pooled writer and read-only connections."""
+
+    async def test_writer_uses_wal_journal(self, initialized_db):
+        """Test that the shared writer connection runs in WAL mode."""
+        storage = MetricsStorage()
+
+        async with storage.writer() as db:
+            cursor = await db.execute("PRAGMA journal_mode")
+            assert (await cursor.fetchone())[0] == "wal"
+
+    async def test_reader_is_read_only_and_reused(self, initialized_db):
+        """Test that readers reject writes and are returned to the pool."""
+        storage = MetricsStorage()
+
+        async with storage.reader() as db:
+            first_reader = db
+            with pytest.raises(sqlite3.OperationalError):
+                await db.execute("DELETE FROM api_keys")
+
+        async with storage.reader() as db:
+            assert db is first_reader
+
+    async def test_reopens_pool_when_db_path_changes(self, initialized_db, tmp_path):
+        """Test that reassigning db_path switches connections to the new file."""
+        storage = MetricsStorage()
+        await storage.create_api_key(hash_api_key("old_db_key"), "old-service")
+
+        storage.db_path = str(tmp_path / "other.db")
+        async with storage.writer() as db:
+            cursor = await db.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='api_keys'"
+            )
+            assert await cursor.fetchone() is None
@@ -2,8 +2,10 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+from app.config import settings
 from app.core.models import Metric, MetricRequest, MetricType
-from app.core.processor import MetricsProcessor, ProcessingResult
+from app.core.processor import MetricsBackpressureError, MetricsProcessor, ProcessingResult
 
 
 class TestProcessingResult:
@@ -39,8 +41,8 @@ class TestMetricsProcessor:
 
         processor = MetricsProcessor()
         assert processor.storage is not None
-        assert processor._buffer == []
-        assert processor._buffer_lock is not None
+        assert processor._queue.empty()
+        assert processor._flush_lock is not None
 
     @patch("app.core.processor.get_storage")
     def test_processor_initialization_with_otel(self, mock_get_storage):
@@ -236,8 +238,8 @@ class TestMetricsProcessing:
     async def test_process_metrics_storage_error(self, mock_get_storage):
         """Test processing metrics when storage fails during flush.
 
-        Note: Metrics are buffered and the storage error only occurs during flush.
-        The metric is still accepted into the buffer before storage failure.
+        Note: Metrics are queued and the storage error only occurs during flush.
+        The metric is still accepted into the queue before storage failure.
         """
         mock_storage = AsyncMock()
         mock_storage.store_metrics_batch = AsyncMock(side_effect=Exception("Storage error"))
@@ -252,15 +254,15 @@ class TestMetricsProcessing:
 
         result = await processor.process_metrics(request, "test_req_123", "test-service")
 
-        # Metric is accepted into buffer before storage - buffer flush is async
+        # Metric is accepted into the queue before storage - queue flush is async
         assert result.accepted == 1
         assert result.rejected == 0
 
         # Force flush to trigger the storage error
         await processor.force_flush()
 
-        # After failed flush, metrics are re-added to buffer for retry
-        assert len(processor._buffer) == 1
+        # After failed flush, metrics are re-queued for retry
+        assert processor._queue.qsize() == 1
 
 
 class TestOTelEmission:
@@ -357,12 +359,12 @@ class TestOTelEmission:
         await processor._emit_to_otel(metric, "test-service")
 
 
-class TestBufferedStorage:
-    """Test buffered storage logic."""
+class TestQueuedStorage:
+    """Test queued storage logic."""
 
     @patch("app.core.processor.get_storage")
-    async def test_buffer_for_storage(self, mock_get_storage):
-        """Test buffering metrics for storage."""
+    async def test_enqueue_for_storage(self, mock_get_storage):
+        """Test queueing metrics for storage."""
         mock_storage = AsyncMock()
         mock_get_storage.return_value = mock_storage
 
@@ -371,34 +373,70 @@ class TestBufferedStorage:
         metric = Metric(type=MetricType.AUTH_REQUEST, value=1.0)
         request = MetricRequest(service="test", metrics=[metric])
 
-        await processor._buffer_for_storage(metric, request, "req_123")
+        processor._enqueue_for_storage(metric, request, "req_123")
 
-        assert len(processor._buffer) == 1
-        assert processor._buffer[0]["metric"] == metric
-        assert processor._buffer[0]["request"] == request
-        assert processor._buffer[0]["request_id"] == "req_123"
+        assert processor._queue.qsize() == 1
+        queued = processor._queue.get_nowait()
+        assert queued["metric"] == metric
+        assert queued["request"] == request
+        assert queued["request_id"] == "req_123"
 
     @patch("app.core.processor.get_storage")
     async def test_force_flush(self, mock_get_storage):
-        """Test force flushing buffered metrics."""
+        """Test force flushing queued metrics."""
         mock_storage = AsyncMock()
         mock_storage.store_metrics_batch = AsyncMock()
         mock_get_storage.return_value = mock_storage
 
         processor = MetricsProcessor()
 
-        # Add some metrics to buffer
+        # Add some metrics to the queue
         metric = Metric(type=MetricType.AUTH_REQUEST, value=1.0)
         request = MetricRequest(service="test", metrics=[metric])
-        processor._buffer = [
-            {"metric": metric, "request": request, "request_id": "req_1"},
-            {"metric": metric, "request": request, "request_id": "req_2"},
-        ]
+        processor._enqueue_for_storage(metric, request, "req_1")
+        processor._enqueue_for_storage(metric, request, "req_2")
 
         await processor.force_flush()
 
-        # Buffer should be cleared after flush
-        assert len(processor._buffer) == 0
+        # Queue should be drained after flush
+        assert processor._queue.empty()
 
         # Storage should have been called
         mock_storage.store_metrics_batch.assert_called_once()
+
+    @patch("app.core.processor.get_storage")
+    async def test_force_flush_writes_in_batches(self, mock_get_storage):
+        """Test that a flush splits the queue into BATCH_SIZE batches."""
+        mock_storage = AsyncMock()
+        mock_storage.store_metrics_batch = AsyncMock()
+        mock_get_storage.return_value = mock_storage
+
+        processor = MetricsProcessor()
+
+        metric = Metric(type=MetricType.AUTH_REQUEST, value=1.0)
+        request = MetricRequest(service="test", metrics=[metric])
+        for i in range(5):
+            processor._enqueue_for_storage(metric, request, f"req_{i}")
+
+        with patch.object(settings, "BATCH_SIZE", 2):
+            await processor.force_flush()
+
+        batch_sizes = [len(c.args[0]) for c in mock_storage.store_metrics_batch.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+
+    @patch("app.core.processor.get_storage")
+    async def test_full_queue_raises_backpressure(self, mock_get_storage):
+        """Test that a request is rejected whole when the queue lacks room."""
+        mock_get_storage.return_value = AsyncMock()
+
+        with patch.object(settings, "QUEUE_MAX_SIZE", 1):
+            processor = MetricsProcessor()
+        processor.otel = None
+
+        metrics = [Metric(type=MetricType.AUTH_REQUEST, value=1.0) for _ in range(2)]
+        request = MetricRequest(service="test-service", metrics=metrics)
+
+        with pytest.raises(MetricsBackpressureError):
+            await processor.process_metrics(request, "test_req_123", "test-service")
+
+        assert processor._queue.empty()
@@ -1,5 +1,6 @@
 """Tests for rate limiting functionality."""
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, patch
 
@@ -71,15 +72,32 @@ class TestRateLimiter:
         allowed, remaining = await rate_limiter.check_rate_limit(key_hash, rate_limit)
         assert allowed is False
 
-        # Simulate time passing by directly modifying the bucket
-        # In real scenario, tokens would refill naturally
-        rate_limiter._buckets[key_hash] = (10, time.time() - 10, rate_limit)  # 10 seconds ago
-
-        # Should have tokens now
-        allowed, remaining = await rate_limiter.check_rate_limit(key_hash, rate_limit)
+        # Simulate 10 seconds passing
+        later = time.time() + 10
+        with patch("app.core.rate_limiter.time.time", return_value=later):
+            # Should have tokens now
+            allowed, remaining = await rate_limiter.check_rate_limit(key_hash, rate_limit)
         assert allowed is True
         assert remaining > 0
 
+    @pytest.mark.asyncio
+    async def test_exhausted_key_rejected_without_lock(self, rate_limiter):
+        """Test repeat requests for an empty bucket are rejected before locking."""
+        key_hash = "test_key_hash"
+        rate_limit = 1
+
+        await rate_limiter.check_rate_limit(key_hash, rate_limit)
+        allowed, _ = await rate_limiter.check_rate_limit(key_hash, rate_limit)
+        assert allowed is False
+        assert key_hash in rate_limiter._blocked_until
+
+        async with rate_limiter._lock:
+            allowed, remaining = await asyncio.wait_for(
+                rate_limiter.check_rate_limit(key_hash, rate_limit), timeout=1
+            )
+        assert allowed is False
+        assert remaining == 0
+
     @pytest.mark.asyncio
     async def test_different_keys_independent_limits(self, rate_limiter):
         """Test different API keys have independent rate limits."""
@@ -206,10 +224,7 @@ class TestRateLimitIntegration:
         # First request should be allowed
         service_name = await verify_api_key(mock_request)
         assert service_name == "test-service"
-        assert hasattr(mock_request.state, "rate_limit_remaining")
-        assert hasattr(mock_request.state, "rate_limit_limit")
-        assert mock_request.state.rate_limit_limit == 10
-        assert mock_request.state.rate_limit_remaining == 9
+        assert mock_request.state.rate_limit_headers == ("10", "9")
 
     @patch("app.api.auth.get_storage")
     @pytest.mark.asyncio
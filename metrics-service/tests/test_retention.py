@@ -1,5 +1,6 @@
 """Tests for data retention and cleanup functionality."""
 
+import asyncio
 import os
 import tempfile
 from datetime import datetime, timedelta
@@ -7,6 +8,7 @@ from datetime import datetime, timedelta
 import aiosqlite
 import pytest
 import pytest_asyncio
+from app.core import retention
 from app.core.retention import RetentionManager, RetentionPolicy
 from app.storage.migrations import MigrationManager
 
@@ -87,6 +89,14 @@ class TestRetentionPolicy:
         assert "DELETE FROM metrics" in query
         assert "created_at < datetime('now', '-90 days')" in query
 
+    def test_batched_cleanup_query(self):
+        """Test cleanup query limited to one batch of rows."""
+        policy = RetentionPolicy(table_name="metrics", retention_days=90)
+
+        query = policy.get_cleanup_query(limit=500)
+        assert "DELETE FROM metrics WHERE rowid IN" in query
+        assert "LIMIT 500" in query
+
     def test_count_query(self):
         """Test count query generation."""
         policy = RetentionPolicy(table_name="metrics", retention_days=30)
@@ -124,6 +134,19 @@ class TestRetentionManager:
         assert manager.policies["test_table"].retention_days == 60
         assert manager.policies["test_table"].is_active is True
 
+    @pytest.mark.asyncio
+    async def test_get_policies_cached_until_update(self, manager):
+        """Test serialized policies are reused until a policy changes."""
+        policies = manager.get_policies()
+        assert policies["metrics"]["retention_days"] == 90
+        assert manager.get_policies() is policies
+
+        await manager.update_policy("metrics", 30)
+
+        updated = manager.get_policies()
+        assert updated is not policies
+        assert updated["metrics"]["retention_days"] == 30
+
     @pytest.mark.asyncio
     async def test_get_cleanup_preview(self, manager, temp_db):
         """Test cleanup preview functionality."""
@@ -185,6 +208,46 @@ class TestRetentionManager:
             count = (await cursor.fetchone())[0]
             assert count == 2
 
+    @pytest.mark.asyncio
+    async def test_cleanup_table_in_batches(self, manager, temp_db, monkeypatch):
+        """Test cleanup deletes old rows across several bounded batches."""
+        monkeypatch.setattr(retention, "CLEANUP_BATCH_SIZE", 1)
+        manager.policies["test_metrics"] = RetentionPolicy(
+            table_name="test_metrics", retention_days=30
+        )
+
+        result = await manager.cleanup_table("test_metrics", dry_run=False)
+
+        assert result["status"] == "completed"
+        assert result["records_deleted"] == 2
+
+        async with aiosqlite.connect(temp_db) as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM test_metrics")
+            assert (await cursor.fetchone())[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_cleanup_job_runs_in_background(self, manager, temp_db):
+        """Test a queued cleanup job reports its result once finished."""
+        manager.policies["test_metrics"] = RetentionPolicy(
+            table_name="test_metrics", retention_days=30
+        )
+
+        job = manager.start_cleanup_job("test_metrics")
+        assert job["status"] == "queued"
+
+        await asyncio.gather(*manager._job_tasks)
+
+        finished = manager.get_job(job["job_id"])
+        assert finished["status"] == "completed"
+        assert finished["result"]["records_deleted"] == 2
+        assert manager.get_job("job_missing") is None
+
+    @pytest.mark.asyncio
+    async def test_cleanup_job_unknown_table(self, manager):
+        """Test queuing a job for a table without a policy fails immediately."""
+        with pytest.raises(ValueError, match="No retention policy found"):
+            manager.start_cleanup_job("nonexistent_table")
+
     @pytest.mark.asyncio
     async def test_cleanup_inactive_policy(self, manager):
         """Test cleanup with inactive policy."""
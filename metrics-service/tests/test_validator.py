@@ -303,6 +303,14 @@ class TestTimestampValidation:
         assert len(result.warnings) > 0
         assert "very old" in result.warnings[0]
 
+    def test_missing_timestamp_is_valid(self, validator):
+        """Test a metric without a timestamp is accepted (it is stamped on storage)."""
+        result = ValidationResult()
+
+        validator._validate_timestamp(None, "timestamp", result)
+
+        assert result.is_valid
+
 
 class TestFullRequestValidation:
     """Test complete request validation."""
@@ -255,8 +255,7 @@ def _filter_agents_by_access(
             continue
 
         if agent.visibility == "group-restricted":
-            agent_groups = set(agent.allowed_groups)
-            if agent_groups & user_groups:
+            if not user_groups.isdisjoint(agent.allowed_groups):
                 accessible.append(agent)
             continue
 
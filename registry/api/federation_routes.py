@@ -4,35 +4,144 @@ Federation configuration API routes.
 Provides endpoints to manage federation configurations.
 """
 
+import asyncio
 import logging
-from datetime import UTC
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import AfterValidator
 
 from ..auth.dependencies import nginx_proxied_auth
+from ..core.config import settings
 from ..repositories.factory import get_federation_config_repository
 from ..repositories.interfaces import FederationConfigRepositoryBase
+from ..schemas.agent_models import AgentCard
 from ..schemas.federation_schema import FederationConfig
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
-)
+from ..services.agent_service import agent_service
+from ..services.federation.anthropic_client import AnthropicFederationClient
+from ..services.federation.asor_client import AsorFederationClient
+from ..services.server_service import server_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Cached GET response bodies: {cache key: (monotonic time stored, body)}
+_response_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_cache_stats = {"hits": 0, "misses": 0}
+_LIST_CACHE_KEY = "configs"
+
+# Fetched federation servers are registered in batches of this size during sync
+_SYNC_BATCH_SIZE = 50
+
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_CONFIG_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def _validate_config_id(config_id: str) -> str:
+    """Reject malformed config IDs before they reach the repository."""
+    if _CONFIG_ID_RE.fullmatch(config_id) is None:
+        raise ValueError("config_id must be 1-64 letters, digits, '_' or '-'")
+    return config_id
+
+
+ConfigId = Annotated[str, AfterValidator(_validate_config_id)]
+
+
+def _config_cache_key(config_id: str) -> str:
+    """Cache key for a single federation config response."""
+    return f"config:{config_id}"
+
+
+def _get_cached_response(key: str) -> dict[str, Any] | None:
+    """Return a cached GET response body if it is still fresh."""
+    entry = _response_cache.get(key)
+    if entry is not None and (
+        time.monotonic() - entry[0] < settings.federation_config_cache_ttl_seconds
+    ):
+        _cache_stats["hits"] += 1
+        return entry[1]
+
+    _cache_stats["misses"] += 1
+    logger.debug(
+        f"Federation config cache miss for {key} "
+        f"(hits: {_cache_stats['hits']}, misses: {_cache_stats['misses']})"
+    )
+    return None
+
 
+def _store_cached_response(key: str, body: dict[str, Any]) -> None:
+    """Cache a GET response body."""
+    if settings.federation_config_cache_ttl_seconds > 0:
+        _response_cache[key] = (time.monotonic(), body)
+
+
+def _stale_response(key: str, error: Exception) -> ORJSONResponse | None:
+    """Build a stale-cache response for a failed repository read.
+
+    Args:
+        key: Cache key of the failed GET
+        error: Exception raised by the repository
+
+    Returns:
+        Last cached body marked with X-Cache: STALE, or None when fallback is
+        disabled or nothing was cached
+    """
+    if not settings.federation_cache_fallback:
+        return None
+
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+
+    age = time.monotonic() - entry[0]
+    logger.warning(
+        f"Federation config backend failed ({error}), serving {key} cached {age:.0f}s ago"
+    )
+    return ORJSONResponse(content=entry[1], headers={"X-Cache": "STALE"})
+
+
+def _invalidate_config_cache() -> None:
+    """Drop all cached responses after a federation config changes."""
+    _response_cache.clear()
+
+
+def _cache_saved_config(config_id: str, config: FederationConfig) -> dict[str, Any]:
+    """Invalidate cached responses and seed the cache with a just-written config.
+
+    Args:
+        config_id: Configuration ID that was written
+        config: Configuration returned by the repository
 
-def _get_federation_repo() -> FederationConfigRepositoryBase:
-    """Get federation config repository dependency."""
+    Returns:
+        The config dump, shared by the write response and the next GET
+    """
+    _invalidate_config_cache()
+    body = config.model_dump()
+    _store_cached_response(_config_cache_key(config_id), body)
+    return body
+
+
+async def _get_federation_repo() -> FederationConfigRepositoryBase:
+    """Get federation config repository dependency.
+
+    Async so FastAPI awaits it inline instead of dispatching a sync
+    dependency to the threadpool on every request; the factory already
+    returns a process-wide singleton.
+    """
     return get_federation_config_repository()
 
 
 @router.get("/federation/config", tags=["federation"], summary="Get federation configuration")
 async def get_federation_config(
-    config_id: str = "default",
+    config_id: ConfigId = "default",
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
 ) -> dict[str, Any]:
@@ -45,14 +154,26 @@ async def get_federation_config(
         repo: Federation config repository
 
     Returns:
-        Federation configuration
+        Federation configuration; with federation_cache_fallback enabled, the
+        last cached copy (X-Cache: STALE) if the repository read fails
 
     Raises:
         404: Configuration not found
     """
     logger.info(f"User {user_context['username']} retrieving federation config: {config_id}")
 
-    config = await repo.get_config(config_id)
+    cache_key = _config_cache_key(config_id)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        config = await repo.get_config(config_id)
+    except Exception as e:
+        stale = _stale_response(cache_key, e)
+        if stale is None:
+            raise
+        return stale
 
     if not config:
         raise HTTPException(
@@ -60,7 +181,9 @@ async def get_federation_config(
             detail=f"Federation config '{config_id}' not found",
         )
 
-    return config.model_dump()
+    body = config.model_dump()
+    _store_cached_response(cache_key, body)
+    return body
 
 
 @router.post(
@@ -71,7 +194,7 @@ async def get_federation_config(
 )
 async def save_federation_config(
     config: FederationConfig,
-    config_id: str = "default",
+    config_id: ConfigId = "default",
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
 ) -> dict[str, Any]:
@@ -116,12 +239,13 @@ async def save_federation_config(
 
     try:
         saved_config = await repo.save_config(config, config_id)
+        config_body = _cache_saved_config(config_id, saved_config)
         logger.info(f"Federation config saved successfully: {config_id}")
 
         return {
             "message": "Federation configuration saved successfully",
             "config_id": config_id,
-            "config": saved_config.model_dump(),
+            "config": config_body,
         }
 
     except Exception as e:
@@ -138,7 +262,7 @@ async def save_federation_config(
     summary="Update specific federation configuration",
 )
 async def update_federation_config(
-    config_id: str,
+    config_id: ConfigId,
     config: FederationConfig,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
@@ -159,12 +283,13 @@ async def update_federation_config(
 
     try:
         saved_config = await repo.save_config(config, config_id)
+        config_body = _cache_saved_config(config_id, saved_config)
         logger.info(f"Federation config updated successfully: {config_id}")
 
         return {
             "message": "Federation configuration updated successfully",
             "config_id": config_id,
-            "config": saved_config.model_dump(),
+            "config": config_body,
         }
 
     except Exception as e:
@@ -179,7 +304,7 @@ async def update_federation_config(
     "/federation/config/{config_id}", tags=["federation"], summary="Delete federation configuration"
 )
 async def delete_federation_config(
-    config_id: str,
+    config_id: ConfigId,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
 ) -> dict[str, str]:
@@ -200,6 +325,7 @@ async def delete_federation_config(
     logger.info(f"User {user_context['username']} deleting federation config: {config_id}")
 
     deleted = await repo.delete_config(config_id)
+    _invalidate_config_cache()
 
     if not deleted:
         raise HTTPException(
@@ -215,27 +341,52 @@ async def delete_federation_config(
 
 
 @router.get(
-    "/federation/configs", tags=["federation"], summary="List all federation configurations"
+    "/federation/configs",
+    tags=["federation"],
+    summary="List all federation configurations",
+    response_model=None,
 )
 async def list_federation_configs(
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
-) -> dict[str, Any]:
+    accept: Annotated[str | None, Header()] = None,
+) -> dict[str, Any] | ORJSONResponse | StreamingResponse:
     """
     List all federation configurations.
 
     Args:
         user_context: Authenticated user context
         repo: Federation config repository
+        accept: Accept header; "application/x-ndjson" streams one summary per line
 
     Returns:
-        List of configuration summaries with id, created_at, updated_at
+        List of configuration summaries with id, created_at, updated_at; with
+        federation_cache_fallback enabled, the last cached list (X-Cache: STALE)
+        if the repository read fails
     """
     logger.info(f"User {user_context['username']} listing federation configs")
 
-    configs = await repo.list_configs()
+    if accept and _NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(
+            (orjson.dumps(config) + b"\n" async for config in repo.iter_configs()),
+            media_type=_NDJSON_MEDIA_TYPE,
+        )
+
+    cached = _get_cached_response(_LIST_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    try:
+        configs = await repo.list_configs()
+    except Exception as e:
+        stale = _stale_response(_LIST_CACHE_KEY, e)
+        if stale is None:
+            raise
+        return stale
 
-    return {"configs": configs, "total": len(configs)}
+    body = {"configs": configs, "total": len(configs)}
+    _store_cached_response(_LIST_CACHE_KEY, body)
+    return body
 
 
 @router.post(
@@ -244,7 +395,7 @@ async def list_federation_configs(
     summary="Add Anthropic server to config",
 )
 async def add_anthropic_server(
-    config_id: str,
+    config_id: ConfigId,
     server_name: str,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
@@ -263,32 +414,25 @@ async def add_anthropic_server(
     """
     logger.info(f"User {user_context['username']} adding Anthropic server: {server_name}")
 
-    config = await repo.get_config(config_id)
-    if not config:
+    try:
+        saved_config = await repo.add_entry(
+            config_id, "anthropic.servers", {"name": server_name}, "name"
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Server '{server_name}' already exists in configuration",
+        )
+    if not saved_config:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Federation config '{config_id}' not found",
         )
-
-    # Check if server already exists
-    from ..schemas.federation_schema import AnthropicServerConfig
-
-    for server in config.anthropic.servers:
-        if server.name == server_name:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Server '{server_name}' already exists in configuration",
-            )
-
-    # Add new server
-    config.anthropic.servers.append(AnthropicServerConfig(name=server_name))
-
-    # Save updated config
-    saved_config = await repo.save_config(config, config_id)
+    config_body = _cache_saved_config(config_id, saved_config)
 
     return {
         "message": f"Server '{server_name}' added to Anthropic configuration",
-        "config": saved_config.model_dump(),
+        "config": config_body,
     }
 
 
@@ -298,7 +442,7 @@ async def add_anthropic_server(
     summary="Remove Anthropic server from config",
 )
 async def remove_anthropic_server(
-    config_id: str,
+    config_id: ConfigId,
     server_name: str,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
@@ -317,29 +461,23 @@ async def remove_anthropic_server(
     """
     logger.info(f"User {user_context['username']} removing Anthropic server: {server_name}")
 
-    config = await repo.get_config(config_id)
-    if not config:
+    try:
+        saved_config = await repo.remove_entry(config_id, "anthropic.servers", "name", server_name)
+    except LookupError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Federation config '{config_id}' not found",
+            detail=f"Server '{server_name}' not found in configuration",
         )
-
-    # Find and remove server
-    original_count = len(config.anthropic.servers)
-    config.anthropic.servers = [s for s in config.anthropic.servers if s.name != server_name]
-
-    if len(config.anthropic.servers) == original_count:
+    if not saved_config:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Server '{server_name}' not found in configuration",
+            detail=f"Federation config '{config_id}' not found",
         )
-
-    # Save updated config
-    saved_config = await repo.save_config(config, config_id)
+    config_body = _cache_saved_config(config_id, saved_config)
 
     return {
         "message": f"Server '{server_name}' removed from Anthropic configuration",
-        "config": saved_config.model_dump(),
+        "config": config_body,
     }
 
 
@@ -349,7 +487,7 @@ async def remove_anthropic_server(
     summary="Add ASOR agent to config",
 )
 async def add_asor_agent(
-    config_id: str,
+    config_id: ConfigId,
     agent_id: str,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
@@ -368,32 +506,23 @@ async def add_asor_agent(
     """
     logger.info(f"User {user_context['username']} adding ASOR agent: {agent_id}")
 
-    config = await repo.get_config(config_id)
-    if not config:
+    try:
+        saved_config = await repo.add_entry(config_id, "asor.agents", {"id": agent_id}, "id")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Agent '{agent_id}' already exists in configuration",
+        )
+    if not saved_config:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Federation config '{config_id}' not found",
         )
-
-    # Check if agent already exists
-    from ..schemas.federation_schema import AsorAgentConfig
-
-    for agent in config.asor.agents:
-        if agent.id == agent_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Agent '{agent_id}' already exists in configuration",
-            )
-
-    # Add new agent
-    config.asor.agents.append(AsorAgentConfig(id=agent_id))
-
-    # Save updated config
-    saved_config = await repo.save_config(config, config_id)
+    config_body = _cache_saved_config(config_id, saved_config)
 
     return {
         "message": f"Agent '{agent_id}' added to ASOR configuration",
-        "config": saved_config.model_dump(),
+        "config": config_body,
     }
 
 
@@ -403,7 +532,7 @@ async def add_asor_agent(
     summary="Remove ASOR agent from config",
 )
 async def remove_asor_agent(
-    config_id: str,
+    config_id: ConfigId,
     agent_id: str,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
@@ -422,35 +551,176 @@ async def remove_asor_agent(
     """
     logger.info(f"User {user_context['username']} removing ASOR agent: {agent_id}")
 
-    config = await repo.get_config(config_id)
-    if not config:
+    try:
+        saved_config = await repo.remove_entry(config_id, "asor.agents", "id", agent_id)
+    except LookupError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Federation config '{config_id}' not found",
+            detail=f"Agent '{agent_id}' not found in configuration",
         )
-
-    # Find and remove agent
-    original_count = len(config.asor.agents)
-    config.asor.agents = [a for a in config.asor.agents if a.id != agent_id]
-
-    if len(config.asor.agents) == original_count:
+    if not saved_config:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent '{agent_id}' not found in configuration",
+            detail=f"Federation config '{config_id}' not found",
         )
-
-    # Save updated config
-    saved_config = await repo.save_config(config, config_id)
+    config_body = _cache_saved_config(config_id, saved_config)
 
     return {
         "message": f"Agent '{agent_id}' removed from ASOR configuration",
-        "config": saved_config.model_dump(),
+        "config": config_body,
     }
 
 
+async def _register_server_batch(batch: list[dict[str, Any]], results: dict[str, Any]) -> None:
+    """Upsert and enable one batch of fetched Anthropic servers.
+
+    Args:
+        batch: Fetched server definitions
+        results: Anthropic section of the sync results, updated in place
+    """
+    synced_paths = set(await server_service.bulk_upsert_servers(batch))
+
+    for server_data in batch:
+        server_path = server_data["path"]
+        if server_path in synced_paths:
+            server_name = server_data.get("server_name", server_path)
+            logger.info("Synced Anthropic server: %s at %s", server_name, server_path)
+            results["servers"].append(server_name)
+        else:
+            logger.error("Failed to register or update server: %s", server_path)
+
+
+async def _sync_anthropic(config: FederationConfig, results: dict[str, Any]) -> None:
+    """Import servers from the Anthropic MCP Registry.
+
+    A producer task pulls servers off the client as they are fetched and a
+    consumer registers them in batches, so writes overlap the remaining
+    fetches and at most a couple of batches are held in memory.
+
+    Args:
+        config: Federation configuration
+        results: Anthropic section of the sync results, updated in place
+    """
+    logger.info("Syncing servers from Anthropic MCP Registry...")
+
+    anthropic_client = AnthropicFederationClient(endpoint=config.anthropic.endpoint)
+    queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=_SYNC_BATCH_SIZE)
+    servers = anthropic_client.iter_servers(config.anthropic.servers)
+    # A single worker steps the generator, so closing it waits for any in-flight next()
+    fetch_executor = ThreadPoolExecutor(max_workers=1)
+    loop = asyncio.get_running_loop()
+
+    async def produce() -> None:
+        while (
+            server_data := await loop.run_in_executor(fetch_executor, next, servers, None)
+        ) is not None:
+            await queue.put(server_data)
+        await queue.put(None)
+
+    async def consume() -> None:
+        batch = []
+        while (server_data := await queue.get()) is not None:
+            if not server_data.get("path"):
+                logger.warning("Server missing path: %s, skipping", server_data.get("server_name"))
+                continue
+            batch.append(server_data)
+            if len(batch) >= _SYNC_BATCH_SIZE:
+                await _register_server_batch(batch, results)
+                batch = []
+        if batch:
+            await _register_server_batch(batch, results)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            tg.create_task(consume())
+    except* Exception as eg:
+        # Report the underlying failure, not the TaskGroup's ExceptionGroup wrapper
+        raise eg.exceptions[0]
+    finally:
+        # Stop outstanding fetches if registration failed before the generator finished
+        await loop.run_in_executor(fetch_executor, servers.close)
+        fetch_executor.shutdown(wait=False)
+
+    results["count"] = len(results["servers"])
+    logger.info(f"Synced {results['count']} servers from Anthropic")
+
+
+async def _sync_asor(config: FederationConfig, results: dict[str, Any]) -> None:
+    """Import agents from ASOR.
+
+    Args:
+        config: Federation configuration
+        results: ASOR section of the sync results, updated in place
+    """
+    logger.info("Syncing agents from ASOR...")
+
+    tenant_url = (
+        config.asor.endpoint.split("/api")[0]
+        if "/api" in config.asor.endpoint
+        else config.asor.endpoint
+    )
+
+    asor_client = AsorFederationClient(
+        endpoint=config.asor.endpoint,
+        auth_env_var=config.asor.auth_env_var,
+        tenant_url=tenant_url,
+    )
+
+    agents = await asyncio.to_thread(asor_client.fetch_all_agents, config.asor.agents)
+
+    # Register agents
+    for agent_data in agents:
+        try:
+            agent_name = agent_data.get("name", "Unknown ASOR Agent")
+            agent_path = f"/{agent_name.lower().replace('_', '-')}"
+
+            # Skip known agents before building a card for them
+            if agent_path in agent_service.registered_agents:
+                logger.debug("ASOR agent %s already exists, skipping registration", agent_path)
+                continue
+
+            # Extract skills
+            skills = [
+                {
+                    "name": skill.get("name", ""),
+                    "description": skill.get("description", ""),
+                    "id": skill.get("id", ""),
+                }
+                for skill in agent_data.get("skills", [])
+            ]
+
+            agent_card = AgentCard(
+                protocol_version="1.0",
+                name=agent_name,
+                path=agent_path,
+                url=agent_data.get("url", ""),
+                description=agent_data.get("description", f"ASOR agent: {agent_name}"),
+                version=agent_data.get("version", "1.0.0"),
+                provider="ASOR",
+                author="ASOR",
+                license="Unknown",
+                skills=skills,
+                tags=["asor", "federated", "workday"],
+                visibility="public",
+                registered_by="asor-federation",
+                registered_at=datetime.now(UTC),
+            )
+
+            await agent_service.register_agent(agent_card)
+            logger.info("Synced ASOR agent: %s", agent_name)
+            results["agents"].append(agent_name)
+
+        except Exception as e:
+            logger.error("Failed to sync ASOR agent %s: %s", agent_data.get("name", "unknown"), e)
+
+    results["count"] = len(results["agents"])
+    logger.info(f"Synced {results['count']} agents from ASOR")
+
+
 @router.post("/federation/sync", tags=["federation"], summary="Trigger manual federation sync")
 async def sync_federation(
-    config_id: str = "default",
+    config_id: ConfigId = "default",
     source: str | None = None,
     user_context: Annotated[dict, Depends(nginx_proxied_auth)] = None,
     repo: FederationConfigRepositoryBase = Depends(_get_federation_repo),
@@ -488,132 +758,30 @@ async def sync_federation(
             detail=f"Federation config '{config_id}' not found",
         )
 
-    try:
-        # Import federation clients
-        from ..services.federation.anthropic_client import AnthropicFederationClient
-        from ..services.federation.asor_client import AsorFederationClient
-
-        results = {"anthropic": {"servers": [], "count": 0}, "asor": {"agents": [], "count": 0}}
-
-        # Sync Anthropic servers if enabled and requested
-        if (source is None or source == "anthropic") and config.anthropic.enabled:
-            logger.info("Syncing servers from Anthropic MCP Registry...")
-
-            anthropic_client = AnthropicFederationClient(endpoint=config.anthropic.endpoint)
-
-            servers = anthropic_client.fetch_all_servers(config.anthropic.servers)
-
-            # Register servers via server service
-            from ..services.server_service import server_service
-
-            for server_data in servers:
-                try:
-                    server_path = server_data.get("path")
-                    if not server_path:
-                        logger.warning(
-                            f"Server missing path: {server_data.get('server_name')}, skipping"
-                        )
-                        continue
-
-                    # Register server
-                    # server_data already includes the "path" field
-                    success = await server_service.register_server(server_data)
-
-                    if not success:
-                        logger.warning(
-                            f"Server already exists or failed to register: {server_path}"
-                        )
-                        # Try updating instead
-                        success = await server_service.update_server(server_path, server_data)
-
-                    if success:
-                        # Enable the server
-                        await server_service.toggle_service(server_path, True)
-
-                        server_name = server_data.get("server_name", server_path)
-                        logger.info(f"Synced Anthropic server: {server_name} at {server_path}")
-                        results["anthropic"]["servers"].append(server_name)
-                    else:
-                        logger.error(f"Failed to register or update server: {server_path}")
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to sync Anthropic server {server_data.get('server_name', 'unknown')}: {e}"
-                    )
-
-            results["anthropic"]["count"] = len(results["anthropic"]["servers"])
-            logger.info(f"Synced {results['anthropic']['count']} servers from Anthropic")
-
-        # Sync ASOR agents if enabled and requested
-        if (source is None or source == "asor") and config.asor.enabled:
-            logger.info("Syncing agents from ASOR...")
-
-            tenant_url = (
-                config.asor.endpoint.split("/api")[0]
-                if "/api" in config.asor.endpoint
-                else config.asor.endpoint
-            )
+    results = {"anthropic": {"servers": [], "count": 0}, "asor": {"agents": [], "count": 0}}
+    sync_anthropic = source in (None, "anthropic") and config.anthropic.enabled
+    sync_asor = source in (None, "asor") and config.asor.enabled
 
-            asor_client = AsorFederationClient(
-                endpoint=config.asor.endpoint,
-                auth_env_var=config.asor.auth_env_var,
-                tenant_url=tenant_url,
-            )
+    if not (sync_anthropic or sync_asor):
+        logger.info(f"No enabled federation source to sync for {config_id} (source: {source})")
+        return {
+            "message": "Nothing to sync",
+            "config_id": config_id,
+            "results": results,
+            "total_synced": 0,
+        }
 
-            agents = asor_client.fetch_all_agents(config.asor.agents)
-
-            # Register agents
-            from datetime import datetime
-
-            from ..schemas.agent_models import AgentCard
-            from ..services.agent_service import agent_service
-
-            for agent_data in agents:
-                try:
-                    agent_name = agent_data.get("name", "Unknown ASOR Agent")
-                    agent_path = f"/{agent_name.lower().replace('_', '-')}"
-
-                    # Extract skills
-                    skills_data = agent_data.get("skills", [])
-                    skills = []
-                    for skill in skills_data:
-                        skills.append(
-                            {
-                                "name": skill.get("name", ""),
-                                "description": skill.get("description", ""),
-                                "id": skill.get("id", ""),
-                            }
-                        )
-
-                    agent_card = AgentCard(
-                        protocol_version="1.0",
-                        name=agent_name,
-                        path=agent_path,
-                        url=agent_data.get("url", ""),
-                        description=agent_data.get("description", f"ASOR agent: {agent_name}"),
-                        version=agent_data.get("version", "1.0.0"),
-                        provider="ASOR",
-                        author="ASOR",
-                        license="Unknown",
-                        skills=skills,
-                        tags=["asor", "federated", "workday"],
-                        visibility="public",
-                        registered_by="asor-federation",
-                        registered_at=datetime.now(UTC),
-                    )
-
-                    if agent_path not in agent_service.registered_agents:
-                        await agent_service.register_agent(agent_card)
-                        logger.info(f"Synced ASOR agent: {agent_name}")
-                        results["asor"]["agents"].append(agent_name)
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to sync ASOR agent {agent_data.get('name', 'unknown')}: {e}"
-                    )
-
-            results["asor"]["count"] = len(results["asor"]["agents"])
-            logger.info(f"Synced {results['asor']['count']} agents from ASOR")
+    try:
+        # Sync enabled sources concurrently; each coroutine writes only its own results key
+        tasks = []
+        if sync_anthropic:
+            tasks.append(_sync_anthropic(config, results["anthropic"]))
+        if sync_asor:
+            tasks.append(_sync_asor(config, results["asor"]))
+
+        for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                raise outcome
 
         return {
             "message": "Federation sync completed",
@@ -1,7 +1,10 @@
+import asyncio
 import logging
-from typing import Annotated, Literal
+from collections.abc import Set as AbstractSet
+from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ..auth.dependencies import nginx_proxied_auth
@@ -12,10 +15,13 @@ from ..services.server_service import server_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 EntityType = Literal["mcp_server", "tool", "a2a_agent"]
 
+# Entity types searched when the request does not filter
+_DEFAULT_ENTITY_TYPES: tuple[EntityType, ...] = ("mcp_server", "tool", "a2a_agent")
+
 
 def get_search_repo() -> SearchRepositoryBase:
     """Dependency injection function for search repository."""
@@ -90,6 +96,14 @@ class SemanticSearchResponse(BaseModel):
     total_agents: int = 0
 
 
+def _coalesce(*values: Any, default: Any) -> Any:
+    """Return the first truthy value, or default if none is."""
+    for value in values:
+        if value:
+            return value
+    return default
+
+
 async def _user_can_access_server(path: str, server_name: str, user_context: dict) -> bool:
     """Validate whether the current user can view the specified server."""
     if user_context.get("is_admin"):
@@ -102,29 +116,33 @@ async def _user_can_access_server(path: str, server_name: str, user_context: dic
     if not accessible_servers:
         return False
 
+    # Direct name matches need no server lookup
+    technical_name = path.strip("/")
+    if technical_name in accessible_servers or (
+        bool(server_name) and server_name in accessible_servers
+    ):
+        return True
+
     try:
-        if await server_service.user_can_access_server_path(path, accessible_servers):
-            return True
+        return await server_service.user_can_access_server_path(path, accessible_servers)
     except Exception:
-        # Fall through to string comparisons if server lookup failed
         logger.debug("Unable to validate server path via service for %s", path, exc_info=True)
+        return False
 
-    technical_name = path.strip("/")
-    return technical_name in accessible_servers or (
-        bool(server_name) and server_name in accessible_servers
-    )
 
+def _agent_listed_for_user(agent_path: str, user_context: dict) -> bool:
+    """Check whether the agent path is within the user's accessible agents."""
+    accessible_agents = user_context.get("accessible_agents") or []
+    return "all" in accessible_agents or agent_path in accessible_agents
 
-async def _user_can_access_agent(agent_path: str, user_context: dict) -> bool:
-    """Validate user access for a given agent."""
-    if user_context.get("is_admin"):
-        return True
 
-    accessible_agents = user_context.get("accessible_agents") or []
-    if "all" not in accessible_agents and agent_path not in accessible_agents:
-        return False
+def _agent_card_visible_to_user(
+    agent_card, user_context: dict, user_groups: AbstractSet[str] | None = None
+) -> bool:
+    """Apply the agent card's visibility rules to the current user.
 
-    agent_card = await agent_service.get_agent_info(agent_path)
+    Callers checking many cards can pass the user's groups as a prebuilt set.
+    """
     if not agent_card:
         return False
 
@@ -135,13 +153,26 @@ async def _user_can_access_agent(agent_path: str, user_context: dict) -> bool:
         return agent_card.registered_by == user_context.get("username")
 
     if agent_card.visibility == "group-restricted":
-        allowed_groups = set(agent_card.allowed_groups)
-        user_groups = set(user_context.get("groups", []))
-        return bool(allowed_groups & user_groups)
+        if user_groups is None:
+            user_groups = set(user_context.get("groups", []))
+        return not user_groups.isdisjoint(agent_card.allowed_groups)
 
     return False
 
 
+def _search_access_scope(user_context: dict) -> tuple[list[str] | None, list[str] | None]:
+    """Return the (servers, agents) lists to restrict search to, None meaning no limit."""
+    if user_context.get("is_admin"):
+        return None, None
+
+    accessible_servers = list(user_context.get("accessible_servers") or [])
+    accessible_agents = list(user_context.get("accessible_agents") or [])
+    return (
+        None if "all" in accessible_servers else accessible_servers,
+        None if "all" in accessible_agents else accessible_agents,
+    )
+
+
 @router.post(
     "/semantic",
     response_model=SemanticSearchResponse,
@@ -155,24 +186,25 @@ async def semantic_search(
     """
     Run a semantic search against MCP servers (and their tools) using FAISS embeddings.
     """
+    # Use provided entity_types or default to searching all types
+    entity_types: list[str] = list(request.entity_types or _DEFAULT_ENTITY_TYPES)
     logger.info(
         "Semantic search requested by %s (entities=%s, max=%s)",
         user_context.get("username"),
-        request.entity_types or ["mcp_server", "tool"],
+        entity_types,
         request.max_results,
     )
 
     try:
-        # Use provided entity_types or default to searching all types
-        entity_types: list[str] = (
-            list(request.entity_types)
-            if request.entity_types
-            else ["mcp_server", "tool", "a2a_agent"]
-        )
+        # Let the backend skip inaccessible entities so they don't crowd out
+        # accessible ones; the checks below still verify every result.
+        accessible_servers, accessible_agents = _search_access_scope(user_context)
         raw_results = await search_repo.search(
             query=request.query,
             entity_types=entity_types,
             max_results=request.max_results,
+            accessible_servers=accessible_servers,
+            accessible_agents=accessible_agents,
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
@@ -183,29 +215,64 @@ async def semantic_search(
             detail="Semantic search is temporarily unavailable. Please try again later.",
         ) from exc
 
+    raw_servers = raw_results.get("servers", [])
+    raw_tools = raw_results.get("tools", [])
+    raw_agents = raw_results.get("agents", [])
+
+    # Resolve access decisions once per unique server, concurrently, instead of
+    # awaiting one lookup per result.
+    server_keys = list(
+        dict.fromkeys(
+            [(server.get("path", ""), server.get("server_name", "")) for server in raw_servers]
+            + [(tool.get("server_path", ""), tool.get("server_name", "")) for tool in raw_tools]
+        )
+    )
+    server_decisions = await asyncio.gather(
+        *(_user_can_access_server(path, name, user_context) for path, name in server_keys)
+    )
+    server_access = dict(zip(server_keys, server_decisions))
+
+    # Fetch each candidate agent card once; it serves both the visibility check
+    # and the result fields below.
+    is_admin = bool(user_context.get("is_admin"))
+    agent_paths = list(
+        dict.fromkeys(
+            agent["path"]
+            for agent in raw_agents
+            if agent.get("path")
+            and (is_admin or _agent_listed_for_user(agent["path"], user_context))
+        )
+    )
+    agent_card_objs = await asyncio.gather(
+        *(agent_service.get_cached_agent_info(path) for path in agent_paths)
+    )
+    agent_cards = dict(zip(agent_paths, agent_card_objs))
+    user_groups = frozenset(user_context.get("groups", []))
+
+    # Result rows come from the search repository already shaped and scored, so
+    # they are built without per-object validation; the response model is still
+    # validated on the way out.
     filtered_servers: list[ServerSearchResult] = []
-    for server in raw_results.get("servers", []):
-        if not await _user_can_access_server(
-            server.get("path", ""),
-            server.get("server_name", ""),
-            user_context,
-        ):
+    for server in raw_servers:
+        path = server.get("path", "")
+        server_name = server.get("server_name", "")
+        if not server_access[(path, server_name)]:
             continue
 
         matching_tools = [
-            MatchingToolResult(
+            MatchingToolResult.model_construct(
                 tool_name=tool.get("tool_name", ""),
                 description=tool.get("description"),
                 relevance_score=tool.get("relevance_score", 0.0),
                 match_context=tool.get("match_context"),
             )
-            for tool in server.get("matching_tools", [])
+            for tool in server.get("matching_tools", ())
         ]
 
         filtered_servers.append(
-            ServerSearchResult(
-                path=server.get("path", ""),
-                server_name=server.get("server_name", ""),
+            ServerSearchResult.model_construct(
+                path=path,
+                server_name=server_name,
                 description=server.get("description"),
                 tags=server.get("tags", []),
                 num_tools=server.get("num_tools", 0),
@@ -217,14 +284,14 @@ async def semantic_search(
         )
 
     filtered_tools: list[ToolSearchResult] = []
-    for tool in raw_results.get("tools", []):
+    for tool in raw_tools:
         server_path = tool.get("server_path", "")
         server_name = tool.get("server_name", "")
-        if not await _user_can_access_server(server_path, server_name, user_context):
+        if not server_access[(server_path, server_name)]:
             continue
 
         filtered_tools.append(
-            ToolSearchResult(
+            ToolSearchResult.model_construct(
                 server_path=server_path,
                 server_name=server_name,
                 tool_name=tool.get("tool_name", ""),
@@ -236,32 +303,38 @@ async def semantic_search(
         )
 
     filtered_agents: list[AgentSearchResult] = []
-    for agent in raw_results.get("agents", []):
+    for agent in raw_agents:
         agent_path = agent.get("path", "")
-        if not agent_path:
+        if agent_path not in agent_cards:
             continue
 
-        if not await _user_can_access_agent(agent_path, user_context):
+        agent_card_obj = agent_cards[agent_path]
+        if not is_admin and not _agent_card_visible_to_user(
+            agent_card_obj, user_context, user_groups
+        ):
             continue
 
-        agent_card_obj = await agent_service.get_agent_info(agent_path)
         agent_card_dict = (
             agent_card_obj.model_dump() if agent_card_obj else agent.get("agent_card", {})
         )
 
-        tags = agent_card_dict.get("tags", []) or agent.get("tags", [])
-        raw_skills = agent_card_dict.get("skills", []) or agent.get("skills", [])
-        skills = [skill.get("name") if isinstance(skill, dict) else skill for skill in raw_skills]
+        tags = _coalesce(agent_card_dict.get("tags"), agent.get("tags"), default=[])
+        raw_skills = _coalesce(agent_card_dict.get("skills"), agent.get("skills"), default=())
+        skills = [
+            name
+            for skill in raw_skills
+            if (name := skill.get("name") if isinstance(skill, dict) else skill)
+        ]
 
         filtered_agents.append(
-            AgentSearchResult(
+            AgentSearchResult.model_construct(
                 path=agent_path,
                 agent_name=agent_card_dict.get(
                     "name", agent.get("agent_name", agent_path.strip("/"))
                 ),
                 description=agent_card_dict.get("description", agent.get("description")),
-                tags=tags or [],
-                skills=[s for s in skills if s],
+                tags=tags,
+                skills=skills,
                 trust_level=agent_card_dict.get("trust_level"),
                 visibility=agent_card_dict.get("visibility"),
                 is_enabled=agent_card_dict.get("is_enabled", False),
@@ -6,6 +6,7 @@ eliminating code duplication across server_routes.py.
 """
 
 import base64
+import hmac
 import logging
 import os
 
@@ -45,11 +46,15 @@ async def verify_admin_credentials(request: Request) -> str:
 
     try:
         encoded_credentials = auth_header.split(" ")[1]
-        decoded_credentials = base64.b64decode(encoded_credentials).decode("utf-8")
-        username, password = decoded_credentials.split(":", 1)
-        logger.debug(f"Admin auth: Decoded credentials for user '{username}'")
+        username_bytes, separator, password_bytes = base64.b64decode(encoded_credentials).partition(
+            b":"
+        )
+        if not separator:
+            raise ValueError("missing ':' separator")
+        username = username_bytes.decode("utf-8")
+        logger.debug("Admin auth: Decoded credentials for user '%s'", username)
     except (IndexError, ValueError, UnicodeDecodeError) as e:
-        logger.debug(f"Admin auth failed: Invalid credential format - {e}")
+        logger.debug("Admin auth failed: Invalid credential format - %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication format",
@@ -66,13 +71,17 @@ async def verify_admin_credentials(request: Request) -> str:
             detail="Internal server configuration error",
         )
 
-    if username != admin_user or password != admin_password:
-        logger.warning(f"Failed admin authentication attempt from user '{username}'")
+    # Compare in constant time and evaluate both checks so timing does not reveal
+    # which part of the credentials was wrong
+    user_ok = hmac.compare_digest(username_bytes, admin_user.encode("utf-8"))
+    password_ok = hmac.compare_digest(password_bytes, admin_password.encode("utf-8"))
+    if not (user_ok & password_ok):
+        logger.warning("Failed admin authentication attempt from user '%s'", username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid admin credentials",
             headers={"WWW-Authenticate": "Basic"},
         )
 
-    logger.debug(f"Admin auth successful for user '{username}'")
+    logger.debug("Admin auth successful for user '%s'", username)
     return username
@@ -6,8 +6,10 @@ from either DocumentDB or YAML file backends.
 """
 
 import asyncio
+import copy
 import logging
 import os
+import random
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +17,16 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for one retry backoff sleep and for a single repository load
+_MAX_RETRY_DELAY_SECONDS = 10.0
+_LOAD_TIMEOUT_SECONDS = 5.0
+
+# Use libyaml's C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed scopes files: {path: ((st_mtime_ns, st_size), config)}
+_yaml_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 async def load_scopes_from_repository(
     max_retries: int = 5, initial_delay: float = 2.0
@@ -24,7 +36,7 @@ async def load_scopes_from_repository(
 
     Args:
         max_retries: Maximum number of retry attempts
-        initial_delay: Initial delay in seconds (exponential backoff)
+        initial_delay: Base delay in seconds for jittered exponential backoff
 
     Returns:
         Dict with "group_mappings", scope definitions, and "UI-Scopes"
@@ -42,8 +54,8 @@ async def load_scopes_from_repository(
 
             scope_repo = get_scope_repository()
 
-            # Load all scopes
-            await scope_repo.load_all()
+            # Load all scopes; a hung backend counts as a failed attempt
+            await asyncio.wait_for(scope_repo.load_all(), timeout=_LOAD_TIMEOUT_SECONDS)
 
             # Get all groups and build scopes configuration
             groups_dict = await scope_repo.list_groups()
@@ -52,10 +64,14 @@ async def load_scopes_from_repository(
             scopes_config: dict[str, Any] = {}
             ui_scopes: dict[str, Any] = {}
 
+            # Fetch full group details concurrently rather than one round trip at a time
+            group_names = list(groups_dict.keys())
+            group_details = await asyncio.gather(
+                *(scope_repo.get_group(group_name) for group_name in group_names)
+            )
+
             # Build scopes config from repository
-            for group_name in groups_dict.keys():
-                # Get full group details
-                group_data = await scope_repo.get_group(group_name)
+            for group_name, group_data in zip(group_names, group_details):
                 if not group_data:
                     continue
 
@@ -88,33 +104,22 @@ async def load_scopes_from_repository(
 
             return config
 
-        except (ConnectionRefusedError, OSError) as e:
-            last_exception = e
-            if attempt < max_retries - 1:
-                delay = initial_delay * (2**attempt)
-                logger.warning(
-                    f"Repository not ready (attempt {attempt + 1}/{max_retries}), "
-                    f"retrying in {delay}s: {e}"
-                )
-                await asyncio.sleep(delay)
-            else:
-                logger.error(
-                    f"Failed to connect to repository after {max_retries} attempts: {e}",
-                    exc_info=True,
-                )
         except Exception as e:
-            # Other exceptions should also be retried (might be transient repository errors)
+            # Connection errors and other repository errors are usually transient
             last_exception = e
             if attempt < max_retries - 1:
-                delay = initial_delay * (2**attempt)
+                # Full jitter, capped, so replicas don't retry in lockstep
+                delay = random.uniform(
+                    0, min(initial_delay * (2**attempt), _MAX_RETRY_DELAY_SECONDS)
+                )
                 logger.warning(
                     f"Error loading scopes (attempt {attempt + 1}/{max_retries}), "
-                    f"retrying in {delay}s: {e}"
+                    f"retrying in {delay:.1f}s: {e!r}"
                 )
                 await asyncio.sleep(delay)
             else:
                 logger.error(
-                    f"Failed to load scopes after {max_retries} attempts: {e}", exc_info=True
+                    f"Failed to load scopes after {max_retries} attempts: {e!r}", exc_info=True
                 )
 
     # If we get here, all retries failed
@@ -151,13 +156,24 @@ def load_scopes_from_yaml(scopes_path: str | None = None) -> dict[str, Any]:
             logger.warning(f"Scopes config file not found at {scopes_file}")
             return {"group_mappings": {}}
 
-        with open(scopes_file) as f:
-            config = yaml.safe_load(f)
-            logger.info(
-                f"Loaded scopes from YAML with "
-                f"{len(config.get('group_mappings', {}))} group mappings"
-            )
-            return config
+        # Reuse the parsed file until it changes on disk; callers get a copy
+        # so they can't alter the cached config
+        stat = scopes_file.stat()
+        cache_key = str(scopes_file)
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        cached = _yaml_cache.get(cache_key)
+        if cached and cached[0] == file_version:
+            logger.debug(f"Using cached scopes from {scopes_file}")
+            return copy.deepcopy(cached[1])
+
+        # Hand libyaml the raw bytes in one read rather than going through the
+        # text IO layer
+        config = yaml.load(scopes_file.read_bytes(), Loader=_YamlLoader)
+        logger.info(
+            f"Loaded scopes from YAML with {len(config.get('group_mappings', {}))} group mappings"
+        )
+        _yaml_cache[cache_key] = (file_version, config)
+        return copy.deepcopy(config)
 
     except Exception as e:
         logger.error(f"Failed to load scopes from YAML: {e}")
@@ -62,6 +62,14 @@ class Settings(BaseSettings):
     enable_wellknown_discovery: bool = True
     wellknown_cache_ttl: int = 300  # 5 minutes
 
+    # Federation config API settings
+    federation_config_cache_ttl_seconds: int = 30  # GET response cache, 0 disables
+    federation_cache_fallback: bool = False  # Serve stale cached GETs when the backend fails
+
+    # Agent card lookup cache (search access checks and results)
+    agent_info_cache_ttl_seconds: int = 60  # 0 disables
+    agent_info_cache_max_size: int = 2048
+
     # Security scanning settings (MCP Servers)
     security_scan_enabled: bool = True
     security_scan_on_registration: bool = True
@@ -42,6 +42,7 @@ from registry.health.routes import router as health_router
 from registry.health.service import health_service
 from registry.repositories.factory import get_search_repository
 from registry.services.agent_service import agent_service
+from registry.services.federation.base_client import close_shared_http_client
 
 # Import services for initialization
 from registry.services.server_service import server_service
@@ -198,32 +199,11 @@ async def lifespan(app: FastAPI):
                                 federation_config.anthropic.servers
                             )
 
-                            # Register servers
-                            synced_count = 0
-                            for server_data in servers:
-                                try:
-                                    server_path = server_data.get("path")
-                                    if not server_path:
-                                        continue
-
-                                    # Register or update server
-                                    success = await server_service.register_server(server_data)
-                                    if not success:
-                                        success = await server_service.update_server(
-                                            server_path, server_data
-                                        )
-
-                                    if success:
-                                        # Enable the server
-                                        await server_service.toggle_service(server_path, True)
-                                        synced_count += 1
-                                        logger.info(
-                                            f"Synced: {server_data.get('server_name', server_path)}"
-                                        )
-                                except Exception as e:
-                                    logger.error(
-                                        f"Failed to sync server {server_data.get('server_name', 'unknown')}: {e}"
-                                    )
+                            # Create or update and enable all servers in one repository write
+                            synced_paths = await server_service.bulk_upsert_servers(
+                                [server_data for server_data in servers if server_data.get("path")]
+                            )
+                            synced_count = len(synced_paths)
 
                             logger.info(f"✅ Synced {synced_count} servers from Anthropic")
 
@@ -263,6 +243,7 @@ async def lifespan(app: FastAPI):
     try:
         # Shutdown services gracefully
         await health_service.shutdown()
+        close_shared_http_client()
         logger.info("✅ Shutdown completed successfully!")
     except Exception as e:
         logger.error(f"❌ Error during shutdown: {e}", exc_info=True)
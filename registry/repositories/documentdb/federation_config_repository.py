@@ -1,9 +1,11 @@
 """DocumentDB repository for federation configuration storage."""
 
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
+from pymongo import ReturnDocument
 from pymongo.asynchronous.collection import AsyncCollection
 
 from ...schemas.federation_schema import FederationConfig
@@ -31,6 +33,18 @@ class DocumentDBFederationConfigRepository(FederationConfigRepositoryBase):
             self._collection = db[self._collection_name]
         return self._collection
 
+    @staticmethod
+    def _doc_to_config(config_doc: dict[str, Any]) -> FederationConfig:
+        """Build a FederationConfig from a stored document."""
+        config_doc.pop("_id", None)
+        config_doc.pop("created_at", None)
+        config_doc.pop("updated_at", None)
+        return FederationConfig(**config_doc)
+
+    async def _config_exists(self, collection: AsyncCollection, config_id: str) -> bool:
+        """Check whether a configuration document exists."""
+        return await collection.count_documents({"_id": config_id}, limit=1) > 0
+
     async def get_config(self, config_id: str = "default") -> FederationConfig | None:
         """Get federation configuration by ID."""
         try:
@@ -42,17 +56,13 @@ class DocumentDBFederationConfigRepository(FederationConfigRepositoryBase):
                 logger.info(f"Federation config not found: {config_id}")
                 return None
 
-            config_doc.pop("_id", None)
-            config_doc.pop("created_at", None)
-            config_doc.pop("updated_at", None)
-
-            config = FederationConfig(**config_doc)
+            config = self._doc_to_config(config_doc)
             logger.info(f"Retrieved federation config: {config_id}")
             return config
 
         except Exception as e:
             logger.error(f"Failed to get federation config {config_id}: {e}", exc_info=True)
-            return None
+            raise
 
     async def save_config(
         self, config: FederationConfig, config_id: str = "default"
@@ -105,23 +115,92 @@ class DocumentDBFederationConfigRepository(FederationConfigRepositoryBase):
     async def list_configs(self) -> list[dict[str, Any]]:
         """List all federation configurations."""
         try:
-            collection = await self._get_collection()
-
-            cursor = collection.find({}, {"_id": 1, "created_at": 1, "updated_at": 1})
-
-            configs = []
-            async for doc in cursor:
-                configs.append(
-                    {
-                        "id": doc.get("_id"),
-                        "created_at": doc.get("created_at"),
-                        "updated_at": doc.get("updated_at"),
-                    }
-                )
+            configs = [config async for config in self.iter_configs()]
 
             logger.info(f"Listed {len(configs)} federation configs")
             return configs
 
         except Exception as e:
             logger.error(f"Failed to list federation configs: {e}", exc_info=True)
-            return []
+            raise
+
+    async def iter_configs(self) -> AsyncIterator[dict[str, Any]]:
+        """Stream federation configuration summaries from a cursor."""
+        collection = await self._get_collection()
+
+        cursor = collection.find({}, {"_id": 1, "created_at": 1, "updated_at": 1})
+
+        async for doc in cursor:
+            yield {
+                "id": doc.get("_id"),
+                "created_at": doc.get("created_at"),
+                "updated_at": doc.get("updated_at"),
+            }
+
+    async def add_entry(
+        self,
+        config_id: str,
+        list_path: str,
+        entry: dict[str, Any],
+        key_field: str,
+    ) -> FederationConfig | None:
+        """Append an entry with a single conditional $push."""
+        try:
+            collection = await self._get_collection()
+
+            config_doc = await collection.find_one_and_update(
+                {"_id": config_id, f"{list_path}.{key_field}": {"$ne": entry[key_field]}},
+                {
+                    "$push": {list_path: entry},
+                    "$set": {"updated_at": datetime.now(UTC).isoformat()},
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+
+            if config_doc is None:
+                if not await self._config_exists(collection, config_id):
+                    return None
+                raise ValueError(f"Entry '{entry[key_field]}' already exists in {list_path}")
+
+            logger.info(f"Added {list_path} entry '{entry[key_field]}' to config: {config_id}")
+            return self._doc_to_config(config_doc)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to update federation config {config_id}: {e}", exc_info=True)
+            raise
+
+    async def remove_entry(
+        self,
+        config_id: str,
+        list_path: str,
+        key_field: str,
+        value: str,
+    ) -> FederationConfig | None:
+        """Remove an entry with a single conditional $pull."""
+        try:
+            collection = await self._get_collection()
+
+            config_doc = await collection.find_one_and_update(
+                {"_id": config_id, f"{list_path}.{key_field}": value},
+                {
+                    "$pull": {list_path: {key_field: value}},
+                    "$set": {"updated_at": datetime.now(UTC).isoformat()},
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+
+            if config_doc is None:
+                if not await self._config_exists(collection, config_id):
+                    return None
+                raise LookupError(f"Entry '{value}' not found in {list_path}")
+
+            logger.info(f"Removed {list_path} entry '{value}' from config: {config_id}")
+            return self._doc_to_config(config_doc)
+
+        except LookupError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to update federation config {config_id}: {e}", exc_info=True)
+            raise
@@ -103,6 +103,46 @@ def _tokens_match_text(
     return any(token in text_lower for token in tokens)
 
 
+def build_access_filter(
+    accessible_servers: list[str] | None,
+    accessible_agents: list[str] | None,
+) -> dict[str, Any] | None:
+    """Build a query filter limiting search documents to what a user can access.
+
+    Servers match on technical name (path without slashes) or server name,
+    agents on exact path, mirroring the checks in the search API.
+
+    Args:
+        accessible_servers: Server names/paths the user can access, None for all
+        accessible_agents: Agent paths the user can access, None for all
+
+    Returns:
+        Query filter, or None when access is unrestricted
+    """
+    if accessible_servers is None and accessible_agents is None:
+        return None
+
+    if accessible_servers is None:
+        server_clause: dict[str, Any] = {"entity_type": {"$ne": "a2a_agent"}}
+    else:
+        names = {name.strip("/") for name in accessible_servers}
+        server_paths = [f"/{name}" for name in names] + [f"/{name}/" for name in names]
+        server_clause = {
+            "entity_type": {"$ne": "a2a_agent"},
+            "$or": [
+                {"path": {"$in": server_paths}},
+                {"name": {"$in": list(set(accessible_servers))}},
+            ],
+        }
+
+    if accessible_agents is None:
+        agent_clause: dict[str, Any] = {"entity_type": "a2a_agent"}
+    else:
+        agent_clause = {"entity_type": "a2a_agent", "path": {"$in": list(accessible_agents)}}
+
+    return {"$or": [server_clause, agent_clause]}
+
+
 class DocumentDBSearchRepository(SearchRepositoryBase):
     """DocumentDB implementation with hybrid search (text + vector)."""
 
@@ -342,6 +382,7 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
         query_embedding: list[float],
         entity_types: list[str] | None = None,
         max_results: int = 10,
+        access_filter: dict[str, Any] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Fallback search using client-side cosine similarity for MongoDB CE.
 
@@ -352,9 +393,11 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
 
         try:
             # Build query filter
-            query_filter = {}
+            query_filter: dict[str, Any] = {}
             if entity_types:
                 query_filter["entity_type"] = {"$in": entity_types}
+            if access_filter:
+                query_filter = {"$and": [query_filter, access_filter]}
 
             # Fetch all embeddings from MongoDB
             cursor = collection.find(
@@ -591,6 +634,8 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
         query: str,
         entity_types: list[str] | None = None,
         max_results: int = 10,
+        accessible_servers: list[str] | None = None,
+        accessible_agents: list[str] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Perform hybrid search (text + vector).
 
@@ -599,6 +644,7 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
         We apply text-based boosting as a secondary ranking factor.
         """
         collection = await self._get_collection()
+        access_filter = build_access_filter(accessible_servers, accessible_agents)
 
         try:
             model = await self._get_embedding_model()
@@ -623,6 +669,10 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             if entity_types:
                 pipeline.append({"$match": {"entity_type": {"$in": entity_types}}})
 
+            # Drop documents the user cannot access before re-ranking
+            if access_filter:
+                pipeline.append({"$match": access_filter})
+
             # Tokenize query and create regex pattern for matching any token
             query_tokens = _tokenize_query(query)
             # Create regex that matches any token (e.g., "current|time|timezone")
@@ -642,6 +692,8 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
             }
             if entity_types:
                 keyword_match_filter["entity_type"] = {"$in": entity_types}
+            if access_filter:
+                keyword_match_filter = {"$and": [keyword_match_filter, access_filter]}
 
             # Add text-based scoring for re-ranking
             # Higher scores for matches in name (3.0), description (2.0), tags (1.5), tools (1.0 per match)
@@ -997,7 +1049,7 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
                     "Falling back to client-side cosine similarity search."
                 )
                 return await self._client_side_search(
-                    query, query_embedding, entity_types, max_results
+                    query, query_embedding, entity_types, max_results, access_filter
                 )
             elif "vectorSearch" in str(e) or "$search" in str(e):
                 # General vector search not supported - fall back to client-side search
@@ -1006,7 +1058,7 @@ class DocumentDBSearchRepository(SearchRepositoryBase):
                     "Falling back to client-side cosine similarity search."
                 )
                 return await self._client_side_search(
-                    query, query_embedding, entity_types, max_results
+                    query, query_embedding, entity_types, max_results, access_filter
                 )
 
             logger.error(f"Failed to perform hybrid search: {e}", exc_info=True)
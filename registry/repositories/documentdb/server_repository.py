@@ -4,8 +4,9 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+from pymongo import UpdateOne
 from pymongo.asynchronous.collection import AsyncCollection
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from ..interfaces import ServerRepositoryBase
 from .client import get_collection_name, get_documentdb_client
@@ -217,3 +218,46 @@ class DocumentDBServerRepository(ServerRepositoryBase):
         except Exception as e:
             logger.error(f"Failed to update server state in DocumentDB: {e}", exc_info=True)
             return False
+
+    async def bulk_upsert(
+        self,
+        servers: list[dict[str, Any]],
+        enabled: bool,
+    ) -> list[str]:
+        """Create or update servers and set their state in a single bulk write."""
+        if not servers:
+            return []
+
+        collection = await self._get_collection()
+        now = datetime.now(UTC).isoformat()
+
+        paths = []
+        operations = []
+        for server_info in servers:
+            path = server_info["path"]
+            doc = {k: v for k, v in server_info.items() if k not in ("path", "registered_at")}
+            doc["updated_at"] = now
+            doc["is_enabled"] = enabled
+            operations.append(
+                UpdateOne(
+                    {"_id": path},
+                    {"$set": doc, "$setOnInsert": {"registered_at": now}},
+                    upsert=True,
+                )
+            )
+            paths.append(path)
+
+        try:
+            result = await collection.bulk_write(operations, ordered=False)
+            logger.info(
+                f"DocumentDB WRITE: Upserted {len(paths)} servers "
+                f"({result.upserted_count} new) in collection '{self._collection_name}'"
+            )
+            return paths
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            logger.error(f"Failed to upsert {len(failed)} of {len(paths)} servers: {e.details}")
+            return [path for index, path in enumerate(paths) if index not in failed]
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert servers in DocumentDB: {e}", exc_info=True)
+            return []
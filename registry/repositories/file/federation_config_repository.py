@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -45,6 +46,9 @@ class FileFederationConfigRepository(FederationConfigRepositoryBase):
 
         Returns:
             FederationConfig if found, None otherwise
+
+        Raises:
+            Exception: If the config file exists but cannot be read or parsed
         """
         try:
             config_path = self._get_config_path(config_id)
@@ -67,7 +71,7 @@ class FileFederationConfigRepository(FederationConfigRepositoryBase):
 
         except Exception as e:
             logger.error(f"Failed to read federation config {config_id}: {e}", exc_info=True)
-            return None
+            raise
 
     async def save_config(
         self, config: FederationConfig, config_id: str = "default"
@@ -116,6 +120,112 @@ class FileFederationConfigRepository(FederationConfigRepositoryBase):
             logger.error(f"Failed to save federation config {config_id}: {e}", exc_info=True)
             raise
 
+    def _update_entries(
+        self, config_id: str, list_path: str, mutate: Callable[[list[dict[str, Any]]], None]
+    ) -> FederationConfig | None:
+        """
+        Apply ``mutate`` to a list in the stored config and write it back.
+
+        Reads and writes the config file once, instead of get_config followed
+        by save_config re-reading the file to preserve created_at.
+
+        Args:
+            config_id: Configuration ID
+            list_path: Dotted path of the list (e.g. "anthropic.servers")
+            mutate: Callback that modifies the list in place
+
+        Returns:
+            Updated configuration, or None if the config file does not exist
+        """
+        config_path = self._get_config_path(config_id)
+        if not config_path.exists():
+            return None
+
+        with open(config_path) as f:
+            doc = json.load(f)
+
+        section_name, field = list_path.split(".")
+        section = doc.setdefault(section_name, {})
+        mutate(section.setdefault(field, []))
+
+        doc["updated_at"] = datetime.now(UTC).isoformat()
+        config = FederationConfig(
+            **{k: v for k, v in doc.items() if k not in ("config_id", "created_at", "updated_at")}
+        )
+
+        with open(config_path, "w") as f:
+            json.dump(doc, f, indent=2)
+
+        return config
+
+    async def add_entry(
+        self,
+        config_id: str,
+        list_path: str,
+        entry: dict[str, Any],
+        key_field: str,
+    ) -> FederationConfig | None:
+        """
+        Append an entry to a list in a federation configuration.
+
+        Args:
+            config_id: Configuration ID
+            list_path: Dotted path of the list (e.g. "anthropic.servers")
+            entry: Entry to append
+            key_field: Field identifying the entry within the list
+
+        Returns:
+            Updated configuration, or None if the configuration does not exist
+
+        Raises:
+            ValueError: If an entry with the same key already exists
+        """
+
+        def _append(items: list[dict[str, Any]]) -> None:
+            if any(item.get(key_field) == entry[key_field] for item in items):
+                raise ValueError(f"Entry '{entry[key_field]}' already exists in {list_path}")
+            items.append(entry)
+
+        config = self._update_entries(config_id, list_path, _append)
+        if config is not None:
+            logger.info(f"Added {list_path} entry '{entry[key_field]}' to config: {config_id}")
+        return config
+
+    async def remove_entry(
+        self,
+        config_id: str,
+        list_path: str,
+        key_field: str,
+        value: str,
+    ) -> FederationConfig | None:
+        """
+        Remove an entry from a list in a federation configuration.
+
+        Args:
+            config_id: Configuration ID
+            list_path: Dotted path of the list (e.g. "asor.agents")
+            key_field: Field identifying the entry within the list
+            value: Key of the entry to remove
+
+        Returns:
+            Updated configuration, or None if the configuration does not exist
+
+        Raises:
+            LookupError: If no entry with that key exists
+        """
+
+        def _remove(items: list[dict[str, Any]]) -> None:
+            for index, item in enumerate(items):
+                if item.get(key_field) == value:
+                    del items[index]
+                    return
+            raise LookupError(f"Entry '{value}' not found in {list_path}")
+
+        config = self._update_entries(config_id, list_path, _remove)
+        if config is not None:
+            logger.info(f"Removed {list_path} entry '{value}' from config: {config_id}")
+        return config
+
     async def delete_config(self, config_id: str = "default") -> bool:
         """
         Delete federation configuration.
@@ -147,31 +257,40 @@ class FileFederationConfigRepository(FederationConfigRepositoryBase):
 
         Returns:
             List of config summaries
+
+        Raises:
+            Exception: If the config directory cannot be listed
         """
         try:
-            if not self._config_dir.exists():
-                return []
-
-            configs = []
-            for config_file in self._config_dir.glob("*.json"):
-                try:
-                    with open(config_file) as f:
-                        data = json.load(f)
-
-                    configs.append(
-                        {
-                            "id": data.get("config_id", config_file.stem),
-                            "created_at": data.get("created_at"),
-                            "updated_at": data.get("updated_at"),
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to read config file {config_file}: {e}")
-                    continue
+            configs = [config async for config in self.iter_configs()]
 
             logger.info(f"Listed {len(configs)} federation configs from files")
             return configs
 
         except Exception as e:
             logger.error(f"Failed to list federation configs: {e}", exc_info=True)
-            return []
+            raise
+
+    async def iter_configs(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over federation configuration summaries one file at a time.
+
+        Yields:
+            Config summaries
+        """
+        if not self._config_dir.exists():
+            return
+
+        for config_file in self._config_dir.glob("*.json"):
+            try:
+                with open(config_file) as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to read config file {config_file}: {e}")
+                continue
+
+            yield {
+                "id": data.get("config_id", config_file.stem),
+                "created_at": data.get("created_at"),
+                "updated_at": data.get("updated_at"),
+            }
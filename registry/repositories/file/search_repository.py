@@ -37,6 +37,8 @@ class FaissSearchRepository(SearchRepositoryBase):
         query: str,
         entity_types: list[str] | None = None,
         max_results: int = 10,
+        accessible_servers: list[str] | None = None,
+        accessible_agents: list[str] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Search entities using FAISS.
 
@@ -44,12 +46,18 @@ class FaissSearchRepository(SearchRepositoryBase):
             query: Search query text
             entity_types: Optional list of entity types to filter by (e.g., ["mcp_server", "tool", "a2a_agent"])
             max_results: Maximum number of results per entity type
+            accessible_servers: Server names/paths to restrict results to, None for all
+            accessible_agents: Agent paths to restrict results to, None for all
 
         Returns:
             Dictionary with entity types as keys and lists of results as values
         """
         return await self.faiss_service.search_mixed(
-            query=query, entity_types=entity_types, max_results=max_results
+            query=query,
+            entity_types=entity_types,
+            max_results=max_results,
+            accessible_servers=accessible_servers,
+            accessible_agents=accessible_agents,
         )
 
     async def rebuild_index(self) -> None:
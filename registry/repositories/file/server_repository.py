@@ -271,3 +271,25 @@ class FileServerRepository(ServerRepositoryBase):
         logger.info(f"Toggled '{server_name}' ({path}) to {enabled}")
 
         return True
+
+    async def bulk_upsert(
+        self,
+        servers: list[dict[str, Any]],
+        enabled: bool,
+    ) -> list[str]:
+        """Create or update servers and set their state, persisting state once."""
+        paths = []
+        for server_info in servers:
+            path = server_info["path"]
+            if not await self._save_to_file(server_info):
+                continue
+
+            self._servers[path] = server_info
+            self._state[path] = enabled
+            paths.append(path)
+
+        if paths:
+            await self._save_state()
+
+        logger.info(f"Upserted {len(paths)} of {len(servers)} servers")
+        return paths
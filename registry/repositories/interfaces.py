@@ -5,6 +5,7 @@ These abstract base classes define the contract that ALL repository implementati
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ..schemas.agent_models import AgentCard
@@ -69,6 +70,15 @@ class ServerRepositoryBase(ABC):
         """Set server enabled/disabled state."""
         pass
 
+    @abstractmethod
+    async def bulk_upsert(
+        self,
+        servers: list[dict[str, Any]],
+        enabled: bool,
+    ) -> list[str]:
+        """Create or update servers and set their state, returning the paths written."""
+        pass
+
     @abstractmethod
     async def load_all(self) -> None:
         """Load/reload all servers from storage."""
@@ -638,8 +648,18 @@ class SearchRepositoryBase(ABC):
         query: str,
         entity_types: list[str] | None = None,
         max_results: int = 10,
+        accessible_servers: list[str] | None = None,
+        accessible_agents: list[str] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        """Perform search."""
+        """Perform search.
+
+        Args:
+            query: Search query text
+            entity_types: Optional list of entity types to filter by
+            max_results: Maximum number of results per entity type
+            accessible_servers: Server names/paths to restrict results to, None for all
+            accessible_agents: Agent paths to restrict results to, None for all
+        """
         pass
 
 
@@ -656,6 +676,9 @@ class FederationConfigRepositoryBase(ABC):
 
         Returns:
             FederationConfig if found, None otherwise
+
+        Raises:
+            Exception: If the backend cannot be read; a missing config is not an error
         """
         pass
 
@@ -695,5 +718,68 @@ class FederationConfigRepositoryBase(ABC):
 
         Returns:
             List of config summaries with id, created_at, updated_at
+
+        Raises:
+            Exception: If the backend cannot be read, rather than returning an empty list
+        """
+        pass
+
+    @abstractmethod
+    def iter_configs(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over federation configuration summaries without materializing them.
+
+        Yields:
+            Config summaries with id, created_at, updated_at
+        """
+        pass
+
+    @abstractmethod
+    async def add_entry(
+        self,
+        config_id: str,
+        list_path: str,
+        entry: dict[str, Any],
+        key_field: str,
+    ) -> FederationConfig | None:
+        """
+        Append an entry to a list in a federation configuration.
+
+        Args:
+            config_id: Configuration ID
+            list_path: Dotted path of the list (e.g. "anthropic.servers")
+            entry: Entry to append
+            key_field: Field identifying the entry within the list
+
+        Returns:
+            Updated configuration, or None if the configuration does not exist
+
+        Raises:
+            ValueError: If an entry with the same key already exists
+        """
+        pass
+
+    @abstractmethod
+    async def remove_entry(
+        self,
+        config_id: str,
+        list_path: str,
+        key_field: str,
+        value: str,
+    ) -> FederationConfig | None:
+        """
+        Remove an entry from a list in a federation configuration.
+
+        Args:
+            config_id: Configuration ID
+            list_path: Dotted path of the list (e.g. "asor.agents")
+            key_field: Field identifying the entry within the list
+            value: Key of the entry to remove
+
+        Returns:
+            Updated configuration, or None if the configuration does not exist
+
+        Raises:
+            LookupError: If no entry with that key exists
         """
         pass
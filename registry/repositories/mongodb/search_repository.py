@@ -19,6 +19,7 @@ from pymongo.operations import SearchIndexModel
 from ...core.config import embedding_config, settings
 from ...schemas.agent_models import AgentCard
 from ..documentdb.client import get_collection_name, get_documentdb_client
+from ..documentdb.search_repository import build_access_filter
 from ..interfaces import SearchRepositoryBase
 
 logger = logging.getLogger(__name__)
@@ -390,6 +391,7 @@ class MongoDBSearchRepository(SearchRepositoryBase):
         query_embedding: list[float],
         entity_types: list[str] | None = None,
         max_results: int = 10,
+        access_filter: dict[str, Any] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Fallback search using client-side cosine similarity.
 
@@ -398,9 +400,11 @@ class MongoDBSearchRepository(SearchRepositoryBase):
         collection = await self._get_collection()
 
         try:
-            query_filter = {}
+            query_filter: dict[str, Any] = {}
             if entity_types:
                 query_filter["entity_type"] = {"$in": entity_types}
+            if access_filter:
+                query_filter = {"$and": [query_filter, access_filter]}
 
             cursor = collection.find(
                 query_filter,
@@ -622,6 +626,8 @@ class MongoDBSearchRepository(SearchRepositoryBase):
         query: str,
         entity_types: list[str] | None = None,
         max_results: int = 10,
+        accessible_servers: list[str] | None = None,
+        accessible_agents: list[str] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Perform hybrid search using MongoDB CE 8.2 native $vectorSearch.
 
@@ -631,6 +637,7 @@ class MongoDBSearchRepository(SearchRepositoryBase):
         - Vector search index created via SearchIndexModel
         """
         collection = await self._get_collection()
+        access_filter = build_access_filter(accessible_servers, accessible_agents)
 
         try:
             model = await self._get_embedding_model()
@@ -660,6 +667,10 @@ class MongoDBSearchRepository(SearchRepositoryBase):
             if entity_types:
                 pipeline.append({"$match": {"entity_type": {"$in": entity_types}}})
 
+            # Drop documents the user cannot access before re-ranking
+            if access_filter:
+                pipeline.append({"$match": access_filter})
+
             # Tokenize query for keyword boosting
             query_tokens = _tokenize_query(query)
             escaped_tokens = [re.escape(token) for token in query_tokens]
@@ -880,7 +891,7 @@ class MongoDBSearchRepository(SearchRepositoryBase):
                     f"Falling back to client-side similarity search. Error: {e}"
                 )
                 return await self._client_side_search(
-                    query, query_embedding, entity_types, max_results
+                    query, query_embedding, entity_types, max_results, access_filter
                 )
 
             logger.error(f"Failed to perform vector search: {e}", exc_info=True)
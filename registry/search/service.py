@@ -943,11 +943,52 @@ class FaissService:
         matches.sort(key=lambda item: item[0], reverse=True)
         return [match for _, match in matches]
 
+    def _accessible_faiss_ids(
+        self,
+        accessible_servers: list[str] | None,
+        accessible_agents: list[str] | None,
+    ) -> list[int] | None:
+        """
+        Collect the FAISS IDs a user may see.
+
+        Args:
+            accessible_servers: Server names/paths the user can access, None for all
+            accessible_agents: Agent paths the user can access, None for all
+
+        Returns:
+            Sorted FAISS IDs, or None when access is unrestricted
+        """
+        if accessible_servers is None and accessible_agents is None:
+            return None
+
+        server_names = (
+            {name.strip("/") for name in accessible_servers} | set(accessible_servers)
+            if accessible_servers is not None
+            else None
+        )
+        agent_paths = set(accessible_agents) if accessible_agents is not None else None
+
+        allowed_ids: list[int] = []
+        for path, entry in self.metadata_store.items():
+            if entry.get("entity_type", "mcp_server") == "a2a_agent":
+                allowed = agent_paths is None or path in agent_paths
+            else:
+                server_name = entry.get("full_server_info", {}).get("server_name")
+                allowed = server_names is None or (
+                    path.strip("/") in server_names or server_name in server_names
+                )
+            if allowed and entry.get("id") is not None:
+                allowed_ids.append(int(entry["id"]))
+
+        return sorted(allowed_ids)
+
     async def search_mixed(
         self,
         query: str,
         entity_types: list[str] | None = None,
         max_results: int = 20,
+        accessible_servers: list[str] | None = None,
+        accessible_agents: list[str] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """
         Run a semantic search across MCP servers, their tools, and A2A agents.
@@ -956,6 +997,8 @@ class FaissService:
             query: Natural language query text
             entity_types: Optional list of entity filters ("mcp_server", "tool", "a2a_agent")
             max_results: Maximum results to return per entity collection
+            accessible_servers: Server names/paths to restrict results to, None for all
+            accessible_agents: Agent paths to restrict results to, None for all
 
         Returns:
             Dict with "servers", "tools", and "agents" result lists
@@ -977,7 +1020,13 @@ class FaissService:
         if total_vectors == 0:
             return {"servers": [], "tools": [], "agents": []}
 
-        top_k = min(max_results, total_vectors)
+        # Restrict retrieval to accessible entities so inaccessible hits do not
+        # use up top-k slots
+        allowed_ids = self._accessible_faiss_ids(accessible_servers, accessible_agents)
+        if allowed_ids is not None and not allowed_ids:
+            return {"servers": [], "tools": [], "agents": []}
+
+        top_k = min(max_results, total_vectors if allowed_ids is None else len(allowed_ids))
         query_embedding = await asyncio.to_thread(self.embedding_model.encode, [query.strip()])
         query_np = np.array([query_embedding[0]], dtype=np.float32)
 
@@ -988,7 +1037,14 @@ class FaissService:
             f"Normalized query embedding (norm check: {np.linalg.norm(normalized_query):.4f})"
         )
 
-        distances, indices = self.faiss_index.search(query_np, top_k)
+        if allowed_ids is None:
+            distances, indices = self.faiss_index.search(query_np, top_k)
+        else:
+            id_array = np.array(allowed_ids, dtype=np.int64)
+            selector = faiss.IDSelectorBatch(len(id_array), faiss.swig_ptr(id_array))
+            distances, indices = self.faiss_index.search(
+                query_np, top_k, params=faiss.SearchParameters(sel=selector)
+            )
         distance_row = distances[0]
         id_row = indices[0]
 
@@ -11,9 +11,11 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+from ..core.config import settings
 from ..repositories.factory import get_agent_repository, get_search_repository
 from ..repositories.interfaces import AgentRepositoryBase, SearchRepositoryBase
 from ..schemas.agent_models import AgentCard
+from .agent_service_cache import AgentInfoCache
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,10 @@ class AgentService:
         self._search_repo: SearchRepositoryBase = search_repo or get_search_repository()
         self.registered_agents: dict[str, AgentCard] = {}
         self.agent_state: dict[str, list[str]] = {"enabled": [], "disabled": []}
+        self._agent_info_cache = AgentInfoCache(
+            max_size=settings.agent_info_cache_max_size,
+            ttl_seconds=settings.agent_info_cache_ttl_seconds,
+        )
 
     async def load_agents_and_state(self) -> None:
         """Load agent cards and persisted state from repository."""
@@ -108,6 +114,7 @@ class AgentService:
 
         # Add to in-memory registry and default to disabled
         self.registered_agents[path] = agent_card
+        self._agent_info_cache.invalidate(path)
         self.agent_state["disabled"].append(path)
         await self._persist_state()
 
@@ -217,6 +224,7 @@ class AgentService:
 
         # Save to repository (this will handle AOSS eventual consistency)
         await self._repo.update(path, agent_dict)
+        self._agent_info_cache.invalidate(path)
 
         # Update in-memory registry
         try:
@@ -269,6 +277,7 @@ class AgentService:
         # Save to repository
         updated_agent = await self._repo.save(updated_agent)
         self.registered_agents[path] = updated_agent
+        self._agent_info_cache.invalidate(path)
 
         # Re-index in search backend
         try:
@@ -309,6 +318,7 @@ class AgentService:
 
             # Remove from in-memory registry
             del self.registered_agents[path]
+            self._agent_info_cache.invalidate(path)
 
             # Remove from state
             if path in self.agent_state["enabled"]:
@@ -470,6 +480,30 @@ class AgentService:
         """
         return await self._repo.get(path)
 
+    async def get_cached_agent_info(
+        self,
+        path: str,
+    ) -> AgentCard | None:
+        """
+        Get agent by path through the short-lived agent info cache.
+
+        Meant for read-heavy callers such as search; writes should keep using
+        get_agent_info so they always see the repository state.
+
+        Args:
+            path: Agent path
+
+        Returns:
+            Agent card or None if not found
+        """
+        hit, agent_card = self._agent_info_cache.get(path)
+        if hit:
+            return agent_card
+
+        agent_card = await self.get_agent_info(path)
+        self._agent_info_cache.set(path, agent_card)
+        return agent_card
+
     async def get_all_agents(self) -> list[AgentCard]:
         """
         Get all registered agents - queries repository directly.
@@ -0,0 +1,100 @@
+"""
+TTL LRU cache for agent card lookups.
+
+Search results resolve the same agent paths over and over; this cache lets
+those reads skip the repository for a short time. Entries are dropped by
+AgentService whenever an agent card is written or deleted.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+
+from ..schemas.agent_models import AgentCard
+
+logger = logging.getLogger(__name__)
+
+
+class AgentInfoCache:
+    """Bounded, time-limited cache of agent cards keyed by agent path."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of agent paths to keep
+            ttl_seconds: Seconds an entry stays fresh; 0 disables caching
+        """
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        # {agent path: (monotonic time stored, agent card or None if not found)}
+        self._entries: OrderedDict[str, tuple[float, AgentCard | None]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups should be cached at all."""
+        return self._ttl_seconds > 0 and self._max_size > 0
+
+    def get(
+        self,
+        path: str,
+    ) -> tuple[bool, AgentCard | None]:
+        """
+        Look up a cached agent card.
+
+        Args:
+            path: Agent path
+
+        Returns:
+            Tuple of (hit, agent card); the card may be None for a cached miss
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return False, None
+
+        if time.monotonic() - entry[0] >= self._ttl_seconds:
+            del self._entries[path]
+            return False, None
+
+        self._entries.move_to_end(path)
+        return True, entry[1]
+
+    def set(
+        self,
+        path: str,
+        agent_card: AgentCard | None,
+    ) -> None:
+        """
+        Store an agent card, evicting the least recently used entry when full.
+
+        Args:
+            path: Agent path
+            agent_card: Agent card, or None if the agent does not exist
+        """
+        if not self.enabled:
+            return
+
+        self._entries[path] = (time.monotonic(), agent_card)
+        self._entries.move_to_end(path)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        path: str | None = None,
+    ) -> None:
+        """
+        Drop one cached agent card, or all of them.
+
+        Args:
+            path: Agent path to drop; None clears the whole cache
+        """
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(path, None)
+        logger.debug(f"Invalidated agent info cache for {path or 'all agents'}")
@@ -6,18 +6,16 @@ and transforms them to the gateway's internal format.
 """
 
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import quote
 
+import httpx
+
 from ...schemas.federation_schema import AnthropicServerConfig
 from .base_client import BaseFederationClient
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +28,7 @@ class AnthropicFederationClient(BaseFederationClient):
         api_version: str = "v0.1",
         timeout_seconds: int = 30,
         retry_attempts: int = 3,
+        client: httpx.Client | None = None,
     ):
         """
         Initialize Anthropic federation client.
@@ -39,8 +38,9 @@ class AnthropicFederationClient(BaseFederationClient):
             api_version: API version to use (default: v0.1)
             timeout_seconds: HTTP request timeout
             retry_attempts: Number of retry attempts
+            client: HTTP client to use (default: the shared federation client)
         """
-        super().__init__(endpoint, timeout_seconds, retry_attempts)
+        super().__init__(endpoint, timeout_seconds, retry_attempts, client=client)
         self.api_version = api_version
 
     def fetch_server(
@@ -66,11 +66,11 @@ class AnthropicFederationClient(BaseFederationClient):
         # No authentication for public Anthropic registry
 
         # Make request
-        logger.info(f"Fetching server {server_name} from Anthropic Registry")
+        logger.info("Fetching server %s from Anthropic Registry", server_name)
         response = self._make_request(url, headers=headers)
 
         if not response:
-            logger.error(f"Failed to fetch server {server_name}")
+            logger.error("Failed to fetch server %s", server_name)
             return None
 
         # Transform response to internal format
@@ -90,16 +90,44 @@ class AnthropicFederationClient(BaseFederationClient):
         """
         servers = []
 
-        for config in server_configs:
-            server_data = self.fetch_server(config.name, config)
+        results = self._fetch_concurrently(
+            lambda config: self.fetch_server(config.name, config), server_configs
+        )
+
+        for config, server_data in zip(server_configs, results):
             if server_data:
                 servers.append(server_data)
             else:
-                logger.warning(f"Failed to fetch server: {config.name}")
+                logger.warning("Failed to fetch server: %s", config.name)
 
         logger.info(f"Successfully fetched {len(servers)}/{len(server_configs)} servers")
         return servers
 
+    def iter_servers(self, server_configs: list[AnthropicServerConfig]) -> Iterator[dict[str, Any]]:
+        """
+        Fetch servers from Anthropic Registry, yielding each one as it arrives.
+
+        Unlike fetch_all_servers, callers can process servers while the
+        remaining requests are still in flight.
+
+        Args:
+            server_configs: List of server configurations
+
+        Yields:
+            Server data dictionaries in completion order
+        """
+        fetched = 0
+        for config, server_data in self._iter_concurrently(
+            lambda config: self.fetch_server(config.name, config), server_configs
+        ):
+            if server_data:
+                fetched += 1
+                yield server_data
+            else:
+                logger.warning("Failed to fetch server: %s", config.name)
+
+        logger.info(f"Successfully fetched {fetched}/{len(server_configs)} servers")
+
     def _transform_server_response(
         self,
         response: dict[str, Any],
@@ -10,14 +10,11 @@ import os
 from datetime import UTC, datetime
 from typing import Any
 
+import httpx
+
 from ...schemas.federation_schema import AsorAgentConfig
 from .base_client import BaseFederationClient
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +29,7 @@ class AsorFederationClient(BaseFederationClient):
         tenant_url: str | None = None,
         timeout_seconds: int = 30,
         retry_attempts: int = 3,
+        client: httpx.Client | None = None,
     ):
         """
         Initialize ASOR federation client.
@@ -43,8 +41,9 @@ class AsorFederationClient(BaseFederationClient):
             tenant_url: Workday tenant URL (for authentication)
             timeout_seconds: HTTP request timeout
             retry_attempts: Number of retry attempts
+            client: HTTP client to use (default: the shared federation client)
         """
-        super().__init__(endpoint, timeout_seconds, retry_attempts)
+        super().__init__(endpoint, timeout_seconds, retry_attempts, client=client)
         self.auth_type = auth_type
         self.auth_env_var = auth_env_var
         self.tenant_url = tenant_url
@@ -126,7 +125,9 @@ class AsorFederationClient(BaseFederationClient):
         data = {"grant_type": "client_credentials"}
 
         try:
-            response = self.client.post(token_url, data=data, headers=headers)
+            response = self.client.post(
+                token_url, data=data, headers=headers, timeout=self.timeout_seconds
+            )
             response.raise_for_status()
             token_data = response.json()
 
@@ -171,7 +172,7 @@ class AsorFederationClient(BaseFederationClient):
             logger.error("Failed to authenticate with Workday")
             return None
 
-        logger.debug(f"Using access token for API call: {access_token[:50]}...")
+        logger.debug("Using access token for API call: %s...", access_token[:50])
 
         # Build headers - match working test script format
         headers = {
@@ -181,11 +182,11 @@ class AsorFederationClient(BaseFederationClient):
         }
 
         # Make request
-        logger.info(f"Fetching agent {agent_id} from ASOR")
+        logger.info("Fetching agent %s from ASOR", agent_id)
         response = self._make_request(url, headers=headers)
 
         if not response:
-            logger.error(f"Failed to fetch agent {agent_id}")
+            logger.error("Failed to fetch agent %s", agent_id)
             return None
 
         # Transform response to internal format
@@ -259,12 +260,20 @@ class AsorFederationClient(BaseFederationClient):
             logger.info("No agent configs provided, listing all agents from ASOR")
             return self.list_all_agents()
 
-        for config in agent_configs:
-            agent_data = self.fetch_agent(config.id, config)
+        # Authenticate once so concurrent fetches reuse the cached token
+        if not self._get_access_token():
+            logger.error("Failed to authenticate with Workday")
+            return []
+
+        results = self._fetch_concurrently(
+            lambda config: self.fetch_agent(config.id, config), agent_configs
+        )
+
+        for config, agent_data in zip(agent_configs, results):
             if agent_data:
                 agents.append(agent_data)
             else:
-                logger.warning(f"Failed to fetch agent: {config.id}")
+                logger.warning("Failed to fetch agent: %s", config.id)
 
         logger.info(f"Successfully fetched {len(agents)}/{len(agent_configs)} agents")
         return agents
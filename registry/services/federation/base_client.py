@@ -5,23 +5,53 @@ Provides common functionality for all federation clients.
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import httpx
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by all federation clients so repeated syncs reuse
+# keep-alive connections instead of paying a TCP/TLS handshake each time
+_shared_client: httpx.Client | None = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client used by federation clients."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.Client(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return _shared_client
+
+
+def close_shared_http_client() -> None:
+    """Close the shared HTTP client, e.g. on application shutdown."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
 
 class BaseFederationClient(ABC):
     """Base class for federation clients."""
 
-    def __init__(self, endpoint: str, timeout_seconds: int = 30, retry_attempts: int = 3):
+    def __init__(
+        self,
+        endpoint: str,
+        timeout_seconds: int = 30,
+        retry_attempts: int = 3,
+        max_concurrency: int = 10,
+        client: httpx.Client | None = None,
+    ):
         """
         Initialize federation client.
 
@@ -29,16 +59,14 @@ class BaseFederationClient(ABC):
             endpoint: Base URL for the federation API
             timeout_seconds: HTTP request timeout
             retry_attempts: Number of retry attempts for failed requests
+            max_concurrency: Maximum number of requests in flight in fetch_all_* calls
+            client: HTTP client to use (default: the shared federation client)
         """
         self.endpoint = endpoint.rstrip("/")
         self.timeout_seconds = timeout_seconds
         self.retry_attempts = retry_attempts
-        self.client = httpx.Client(timeout=timeout_seconds)
-
-    def __del__(self):
-        """Clean up HTTP client."""
-        if hasattr(self, "client"):
-            self.client.close()
+        self.max_concurrency = max_concurrency
+        self.client = client if client is not None else get_shared_http_client()
 
     @abstractmethod
     def fetch_server(self, server_name: str, **kwargs) -> dict[str, Any] | None:
@@ -68,6 +96,59 @@ class BaseFederationClient(ABC):
         """
         pass
 
+    def _fetch_concurrently(
+        self,
+        fetch: Callable[[Any], dict[str, Any] | None],
+        items: list[Any],
+    ) -> list[dict[str, Any] | None]:
+        """
+        Call ``fetch`` for each item on a bounded thread pool.
+
+        httpx.Client is thread-safe, so the requests share its connection pool
+        while their round trips overlap.
+
+        Args:
+            fetch: Blocking function fetching one item
+            items: Items to fetch
+
+        Returns:
+            Results in the same order as ``items``
+        """
+        if len(items) <= 1:
+            return [fetch(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(items)),
+            thread_name_prefix="federation-fetch",
+        ) as executor:
+            return list(executor.map(fetch, items))
+
+    def _iter_concurrently(
+        self,
+        fetch: Callable[[Any], dict[str, Any] | None],
+        items: list[Any],
+    ) -> Iterator[tuple[Any, dict[str, Any] | None]]:
+        """
+        Call ``fetch`` for each item on a bounded thread pool, yielding as results arrive.
+
+        Args:
+            fetch: Blocking function fetching one item
+            items: Items to fetch
+
+        Yields:
+            (item, result) pairs in completion order
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_concurrency, len(items))),
+            thread_name_prefix="federation-fetch",
+        )
+        try:
+            futures = {executor.submit(fetch, item): item for item in items}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _make_request(
         self,
         url: str,
@@ -92,11 +173,20 @@ class BaseFederationClient(ABC):
         for attempt in range(self.retry_attempts):
             try:
                 logger.debug(
-                    f"Making {method} request to {url} (attempt {attempt + 1}/{self.retry_attempts})"
+                    "Making %s request to %s (attempt %d/%d)",
+                    method,
+                    url,
+                    attempt + 1,
+                    self.retry_attempts,
                 )
 
                 response = self.client.request(
-                    method=method, url=url, headers=headers, params=params, json=data
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    json=data,
+                    timeout=self.timeout_seconds,
                 )
 
                 response.raise_for_status()
@@ -202,22 +202,26 @@ class FederationService:
             # Extract agent info from ASOR data structure
             agent_name = agent_data.get("name", "Unknown ASOR Agent")
             agent_path = f"/{agent_name.lower().replace('_', '-')}"
+
+            # Skip known agents before building a card for them
+            if agent_path in agent_service.registered_agents:
+                logger.debug(f"ASOR agent {agent_path} already exists, skipping registration")
+                continue
+
             agent_url = agent_data.get("url", "")
             agent_description = agent_data.get("description", "Agent synced from ASOR")
             if agent_description == "None":
                 agent_description = f"ASOR agent: {agent_name}"
 
             # Extract skills
-            skills_data = agent_data.get("skills", [])
-            skills = []
-            for skill in skills_data:
-                skills.append(
-                    {
-                        "name": skill.get("name", ""),
-                        "description": skill.get("description", ""),
-                        "id": skill.get("id", ""),
-                    }
-                )
+            skills = [
+                {
+                    "name": skill.get("name", ""),
+                    "description": skill.get("description", ""),
+                    "id": skill.get("id", ""),
+                }
+                for skill in agent_data.get("skills", [])
+            ]
 
             # Convert ASOR agent data to AgentCard format
             agent_card = AgentCard(
@@ -238,11 +242,6 @@ class FederationService:
             )
 
             try:
-                # Check if agent already exists
-                if agent_path in agent_service.registered_agents:
-                    logger.debug(f"ASOR agent {agent_path} already exists, skipping registration")
-                    continue
-
                 # Register the agent using the proper method
                 await agent_service.register_agent(agent_card)
                 logger.info(f"Registered ASOR agent: {agent_card.name} at {agent_card.path}")
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Collection
 from typing import Any
 
 from ..repositories.factory import get_server_repository
@@ -96,19 +97,60 @@ class ServerService:
         if result:
             # Trigger nginx config regeneration
             try:
-                from ..core.nginx_service import nginx_service
-
-                enabled_servers = {
-                    service_path: await self.get_server_info(service_path)
-                    for service_path in await self.get_enabled_services()
-                }
-                nginx_service.generate_config(enabled_servers)
-                nginx_service.reload_nginx()
+                await self._regenerate_nginx()
             except Exception as e:
                 logger.error(f"Failed to update nginx configuration after toggle: {e}")
 
         return result
 
+    async def bulk_upsert_servers(
+        self,
+        servers: list[dict[str, Any]],
+        enabled: bool = True,
+    ) -> list[str]:
+        """Create or update many servers and set their state in one repository write.
+
+        Nginx is regenerated once for the whole batch rather than once per server.
+
+        Args:
+            servers: Server definitions, each with a "path" key
+            enabled: State to set on every written server
+
+        Returns:
+            Paths of the servers that were written
+        """
+        paths = await self._repo.bulk_upsert(servers, enabled)
+        if not paths:
+            return paths
+
+        written = set(paths)
+        for server_info in servers:
+            path = server_info["path"]
+            if path not in written:
+                continue
+            try:
+                await self._search_repo.index_server(path, server_info, enabled)
+            except Exception as e:
+                logger.error(f"Failed to index server {path}: {e}")
+
+        try:
+            await self._regenerate_nginx()
+        except Exception as e:
+            logger.error(f"Failed to update nginx configuration after bulk upsert: {e}")
+
+        return paths
+
+    async def _regenerate_nginx(self) -> None:
+        """Regenerate and reload nginx config for the currently enabled servers."""
+        from ..core.nginx_service import nginx_service
+
+        enabled_servers = {
+            service_path: await self.get_server_info(service_path)
+            for service_path in await self.get_enabled_services()
+        }
+        nginx_service.generate_config(enabled_servers)
+        nginx_service.reload_nginx()
+
     async def get_server_info(self, path: str) -> dict[str, Any] | None:
         """Get server information by path - queries repository directly."""
         return await self._repo.get(path)
@@ -251,31 +293,32 @@ class ServerService:
             logger.info(f"[FILTER DEBUG] Filtered server paths: {list(filtered_servers.keys())}")
             return filtered_servers
 
-    async def user_can_access_server_path(self, path: str, accessible_servers: list[str]) -> bool:
+    async def user_can_access_server_path(
+        self, path: str, accessible_servers: Collection[str]
+    ) -> bool:
         """
         Check if user can access a specific server by path.
 
         Args:
             path: Server path to check
-            accessible_servers: List of server names the user can access
+            accessible_servers: Server names the user can access
 
         Returns:
             True if user can access the server, False otherwise
         """
-        server_info = await self.get_server_info(path)
-        if not server_info:
-            return False
-
         # Extract technical name from path (remove leading and trailing slashes)
         technical_name = path.strip("/")
 
-        # Check with normalized paths - support "currenttime", "/currenttime", "/currenttime/"
-        for accessible_server in accessible_servers:
-            normalized_accessible = accessible_server.strip("/")
-            if technical_name == normalized_accessible:
-                return True
+        # Check with normalized paths - support "currenttime", "/currenttime", "/currenttime/".
+        # Done before the repository lookup so denied users cost no read.
+        if not any(
+            technical_name == accessible_server.strip("/")
+            for accessible_server in accessible_servers
+        ):
+            return False
 
-        return False
+        server_info = await self.get_server_info(path)
+        return bool(server_info)
 
     async def is_service_enabled(self, path: str) -> bool:
         """Check if a service is enabled."""
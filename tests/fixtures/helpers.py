@@ -4,13 +4,19 @@ Test helper functions for MCP Gateway Registry tests.
 This module provides utility functions for common test operations.
 """
 
+import importlib
+import importlib.util
 import json
+import sys
 import tempfile
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from registry.schemas import AgentCard, ServerDetail
 
+CREDENTIALS_PROVIDER_DIR = Path(__file__).resolve().parents[2] / "credentials-provider"
+
 
 def create_temp_directory() -> Path:
     """
@@ -273,3 +279,28 @@ def create_minimal_agent_dict(
         "defaultOutputModes": ["text/plain"],
         "skills": [],
     }
+
+
+def load_credentials_provider_module(module_name: str) -> ModuleType:
+    """
+    Import a credentials-provider submodule.
+
+    The package directory name contains a hyphen, so it is loaded under the
+    importable name ``credentials_provider``.
+
+    Args:
+        module_name: Submodule name (e.g. "utils" or "m2m_auth")
+
+    Returns:
+        The imported submodule
+    """
+    if "credentials_provider" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "credentials_provider",
+            CREDENTIALS_PROVIDER_DIR / "__init__.py",
+            submodule_search_locations=[str(CREDENTIALS_PROVIDER_DIR)],
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules["credentials_provider"] = package
+        spec.loader.exec_module(package)
+    return importlib.import_module(f"credentials_provider.{module_name}")
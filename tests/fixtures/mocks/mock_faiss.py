@@ -78,13 +78,19 @@ class MockFaissIndex:
         self.add_with_ids(vectors, ids)
         self._next_id += n
 
-    def search(self, query_vectors: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    def search(
+        self,
+        query_vectors: np.ndarray,
+        k: int,
+        params: "MockSearchParameters | None" = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Search for nearest neighbors.
 
         Args:
             query_vectors: Query vectors (shape: [n, d])
             k: Number of nearest neighbors to return
+            params: Optional search parameters; params.sel restricts the candidate IDs
 
         Returns:
             Tuple of (distances, indices) arrays
@@ -95,16 +101,19 @@ class MockFaissIndex:
             )
 
         n_queries = query_vectors.shape[0]
-        n_vectors = self.ntotal
+        selector = params.sel if params is not None else None
+        candidate_ids = [
+            vid for vid in self._vectors if selector is None or selector.is_member(vid)
+        ]
 
-        if n_vectors == 0:
-            # No vectors in index, return empty results
+        if not candidate_ids:
+            # No (selected) vectors in index, return empty results
             distances = np.full((n_queries, k), float("inf"), dtype=np.float32)
             indices = np.full((n_queries, k), -1, dtype=np.int64)
             return distances, indices
 
-        # Calculate distances for all vectors
-        all_ids = np.array(list(self._vectors.keys()), dtype=np.int64)
+        # Calculate distances for all candidate vectors
+        all_ids = np.array(candidate_ids, dtype=np.int64)
         all_vectors = np.array([self._vectors[vid] for vid in all_ids])
 
         distances_list = []
@@ -191,9 +200,14 @@ class MockIndexIDMap:
         """Add vectors with IDs."""
         self.index.add_with_ids(vectors, ids)
 
-    def search(self, query_vectors: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
-        """Search for nearest neighbors."""
-        return self.index.search(query_vectors, k)
+    def search(
+        self,
+        query_vectors: np.ndarray,
+        k: int,
+        params: "MockSearchParameters | None" = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Search for nearest neighbors, optionally restricted by params.sel."""
+        return self.index.search(query_vectors, k, params=params)
 
     def remove_ids(self, ids: np.ndarray) -> int:
         """Remove vectors by IDs."""
@@ -204,6 +218,41 @@ class MockIndexIDMap:
         self.index.reset()
 
 
+class MockIDSelectorBatch:
+    """
+    Mock implementation of FAISS IDSelectorBatch.
+
+    Selects the IDs in a batch; the real class reads them through a swig pointer.
+    """
+
+    def __init__(self, n: int, ids: np.ndarray):
+        """
+        Initialize mock selector.
+
+        Args:
+            n: Number of IDs in the batch
+            ids: Array of IDs (as returned by the mock swig_ptr)
+        """
+        self._ids = {int(vector_id) for vector_id in ids[:n]}
+
+    def is_member(self, vector_id: int) -> bool:
+        """Check whether an ID is selected."""
+        return int(vector_id) in self._ids
+
+
+class MockSearchParameters:
+    """Mock implementation of FAISS SearchParameters."""
+
+    def __init__(self, sel: MockIDSelectorBatch | None = None):
+        """
+        Initialize mock search parameters.
+
+        Args:
+            sel: Optional ID selector restricting the search
+        """
+        self.sel = sel
+
+
 def create_mock_faiss_module() -> Any:
     """
     Create a mock FAISS module for testing.
@@ -236,6 +285,14 @@ def create_mock_faiss_module() -> Any:
             logger.debug("Creating MockIndexIDMap")
             return MockIndexIDMap(index)
 
+        IDSelectorBatch = MockIDSelectorBatch
+        SearchParameters = MockSearchParameters
+
+        @staticmethod
+        def swig_ptr(array: np.ndarray) -> np.ndarray:
+            """Mock swig_ptr that passes the array through unchanged."""
+            return array
+
         @staticmethod
         def read_index(filepath: str) -> MockFaissIndex:
             """
@@ -0,0 +1,559 @@
+"""
+Unit tests for registry/api/federation_routes.py
+
+Tests the federation config routes:
+- Cache hits skip the repository
+- Writes invalidate cached responses
+- A zero TTL disables caching
+- Stale responses are served when the backend fails and fallback is on
+- Anthropic server / ASOR agent add and remove
+- Anthropic and ASOR sync run concurrently, with servers registered in batches
+- Malformed config IDs are rejected before repository access
+- The config list can be streamed as NDJSON
+"""
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from pymongo.errors import ServerSelectionTimeoutError
+
+from registry.api import federation_routes
+from registry.api.federation_routes import (
+    add_anthropic_server,
+    add_asor_agent,
+    delete_federation_config,
+    get_federation_config,
+    list_federation_configs,
+    remove_anthropic_server,
+    remove_asor_agent,
+    save_federation_config,
+    sync_federation,
+)
+from registry.auth.dependencies import nginx_proxied_auth
+from registry.core.config import settings
+from registry.repositories.documentdb.federation_config_repository import (
+    DocumentDBFederationConfigRepository,
+)
+from registry.repositories.file.federation_config_repository import (
+    FileFederationConfigRepository,
+)
+from registry.schemas.federation_schema import (
+    AnthropicServerConfig,
+    AsorAgentConfig,
+    FederationConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+
+USER_CONTEXT = {"username": "admin"}
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_federation_cache():
+    """Start every test with an empty response cache."""
+    federation_routes._invalidate_config_cache()
+    yield
+    federation_routes._invalidate_config_cache()
+
+
+@pytest.fixture
+def mock_repo():
+    """Mock federation config repository."""
+    repo = AsyncMock()
+    repo.get_config.return_value = FederationConfig()
+    repo.save_config.side_effect = lambda config, config_id: config
+    repo.delete_config.return_value = True
+    repo.list_configs.return_value = [{"id": "default"}]
+    return repo
+
+
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFederationConfigCache:
+    """Tests for the federation config GET response cache."""
+
+    async def test_get_config_served_from_cache(self, mock_repo):
+        """Repeated GETs within the TTL hit the repository once."""
+        first = await get_federation_config("default", USER_CONTEXT, mock_repo)
+        second = await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+        assert first == second
+        mock_repo.get_config.assert_awaited_once_with("default")
+
+    async def test_list_configs_served_from_cache(self, mock_repo):
+        """Repeated list calls within the TTL hit the repository once."""
+        await list_federation_configs(USER_CONTEXT, mock_repo)
+        result = await list_federation_configs(USER_CONTEXT, mock_repo)
+
+        assert result == {"configs": [{"id": "default"}], "total": 1}
+        mock_repo.list_configs.assert_awaited_once()
+
+    async def test_save_invalidates_cache(self, mock_repo):
+        """Saving a config drops cached lists and caches the saved config."""
+        await get_federation_config("default", USER_CONTEXT, mock_repo)
+        await list_federation_configs(USER_CONTEXT, mock_repo)
+
+        saved = FederationConfig()
+        saved.anthropic.enabled = True
+        result = await save_federation_config(saved, "default", USER_CONTEXT, mock_repo)
+        config = await get_federation_config("default", USER_CONTEXT, mock_repo)
+        await list_federation_configs(USER_CONTEXT, mock_repo)
+
+        assert config is result["config"]
+        assert config["anthropic"]["enabled"] is True
+        assert mock_repo.get_config.await_count == 1
+        assert mock_repo.list_configs.await_count == 2
+
+    async def test_delete_invalidates_cache(self, mock_repo):
+        """Deleting a config drops cached GET responses."""
+        await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+        await delete_federation_config("default", USER_CONTEXT, mock_repo)
+        await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+        assert mock_repo.get_config.await_count == 2
+
+    async def test_zero_ttl_disables_cache(self, mock_repo, monkeypatch):
+        """A TTL of zero sends every GET to the repository."""
+        monkeypatch.setattr(settings, "federation_config_cache_ttl_seconds", 0)
+
+        await get_federation_config("default", USER_CONTEXT, mock_repo)
+        await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+        assert mock_repo.get_config.await_count == 2
+
+
+# =============================================================================
+# STALE FALLBACK
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFederationCacheFallback:
+    """Tests for serving stale cached responses when the backend fails."""
+
+    async def test_stale_config_served_when_backend_fails(self, mock_repo, monkeypatch):
+        """An expired cached config is returned with X-Cache: STALE."""
+        monkeypatch.setattr(settings, "federation_cache_fallback", True)
+        cached = await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+        monkeypatch.setattr(settings, "federation_config_cache_ttl_seconds", 0)
+        mock_repo.get_config.side_effect = ConnectionError("backend down")
+        response = await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+        assert response.headers["X-Cache"] == "STALE"
+        assert json.loads(response.body) == cached
+
+    async def test_stale_list_served_when_backend_fails(self, mock_repo, monkeypatch):
+        """An expired cached list is returned with X-Cache: STALE."""
+        monkeypatch.setattr(settings, "federation_cache_fallback", True)
+        await list_federation_configs(USER_CONTEXT, mock_repo)
+
+        monkeypatch.setattr(settings, "federation_config_cache_ttl_seconds", 0)
+        mock_repo.list_configs.side_effect = TimeoutError("backend slow")
+        response = await list_federation_configs(USER_CONTEXT, mock_repo)
+
+        assert response.headers["X-Cache"] == "STALE"
+
+    async def test_stale_config_served_when_file_unreadable(self, tmp_path, monkeypatch):
+        """A file repository that cannot parse its config triggers the fallback."""
+        repo = FileFederationConfigRepository(config_dir=tmp_path)
+        await repo.save_config(FederationConfig(), "default")
+        monkeypatch.setattr(settings, "federation_cache_fallback", True)
+        cached = await get_federation_config("default", USER_CONTEXT, repo)
+
+        monkeypatch.setattr(settings, "federation_config_cache_ttl_seconds", 0)
+        (tmp_path / "default.json").write_text("{not json")
+        response = await get_federation_config("default", USER_CONTEXT, repo)
+
+        assert response.headers["X-Cache"] == "STALE"
+        assert json.loads(response.body) == cached
+
+    async def test_stale_config_served_when_documentdb_unavailable(self, monkeypatch):
+        """A DocumentDB outage triggers the fallback instead of a 404."""
+        repo = DocumentDBFederationConfigRepository()
+        repo._collection = AsyncMock()
+        repo._collection.find_one.side_effect = [
+            {"_id": "default", **FederationConfig().model_dump()},
+            ServerSelectionTimeoutError("no servers available"),
+        ]
+        monkeypatch.setattr(settings, "federation_cache_fallback", True)
+        await get_federation_config("default", USER_CONTEXT, repo)
+
+        monkeypatch.setattr(settings, "federation_config_cache_ttl_seconds", 0)
+        response = await get_federation_config("default", USER_CONTEXT, repo)
+
+        assert response.headers["X-Cache"] == "STALE"
+
+    async def test_list_outage_not_cached_as_empty(self, monkeypatch):
+        """A failed DocumentDB listing raises instead of caching an empty list."""
+        repo = DocumentDBFederationConfigRepository()
+        repo._collection = MagicMock()
+        repo._collection.find.side_effect = ServerSelectionTimeoutError("no servers available")
+
+        with pytest.raises(ServerSelectionTimeoutError):
+            await list_federation_configs(USER_CONTEXT, repo)
+
+        assert federation_routes._LIST_CACHE_KEY not in federation_routes._response_cache
+
+    async def test_backend_error_raised_when_fallback_disabled(self, mock_repo, monkeypatch):
+        """Without fallback the repository error propagates."""
+        await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+        monkeypatch.setattr(settings, "federation_config_cache_ttl_seconds", 0)
+        mock_repo.get_config.side_effect = ConnectionError("backend down")
+
+        with pytest.raises(ConnectionError):
+            await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+    async def test_backend_error_raised_without_cached_copy(self, mock_repo, monkeypatch):
+        """With nothing cached the repository error propagates."""
+        monkeypatch.setattr(settings, "federation_cache_fallback", True)
+        mock_repo.get_config.side_effect = ConnectionError("backend down")
+
+        with pytest.raises(ConnectionError):
+            await get_federation_config("default", USER_CONTEXT, mock_repo)
+
+
+# =============================================================================
+# SERVER AND AGENT ENTRIES
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFederationEntries:
+    """Tests for adding and removing Anthropic servers and ASOR agents."""
+
+    @pytest.fixture
+    async def populated_repo(self, tmp_path):
+        """File repository holding a config with three servers and three agents."""
+        repo = FileFederationConfigRepository(config_dir=tmp_path)
+        config = FederationConfig()
+        config.anthropic.servers = [AnthropicServerConfig(name=f"s{i}") for i in range(3)]
+        config.asor.agents = [AsorAgentConfig(id=f"a{i}") for i in range(3)]
+        await repo.save_config(config, "default")
+        return repo
+
+    async def test_add_duplicate_server_rejected(self, populated_repo):
+        """Adding an existing server name returns 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            await add_anthropic_server("default", "s1", USER_CONTEXT, populated_repo)
+
+        assert exc_info.value.status_code == 400
+        config = await populated_repo.get_config("default")
+        assert [s.name for s in config.anthropic.servers] == ["s0", "s1", "s2"]
+
+    async def test_missing_config_returns_404(self, populated_repo):
+        """Mutating an unknown config returns 404."""
+        with pytest.raises(HTTPException) as exc_info:
+            await add_asor_agent("other", "a9", USER_CONTEXT, populated_repo)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_entry_changes_persisted(self, populated_repo):
+        """Entry updates are written back and keep the original created_at."""
+        config_path = populated_repo._get_config_path("default")
+        created_at = json.loads(config_path.read_text())["created_at"]
+
+        await add_anthropic_server("default", "s3", USER_CONTEXT, populated_repo)
+        await remove_asor_agent("default", "a1", USER_CONTEXT, populated_repo)
+
+        stored = json.loads(config_path.read_text())
+        assert stored["created_at"] == created_at
+        assert [s["name"] for s in stored["anthropic"]["servers"]] == ["s0", "s1", "s2", "s3"]
+        assert [a["id"] for a in stored["asor"]["agents"]] == ["a0", "a2"]
+
+    async def test_remove_server_keeps_order(self, populated_repo):
+        """Removing a server drops only that entry."""
+        result = await remove_anthropic_server("default", "s1", USER_CONTEXT, populated_repo)
+
+        assert [s["name"] for s in result["config"]["anthropic"]["servers"]] == ["s0", "s2"]
+
+    async def test_remove_missing_server_returns_404(self, populated_repo):
+        """Removing an unknown server returns 404."""
+        with pytest.raises(HTTPException) as exc_info:
+            await remove_anthropic_server("default", "nope", USER_CONTEXT, populated_repo)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_add_and_remove_agent(self, populated_repo):
+        """Agents are appended on add and dropped on remove."""
+        added = await add_asor_agent("default", "a3", USER_CONTEXT, populated_repo)
+        assert [a["id"] for a in added["config"]["asor"]["agents"]] == ["a0", "a1", "a2", "a3"]
+
+        removed = await remove_asor_agent("default", "a0", USER_CONTEXT, populated_repo)
+        assert [a["id"] for a in removed["config"]["asor"]["agents"]] == ["a1", "a2", "a3"]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await add_asor_agent("default", "a1", USER_CONTEXT, populated_repo)
+        assert exc_info.value.status_code == 400
+
+
+# =============================================================================
+# SYNC
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFederationSync:
+    """Tests for the manual federation sync endpoint."""
+
+    @pytest.fixture
+    def enabled_repo(self, mock_repo):
+        """Repository returning a config with both sources enabled."""
+        config = FederationConfig()
+        config.anthropic.enabled = True
+        config.asor.enabled = True
+        mock_repo.get_config.return_value = config
+        return mock_repo
+
+    async def test_sources_sync_concurrently(self, enabled_repo, monkeypatch):
+        """Anthropic and ASOR syncs overlap instead of running back to back."""
+        anthropic_started = asyncio.Event()
+        asor_started = asyncio.Event()
+
+        async def fake_anthropic(config, results):
+            anthropic_started.set()
+            await asyncio.wait_for(asor_started.wait(), timeout=1)
+            results["servers"].append("server")
+            results["count"] = 1
+
+        async def fake_asor(config, results):
+            asor_started.set()
+            await asyncio.wait_for(anthropic_started.wait(), timeout=1)
+            results["agents"].extend(["agent-a", "agent-b"])
+            results["count"] = 2
+
+        monkeypatch.setattr(federation_routes, "_sync_anthropic", fake_anthropic)
+        monkeypatch.setattr(federation_routes, "_sync_asor", fake_asor)
+
+        result = await sync_federation("default", None, USER_CONTEXT, enabled_repo)
+
+        assert result["total_synced"] == 3
+        assert result["results"]["anthropic"]["servers"] == ["server"]
+        assert result["results"]["asor"]["agents"] == ["agent-a", "agent-b"]
+
+    async def test_source_failure_returns_500(self, enabled_repo, monkeypatch):
+        """A failing source still fails the whole sync."""
+
+        async def failing_sync(config, results):
+            raise RuntimeError("upstream down")
+
+        monkeypatch.setattr(federation_routes, "_sync_anthropic", failing_sync)
+        monkeypatch.setattr(federation_routes, "_sync_asor", AsyncMock())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await sync_federation("default", None, USER_CONTEXT, enabled_repo)
+
+        assert exc_info.value.status_code == 500
+
+    async def test_anthropic_servers_registered_in_batches(self, enabled_repo, monkeypatch):
+        """Fetched servers are upserted in batches as they stream in."""
+        from registry.services.server_service import server_service
+
+        servers = [{"path": f"/s{i}", "server_name": f"s{i}"} for i in range(5)]
+        servers.insert(2, {"server_name": "no-path"})
+        bulk_upsert = AsyncMock(side_effect=lambda batch: [s["path"] for s in batch])
+
+        monkeypatch.setattr(federation_routes, "_SYNC_BATCH_SIZE", 2)
+        monkeypatch.setattr(federation_routes, "_sync_asor", AsyncMock())
+        monkeypatch.setattr(server_service, "bulk_upsert_servers", bulk_upsert)
+        with patch(
+            "registry.services.federation.anthropic_client.AnthropicFederationClient.iter_servers",
+            return_value=(server for server in servers),
+        ):
+            result = await sync_federation("default", "anthropic", USER_CONTEXT, enabled_repo)
+
+        assert [len(call.args[0]) for call in bulk_upsert.await_args_list] == [2, 2, 1]
+        assert result["results"]["anthropic"]["servers"] == [f"s{i}" for i in range(5)]
+        assert result["total_synced"] == 5
+
+    async def test_anthropic_registration_failure_reports_error(self, enabled_repo, monkeypatch):
+        """A registration failure surfaces its own message and stops the fetches."""
+        from registry.services.server_service import server_service
+
+        closed = []
+
+        def iter_servers(server_configs):
+            try:
+                for i in range(10):
+                    yield {"path": f"/s{i}", "server_name": f"s{i}"}
+            finally:
+                closed.append(True)
+
+        monkeypatch.setattr(federation_routes, "_SYNC_BATCH_SIZE", 1)
+        monkeypatch.setattr(
+            server_service,
+            "bulk_upsert_servers",
+            AsyncMock(side_effect=RuntimeError("database unavailable")),
+        )
+        with (
+            patch(
+                "registry.services.federation.anthropic_client.AnthropicFederationClient.iter_servers",
+                side_effect=iter_servers,
+            ),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await sync_federation("default", "anthropic", USER_CONTEXT, enabled_repo)
+
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.detail == "Federation sync failed: database unavailable"
+        assert closed == [True]
+
+    async def test_known_asor_agents_skipped(self, enabled_repo, monkeypatch):
+        """Agents whose path is already registered are not re-registered."""
+        from registry.services.agent_service import agent_service
+
+        agents = [{"name": "Known_Agent"}, {"name": "New_Agent"}]
+        register_agent = AsyncMock()
+
+        monkeypatch.setattr(federation_routes, "_sync_anthropic", AsyncMock())
+        monkeypatch.setattr(
+            federation_routes, "AgentCard", lambda **fields: SimpleNamespace(**fields)
+        )
+        monkeypatch.setattr(agent_service, "registered_agents", {"/known-agent": object()})
+        monkeypatch.setattr(agent_service, "register_agent", register_agent)
+        with patch(
+            "registry.services.federation.asor_client.AsorFederationClient.fetch_all_agents",
+            return_value=agents,
+        ):
+            result = await sync_federation("default", "asor", USER_CONTEXT, enabled_repo)
+
+        assert result["results"]["asor"]["agents"] == ["New_Agent"]
+        register_agent.assert_awaited_once()
+        assert register_agent.await_args.args[0].path == "/new-agent"
+
+    @pytest.mark.parametrize(
+        ("source", "anthropic_enabled", "asor_enabled"),
+        [(None, False, False), ("anthropic", False, True), ("unknown", True, True)],
+    )
+    async def test_nothing_to_sync_returns_early(
+        self, mock_repo, monkeypatch, source, anthropic_enabled, asor_enabled
+    ):
+        """With no enabled source selected, neither sync runs."""
+        config = FederationConfig()
+        config.anthropic.enabled = anthropic_enabled
+        config.asor.enabled = asor_enabled
+        mock_repo.get_config.return_value = config
+        sync_anthropic = AsyncMock()
+        sync_asor = AsyncMock()
+        monkeypatch.setattr(federation_routes, "_sync_anthropic", sync_anthropic)
+        monkeypatch.setattr(federation_routes, "_sync_asor", sync_asor)
+
+        result = await sync_federation("default", source, USER_CONTEXT, mock_repo)
+
+        assert result["message"] == "Nothing to sync"
+        assert result["total_synced"] == 0
+        sync_anthropic.assert_not_called()
+        sync_asor.assert_not_called()
+
+
+# =============================================================================
+# NDJSON LISTING
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFederationConfigStreaming:
+    """Tests for streaming the config list as NDJSON."""
+
+    @pytest.fixture
+    async def file_repo(self, tmp_path):
+        """File repository holding two configs."""
+        repo = FileFederationConfigRepository(config_dir=tmp_path)
+        await repo.save_config(FederationConfig(), "default")
+        await repo.save_config(FederationConfig(), "staging")
+        return repo
+
+    async def test_ndjson_accept_streams_summaries(self, file_repo):
+        """An NDJSON Accept header streams one summary per line."""
+        response = await list_federation_configs(
+            USER_CONTEXT, file_repo, accept="application/x-ndjson"
+        )
+
+        assert response.media_type == "application/x-ndjson"
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert sorted(line["id"] for line in lines) == ["default", "staging"]
+        assert all(line["created_at"] for line in lines)
+
+    async def test_default_accept_returns_list(self, file_repo):
+        """Without an NDJSON Accept header the list body is returned."""
+        result = await list_federation_configs(USER_CONTEXT, file_repo)
+
+        assert result["total"] == 2
+        assert sorted(config["id"] for config in result["configs"]) == ["default", "staging"]
+
+
+# =============================================================================
+# RESPONSE ENCODING
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFederationResponseClass:
+    """Tests for federation route JSON encoding."""
+
+    def test_routes_use_orjson(self):
+        """Every federation route encodes its body with orjson."""
+        assert federation_routes.router.routes
+        for route in federation_routes.router.routes:
+            assert route.response_class is ORJSONResponse
+
+
+# =============================================================================
+# CONFIG ID VALIDATION
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestConfigIdValidation:
+    """Tests for rejecting malformed config IDs before repository access."""
+
+    @pytest.fixture
+    def client(self, mock_repo):
+        """Test client for the federation router with auth and repo overridden."""
+        app = FastAPI()
+        app.include_router(federation_routes.router)
+        app.dependency_overrides[nginx_proxied_auth] = lambda: USER_CONTEXT
+        app.dependency_overrides[federation_routes._get_federation_repo] = lambda: mock_repo
+        return TestClient(app)
+
+    @pytest.mark.parametrize("config_id", ["bad id", "x" * 65, "a.b", "../etc"])
+    def test_malformed_query_config_id_rejected(self, client, mock_repo, config_id):
+        """Malformed query config IDs return 422 without a repository call."""
+        response = client.get("/federation/config", params={"config_id": config_id})
+
+        assert response.status_code == 422
+        mock_repo.get_config.assert_not_called()
+
+    def test_malformed_path_config_id_rejected(self, client, mock_repo):
+        """Malformed path config IDs return 422 without a repository call."""
+        response = client.delete("/federation/config/bad.id")
+
+        assert response.status_code == 422
+        mock_repo.delete_config.assert_not_called()
+
+    def test_valid_config_id_accepted(self, client, mock_repo):
+        """Well-formed config IDs reach the repository."""
+        response = client.get("/federation/config", params={"config_id": "prod_east-1"})
+
+        assert response.status_code == 200
+        mock_repo.get_config.assert_awaited_once_with("prod_east-1")
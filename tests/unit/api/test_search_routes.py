@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
 
 from registry.api.search_routes import (
@@ -23,10 +24,13 @@ from registry.api.search_routes import (
     SemanticSearchResponse,
     ServerSearchResult,
     ToolSearchResult,
-    _user_can_access_agent,
+    _agent_card_visible_to_user,
+    _agent_listed_for_user,
     _user_can_access_server,
+    router,
     semantic_search,
 )
+from registry.services.agent_service import agent_service
 from tests.fixtures.factories import AgentCardFactory
 
 logger = logging.getLogger(__name__)
@@ -55,6 +59,11 @@ def mock_server_service():
 def mock_agent_service():
     """Mock agent service for testing."""
     with patch("registry.api.search_routes.agent_service") as mock:
+        # Route cached lookups through whatever get_agent_info the test configures
+        async def get_cached_agent_info(path: str):
+            return await mock.get_agent_info(path)
+
+        mock.get_cached_agent_info = get_cached_agent_info
         yield mock
 
 
@@ -119,7 +128,9 @@ def mock_server_and_agent_service_db_calls():
             new=AsyncMock(side_effect=get_agent_info),
         ),
     ):
+        agent_service._agent_info_cache.invalidate()
         yield
+        agent_service._agent_info_cache.invalidate()
 
 
 @pytest.fixture
@@ -556,18 +567,35 @@ class TestUserCanAccessServer:
         mock_server_service.user_can_access_server_path = AsyncMock(return_value=True)
         user_context = {
             "is_admin": False,
-            "accessible_servers": ["server1"],
+            "accessible_servers": ["/servers/server1/"],
         }
 
         # Act
-        result = await _user_can_access_server("/servers/server1", "server1", user_context)
+        result = await _user_can_access_server("/servers/server1", "Server One", user_context)
 
         # Assert
         assert result is True
         mock_server_service.user_can_access_server_path.assert_called_once_with(
-            "/servers/server1", ["server1"]
+            "/servers/server1", ["/servers/server1/"]
         )
 
+    @pytest.mark.asyncio
+    async def test_direct_name_match_skips_server_service(self, mock_server_service):
+        """Test a direct name match does not query the server service."""
+        # Arrange
+        mock_server_service.user_can_access_server_path = AsyncMock(return_value=False)
+        user_context = {
+            "is_admin": False,
+            "accessible_servers": ["server1"],
+        }
+
+        # Act
+        result = await _user_can_access_server("/server1", "Server One", user_context)
+
+        # Assert
+        assert result is True
+        mock_server_service.user_can_access_server_path.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_user_can_access_via_technical_name(self, mock_server_service):
         """Test user can access via technical name match."""
@@ -636,191 +664,100 @@ class TestUserCanAccessServer:
 
 
 # =============================================================================
-# TEST: _user_can_access_agent Helper Function
+# TEST: Agent Access Helper Functions
 # =============================================================================
 
 
 @pytest.mark.unit
 @pytest.mark.api
 @pytest.mark.search
-class TestUserCanAccessAgent:
-    """Tests for _user_can_access_agent helper function."""
+class TestAgentListedForUser:
+    """Tests for _agent_listed_for_user helper function."""
 
-    @pytest.mark.asyncio
-    async def test_admin_user_can_access_any_agent(self, mock_agent_service):
-        """Test admin user can access any agent."""
-        # Arrange
-        mock_agent = AgentCardFactory(visibility="private")
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {"is_admin": True}
+    def test_user_without_agent_in_accessible_list(self):
+        """Test agent not in accessible_agents list is not listed."""
+        user_context = {"accessible_agents": ["/agents/other"]}
 
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
+        assert _agent_listed_for_user("/agents/test", user_context) is False
 
-        # Assert
-        assert result is True
+    def test_user_with_agent_in_accessible_list(self):
+        """Test agent in accessible_agents list is listed."""
+        user_context = {"accessible_agents": ["/agents/test"]}
 
-    @pytest.mark.asyncio
-    async def test_user_without_agent_in_accessible_list(self, mock_agent_service):
-        """Test user cannot access agent not in accessible_agents list."""
-        # Arrange
-        user_context = {
-            "is_admin": False,
-            "accessible_agents": ["/agents/other"],
-        }
+        assert _agent_listed_for_user("/agents/test", user_context) is True
 
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
+    def test_user_with_all_lists_every_agent(self):
+        """Test 'all' in accessible_agents lists any agent."""
+        user_context = {"accessible_agents": ["all"]}
 
-        # Assert
-        assert result is False
+        assert _agent_listed_for_user("/agents/test", user_context) is True
 
-    @pytest.mark.asyncio
-    async def test_user_with_all_can_access_public_agent(self, mock_agent_service):
-        """Test user with 'all' can access public agents."""
-        # Arrange
-        mock_agent = AgentCardFactory(visibility="public")
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {
-            "is_admin": False,
-            "accessible_agents": ["all"],
-        }
+    def test_user_without_accessible_agents(self):
+        """Test missing accessible_agents lists nothing."""
+        assert _agent_listed_for_user("/agents/test", {"accessible_agents": None}) is False
 
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
 
-        # Assert
-        assert result is True
+@pytest.mark.unit
+@pytest.mark.api
+@pytest.mark.search
+class TestAgentCardVisibleToUser:
+    """Tests for _agent_card_visible_to_user helper function."""
 
-    @pytest.mark.asyncio
-    async def test_agent_not_found_returns_false(self, mock_agent_service):
+    def test_missing_agent_card_not_visible(self):
         """Test returns False when agent not found."""
-        # Arrange
-        mock_agent_service.get_agent_info = AsyncMock(return_value=None)
-        user_context = {
-            "is_admin": False,
-            "accessible_agents": ["all"],
-        }
-
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
-
-        # Assert
-        assert result is False
+        assert _agent_card_visible_to_user(None, {}) is False
 
-    @pytest.mark.asyncio
-    async def test_public_agent_accessible_to_authorized_user(self, mock_agent_service):
-        """Test public agent is accessible to user in accessible list."""
-        # Arrange
-        mock_agent = AgentCardFactory(visibility="public")
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {
-            "is_admin": False,
-            "accessible_agents": ["/agents/test"],
-        }
-
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
-
-        # Assert
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_private_agent_accessible_to_owner(self, mock_agent_service):
-        """Test private agent is accessible to owner."""
-        # Arrange
-        mock_agent = AgentCardFactory(visibility="private", registered_by="testuser")
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {
-            "is_admin": False,
-            "username": "testuser",
-            "accessible_agents": ["/agents/test"],
-        }
+    def test_public_agent_visible(self):
+        """Test public agent is visible to any user."""
+        agent_card = AgentCardFactory(visibility="public")
 
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
+        assert _agent_card_visible_to_user(agent_card, {"username": "anyone"}) is True
 
-        # Assert
-        assert result is True
+    def test_private_agent_visible_to_owner(self):
+        """Test private agent is visible to owner."""
+        agent_card = AgentCardFactory(visibility="private", registered_by="testuser")
 
-    @pytest.mark.asyncio
-    async def test_private_agent_not_accessible_to_others(self, mock_agent_service):
-        """Test private agent is not accessible to non-owners."""
-        # Arrange
-        mock_agent = AgentCardFactory(visibility="private", registered_by="owner")
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {
-            "is_admin": False,
-            "username": "otheruser",
-            "accessible_agents": ["/agents/test"],
-        }
+        assert _agent_card_visible_to_user(agent_card, {"username": "testuser"}) is True
 
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
+    def test_private_agent_not_visible_to_others(self):
+        """Test private agent is not visible to non-owners."""
+        agent_card = AgentCardFactory(visibility="private", registered_by="owner")
 
-        # Assert
-        assert result is False
+        assert _agent_card_visible_to_user(agent_card, {"username": "otheruser"}) is False
 
-    @pytest.mark.asyncio
-    async def test_group_restricted_agent_accessible_to_group_member(self, mock_agent_service):
-        """Test group-restricted agent is accessible to group members."""
-        # Arrange
-        mock_agent = AgentCardFactory(
+    def test_group_restricted_agent_visible_to_group_member(self):
+        """Test group-restricted agent is visible to group members."""
+        agent_card = AgentCardFactory(
             visibility="group-restricted",
             allowed_groups=["group1", "group2"],
         )
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {
-            "is_admin": False,
-            "groups": ["group1", "group3"],
-            "accessible_agents": ["/agents/test"],
-        }
-
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
 
-        # Assert
-        assert result is True
+        assert _agent_card_visible_to_user(agent_card, {"groups": ["group1", "group3"]}) is True
 
-    @pytest.mark.asyncio
-    async def test_group_restricted_agent_not_accessible_to_non_member(self, mock_agent_service):
-        """Test group-restricted agent is not accessible to non-members."""
-        # Arrange
-        mock_agent = AgentCardFactory(
+    def test_group_restricted_agent_not_visible_to_non_member(self):
+        """Test group-restricted agent is not visible to non-members."""
+        agent_card = AgentCardFactory(
             visibility="group-restricted",
             allowed_groups=["group1", "group2"],
         )
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {
-            "is_admin": False,
-            "groups": ["group3"],
-            "accessible_agents": ["/agents/test"],
-        }
 
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
+        assert _agent_card_visible_to_user(agent_card, {"groups": ["group3"]}) is False
 
-        # Assert
-        assert result is False
+    def test_prebuilt_user_groups_take_precedence(self):
+        """Test a prebuilt group set is used instead of the context's groups."""
+        agent_card = AgentCardFactory(visibility="group-restricted", allowed_groups=["group1"])
 
-    @pytest.mark.asyncio
-    async def test_unknown_visibility_returns_false(self, mock_agent_service):
-        """Test unknown visibility type returns False."""
-        # Arrange
-        # Note: AgentCard validates visibility, so we use a Mock instead
-        mock_agent = Mock()
-        mock_agent.visibility = "unknown"
-        mock_agent_service.get_agent_info = AsyncMock(return_value=mock_agent)
-        user_context = {
-            "is_admin": False,
-            "accessible_agents": ["/agents/test"],
-        }
+        assert (
+            _agent_card_visible_to_user(agent_card, {"groups": []}, frozenset({"group1"})) is True
+        )
 
-        # Act
-        result = await _user_can_access_agent("/agents/test", user_context)
+    def test_unknown_visibility_not_visible(self):
+        """Test unknown visibility type returns False."""
+        # AgentCard validates visibility, so use a Mock instead
+        agent_card = Mock()
+        agent_card.visibility = "unknown"
 
-        # Assert
-        assert result is False
+        assert _agent_card_visible_to_user(agent_card, {}) is False
 
 
 # =============================================================================
@@ -845,12 +782,10 @@ class TestSemanticSearchSuccess:
         """Test admin user sees all search results."""
         # Arrange
         mock_search_repo.search = AsyncMock(return_value=sample_faiss_search_results)
-        mock_agent_service.get_agent_info.side_effect = lambda path: (
-            AgentCardFactory(
-                path=path,
-                name=path.split("/")[-1],
-                visibility="public",
-            )
+        mock_agent_service.get_agent_info.side_effect = lambda path: AgentCardFactory(
+            path=path,
+            name=path.split("/")[-1],
+            visibility="public",
         )
 
         request = SemanticSearchRequest(query="test query", max_results=10)
@@ -1007,6 +942,8 @@ class TestSemanticSearchSuccess:
             query="test query",
             entity_types=["mcp_server"],
             max_results=10,
+            accessible_servers=None,
+            accessible_agents=None,
         )
 
     @pytest.mark.asyncio
@@ -1030,8 +967,50 @@ class TestSemanticSearchSuccess:
             query="test query",
             entity_types=["mcp_server", "tool", "a2a_agent"],
             max_results=25,
+            accessible_servers=None,
+            accessible_agents=None,
         )
 
+    @pytest.mark.asyncio
+    async def test_semantic_search_response_round_trips_validation(
+        self,
+        mock_search_repo,
+        admin_user_context,
+        sample_faiss_search_results,
+    ):
+        """Test results built without validation still form a valid response."""
+        # Arrange
+        mock_search_repo.search = AsyncMock(return_value=sample_faiss_search_results)
+
+        request = SemanticSearchRequest(query="test query")
+
+        # Act
+        response = await semantic_search(request, admin_user_context, mock_search_repo)
+
+        # Assert
+        revalidated = SemanticSearchResponse.model_validate(response.model_dump())
+        assert revalidated == response
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_passes_access_scope_to_repository(
+        self,
+        mock_search_repo,
+        regular_user_context,
+    ):
+        """Test non-admin searches are restricted to the user's accessible entities."""
+        # Arrange
+        mock_search_repo.search = AsyncMock(return_value={"servers": [], "tools": [], "agents": []})
+
+        request = SemanticSearchRequest(query="test query")
+
+        # Act
+        await semantic_search(request, regular_user_context, mock_search_repo)
+
+        # Assert
+        kwargs = mock_search_repo.search.call_args.kwargs
+        assert kwargs["accessible_servers"] == ["currenttime", "mcpgw"]
+        assert kwargs["accessible_agents"] == ["/agents/code-reviewer", "/agents/test-agent"]
+
     @pytest.mark.asyncio
     async def test_semantic_search_strips_query(self, mock_search_repo, admin_user_context):
         """Test search strips whitespace from query."""
@@ -1067,6 +1046,65 @@ class TestSemanticSearchSuccess:
         assert len(currenttime_server.matching_tools) == 1
         assert currenttime_server.matching_tools[0].tool_name == "get_current_time"
 
+    @pytest.mark.asyncio
+    async def test_semantic_search_resolves_each_path_once(
+        self,
+        mock_search_repo,
+        mock_agent_service,
+        mock_server_service,
+        regular_user_context,
+    ):
+        """Test access checks and agent lookups run once per unique path."""
+        # Arrange
+        mock_search_repo.search = AsyncMock(
+            return_value={
+                "servers": [{"path": "/servers/currenttime", "server_name": "Time Server"}],
+                "tools": [
+                    {
+                        "server_path": "/servers/currenttime",
+                        "server_name": "Time Server",
+                        "tool_name": t,
+                    }
+                    for t in ("get_time", "get_date")
+                ],
+                "agents": [{"path": "/agents/code-reviewer"}, {"path": "/agents/code-reviewer"}],
+            }
+        )
+        mock_server_service.user_can_access_server_path = AsyncMock(return_value=True)
+        mock_agent_service.get_agent_info = AsyncMock(
+            return_value=AgentCardFactory(path="/agents/code-reviewer", visibility="public")
+        )
+
+        request = SemanticSearchRequest(query="time")
+
+        # Act
+        response = await semantic_search(request, regular_user_context, mock_search_repo)
+
+        # Assert
+        assert len(response.servers) == 1
+        assert len(response.tools) == 2
+        assert len(response.agents) == 2
+        mock_server_service.user_can_access_server_path.assert_awaited_once()
+        mock_agent_service.get_agent_info.assert_awaited_once_with("/agents/code-reviewer")
+
+
+# =============================================================================
+# TEST: Response Encoding
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.api
+@pytest.mark.search
+class TestSearchResponseClass:
+    """Tests for search route JSON encoding."""
+
+    def test_routes_use_orjson(self):
+        """Test every search route encodes its body with orjson."""
+        assert router.routes
+        for route in router.routes:
+            assert route.response_class is ORJSONResponse
+
 
 # =============================================================================
 # TEST: semantic_search Endpoint - Error Handling
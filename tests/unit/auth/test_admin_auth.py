@@ -0,0 +1,68 @@
+"""
+Unit tests for registry/auth/admin_auth.py.
+
+Tests HTTP Basic Auth verification for internal admin endpoints.
+"""
+
+import base64
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from registry.auth.admin_auth import verify_admin_credentials
+
+logger = logging.getLogger(__name__)
+
+ADMIN_ENV = {"ADMIN_USER": "admin", "ADMIN_PASSWORD": "testpass"}
+
+
+def _basic_request(credentials: bytes) -> MagicMock:
+    """Build a request carrying the given raw Basic credentials."""
+    request = MagicMock()
+    request.headers = {"Authorization": "Basic " + base64.b64encode(credentials).decode()}
+    return request
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+class TestVerifyAdminCredentials:
+    """Tests for verify_admin_credentials."""
+
+    async def test_valid_credentials_return_username(self):
+        """Test matching credentials authenticate the admin."""
+        with patch.dict("os.environ", ADMIN_ENV):
+            assert await verify_admin_credentials(_basic_request(b"admin:testpass")) == "admin"
+
+    async def test_password_may_contain_colons(self):
+        """Test only the first colon separates username and password."""
+        with patch.dict("os.environ", {"ADMIN_USER": "admin", "ADMIN_PASSWORD": "a:b"}):
+            assert await verify_admin_credentials(_basic_request(b"admin:a:b")) == "admin"
+
+    @pytest.mark.parametrize("credentials", [b"admin:wrong", b"other:testpass", b"admin:"])
+    async def test_wrong_credentials_rejected(self, credentials):
+        """Test a wrong username or password returns 401."""
+        with patch.dict("os.environ", ADMIN_ENV), pytest.raises(HTTPException) as exc_info:
+            await verify_admin_credentials(_basic_request(credentials))
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Invalid admin credentials"
+
+    async def test_missing_separator_rejected(self):
+        """Test credentials without a colon are an invalid format."""
+        with patch.dict("os.environ", ADMIN_ENV), pytest.raises(HTTPException) as exc_info:
+            await verify_admin_credentials(_basic_request(b"admintestpass"))
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Invalid authentication format"
+
+    async def test_missing_admin_password_is_server_error(self):
+        """Test an unset ADMIN_PASSWORD returns 500."""
+        with (
+            patch.dict("os.environ", {"ADMIN_USER": "admin"}, clear=True),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await verify_admin_credentials(_basic_request(b"admin:testpass"))
+
+        assert exc_info.value.status_code == 500
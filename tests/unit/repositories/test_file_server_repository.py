@@ -332,3 +332,24 @@ class TestFileServerRepositoryIntegration:
             assert result is True
             # Verify file was written
             m.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_creates_updates_and_enables(
+        self, server_repository, sample_server_dict, mock_settings
+    ):
+        """Test bulk upsert writes each server and persists state once."""
+        # Arrange
+        server_repository._servers["/test-server"] = sample_server_dict.copy()
+        new_server = {**sample_server_dict, "path": "/new-server", "server_name": "New"}
+
+        m = mock_open()
+
+        with patch("builtins.open", m), patch.object(server_repository, "_save_state") as save:
+            # Act
+            paths = await server_repository.bulk_upsert([sample_server_dict, new_server], True)
+
+            # Assert
+            assert paths == ["/test-server", "/new-server"]
+            assert server_repository._servers["/new-server"] == new_server
+            assert server_repository._state == {"/test-server": True, "/new-server": True}
+            save.assert_awaited_once()
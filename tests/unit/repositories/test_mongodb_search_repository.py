@@ -488,6 +488,77 @@ class TestSearch:
             assert "tools" in result
             assert "agents" in result
 
+    @pytest.mark.asyncio
+    async def test_search_applies_access_filter(
+        self,
+        mongodb_search_repository,
+        mock_collection,
+        mock_embedding_model,
+    ):
+        """Test that a restricted search matches only accessible documents."""
+        # Arrange
+        from registry.repositories.documentdb.search_repository import build_access_filter
+
+        with patch.object(
+            mongodb_search_repository,
+            "_get_embedding_model",
+            return_value=mock_embedding_model,
+        ):
+            mock_cursor = AsyncMock()
+            mock_cursor.to_list = AsyncMock(return_value=[])
+            mock_collection.aggregate.return_value = mock_cursor
+
+            # Act
+            await mongodb_search_repository.search(
+                "weather data",
+                accessible_servers=["currenttime"],
+                accessible_agents=["/agents/code-reviewer"],
+            )
+
+            # Assert
+            pipeline = mock_collection.aggregate.call_args.args[0]
+            assert {
+                "$match": build_access_filter(["currenttime"], ["/agents/code-reviewer"])
+            } in pipeline
+
+
+# =============================================================================
+# TEST: Access Filter
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.repositories
+class TestBuildAccessFilter:
+    """Tests for the build_access_filter helper."""
+
+    def test_unrestricted_returns_none(self):
+        """Test that no restriction produces no filter."""
+        from registry.repositories.documentdb.search_repository import build_access_filter
+
+        assert build_access_filter(None, None) is None
+
+    def test_restricts_servers_by_path_and_name(self):
+        """Test that servers match on technical path or server name."""
+        from registry.repositories.documentdb.search_repository import build_access_filter
+
+        result = build_access_filter(["currenttime"], None)
+
+        server_clause, agent_clause = result["$or"]
+        assert set(server_clause["$or"][0]["path"]["$in"]) == {"/currenttime", "/currenttime/"}
+        assert server_clause["$or"][1]["name"]["$in"] == ["currenttime"]
+        assert agent_clause == {"entity_type": "a2a_agent"}
+
+    def test_restricts_agents_by_path(self):
+        """Test that agents match on exact path and servers stay unrestricted."""
+        from registry.repositories.documentdb.search_repository import build_access_filter
+
+        result = build_access_filter(None, [])
+
+        server_clause, agent_clause = result["$or"]
+        assert server_clause == {"entity_type": {"$ne": "a2a_agent"}}
+        assert agent_clause == {"entity_type": "a2a_agent", "path": {"$in": []}}
+
 
 # =============================================================================
 # TEST: Format Search Results
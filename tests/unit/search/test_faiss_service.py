@@ -659,6 +659,45 @@ class TestSearch:
 
         assert len(results["servers"]) <= 5
 
+    @pytest.mark.asyncio
+    async def test_search_mixed_restricted_to_accessible_entities(
+        self, faiss_service, sample_server_info, sample_agent_card
+    ):
+        """Test search_mixed only retrieves entities the user can access."""
+        await faiss_service.add_or_update_service(
+            "/servers/test-server", sample_server_info, is_enabled=True
+        )
+        await faiss_service.add_or_update_service(
+            "/servers/other-server",
+            {**sample_server_info, "server_name": "other-server"},
+            is_enabled=True,
+        )
+        await faiss_service.add_or_update_agent(
+            "/agents/test-agent", sample_agent_card, is_enabled=True
+        )
+
+        results = await faiss_service.search_mixed(
+            "test server",
+            accessible_servers=["test-server"],
+            accessible_agents=[],
+        )
+
+        assert [server["path"] for server in results["servers"]] == ["/servers/test-server"]
+        assert results["agents"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_mixed_no_accessible_entities(self, faiss_service, sample_server_info):
+        """Test search_mixed returns nothing when the user can access nothing."""
+        await faiss_service.add_or_update_service(
+            "/servers/test-server", sample_server_info, is_enabled=True
+        )
+
+        results = await faiss_service.search_mixed(
+            "test server", accessible_servers=[], accessible_agents=[]
+        )
+
+        assert results == {"servers": [], "tools": [], "agents": []}
+
     @pytest.mark.asyncio
     async def test_search_entities_wrapper(self, faiss_service, sample_server_info):
         """Test search_entities wrapper method."""
@@ -0,0 +1,121 @@
+"""
+Unit tests for registry.services.agent_service_cache.
+
+Tests the TTL LRU behaviour of AgentInfoCache and that AgentService serves
+cached agent cards until a write to the same path invalidates them.
+"""
+
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from registry.services.agent_service import AgentService
+from registry.services.agent_service_cache import AgentInfoCache
+from tests.fixtures.factories import AgentCardFactory
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def agent_card():
+    """Create a public agent card."""
+    return AgentCardFactory(path="/agents/code-reviewer", visibility="public")
+
+
+@pytest.fixture
+def agent_service(agent_card) -> AgentService:
+    """Create an AgentService whose repository returns a single agent card."""
+    agent_repo = AsyncMock()
+    agent_repo.get = AsyncMock(return_value=agent_card)
+    agent_repo.save = AsyncMock(side_effect=lambda card: card)
+    return AgentService(agent_repo=agent_repo, search_repo=AsyncMock())
+
+
+# =============================================================================
+# TEST: AgentInfoCache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAgentInfoCache:
+    """Tests for the AgentInfoCache TTL LRU."""
+
+    def test_miss_then_hit(self, agent_card):
+        """A stored card is returned until it is invalidated."""
+        cache = AgentInfoCache(max_size=10, ttl_seconds=60)
+
+        assert cache.get("/agents/code-reviewer") == (False, None)
+        cache.set("/agents/code-reviewer", agent_card)
+        assert cache.get("/agents/code-reviewer") == (True, agent_card)
+
+        cache.invalidate("/agents/code-reviewer")
+        assert cache.get("/agents/code-reviewer") == (False, None)
+
+    def test_caches_missing_agents(self):
+        """A None card is cached as a hit."""
+        cache = AgentInfoCache(max_size=10, ttl_seconds=60)
+        cache.set("/agents/missing", None)
+
+        assert cache.get("/agents/missing") == (True, None)
+
+    def test_entries_expire(self, agent_card):
+        """Entries older than the TTL are treated as misses."""
+        cache = AgentInfoCache(max_size=10, ttl_seconds=60)
+        with patch("registry.services.agent_service_cache.time.monotonic", return_value=100.0):
+            cache.set("/agents/code-reviewer", agent_card)
+        with patch("registry.services.agent_service_cache.time.monotonic", return_value=160.0):
+            assert cache.get("/agents/code-reviewer") == (False, None)
+
+    def test_evicts_least_recently_used(self, agent_card):
+        """The least recently read entry is evicted when the cache is full."""
+        cache = AgentInfoCache(max_size=2, ttl_seconds=60)
+        cache.set("/a", agent_card)
+        cache.set("/b", agent_card)
+        cache.get("/a")
+        cache.set("/c", agent_card)
+
+        assert cache.get("/a")[0] is True
+        assert cache.get("/b")[0] is False
+        assert cache.get("/c")[0] is True
+
+    def test_zero_ttl_disables_caching(self, agent_card):
+        """With a zero TTL nothing is stored."""
+        cache = AgentInfoCache(max_size=10, ttl_seconds=0)
+        cache.set("/agents/code-reviewer", agent_card)
+
+        assert cache.get("/agents/code-reviewer") == (False, None)
+
+
+# =============================================================================
+# TEST: AgentService.get_cached_agent_info
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGetCachedAgentInfo:
+    """Tests for cached agent lookups on AgentService."""
+
+    async def test_repeated_lookups_hit_repository_once(self, agent_service, agent_card):
+        """Repeated lookups of the same path reuse the cached card."""
+        first = await agent_service.get_cached_agent_info("/agents/code-reviewer")
+        second = await agent_service.get_cached_agent_info("/agents/code-reviewer")
+
+        assert first is agent_card
+        assert second is agent_card
+        agent_service._repo.get.assert_awaited_once_with("/agents/code-reviewer")
+
+    async def test_update_invalidates_cached_card(self, agent_service, agent_card):
+        """Updating an agent forces the next lookup back to the repository."""
+        agent_service.registered_agents[agent_card.path] = agent_card
+        await agent_service.get_cached_agent_info(agent_card.path)
+
+        await agent_service.update_agent(agent_card.path, {"description": "Updated"})
+        await agent_service.get_cached_agent_info(agent_card.path)
+
+        assert agent_service._repo.get.await_count == 2
@@ -0,0 +1,118 @@
+"""
+Unit tests for registry.services.federation clients.
+
+Tests that fetch_all_* calls fan out per-item requests concurrently
+while keeping results in configuration order, that iter_servers
+streams fetched servers, and that clients share one connection pool.
+"""
+
+import logging
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from registry.schemas.federation_schema import AnthropicServerConfig
+from registry.services.federation.anthropic_client import AnthropicFederationClient
+from registry.services.federation.asor_client import AsorFederationClient
+from registry.services.federation.base_client import (
+    close_shared_http_client,
+    get_shared_http_client,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def anthropic_client():
+    """Create an Anthropic client against a dummy endpoint."""
+    return AnthropicFederationClient(endpoint="https://registry.example.com")
+
+
+# =============================================================================
+# TEST: Concurrent Fetch
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFetchAllServers:
+    """Tests for AnthropicFederationClient.fetch_all_servers."""
+
+    def test_fetches_overlap(self, anthropic_client):
+        """Per-server requests run concurrently rather than one after another."""
+        configs = [AnthropicServerConfig(name=f"io.example/server-{i}") for i in range(3)]
+        barrier = threading.Barrier(len(configs), timeout=5)
+
+        def fake_fetch(server_name, server_config=None):
+            barrier.wait()
+            return {"server_name": server_name}
+
+        with patch.object(anthropic_client, "fetch_server", side_effect=fake_fetch):
+            servers = anthropic_client.fetch_all_servers(configs)
+
+        assert [s["server_name"] for s in servers] == [c.name for c in configs]
+
+    def test_failed_fetches_are_skipped(self, anthropic_client):
+        """Servers that fail to fetch are dropped and order is preserved."""
+        configs = [AnthropicServerConfig(name=name) for name in ("a", "b", "c")]
+
+        def fake_fetch(server_name, server_config=None):
+            return None if server_name == "b" else {"server_name": server_name}
+
+        with patch.object(anthropic_client, "fetch_server", side_effect=fake_fetch):
+            servers = anthropic_client.fetch_all_servers(configs)
+
+        assert [s["server_name"] for s in servers] == ["a", "c"]
+
+    def test_iter_servers_yields_as_fetched(self, anthropic_client):
+        """iter_servers yields each server once fetched and skips failures."""
+        configs = [AnthropicServerConfig(name=name) for name in ("a", "b", "c")]
+
+        def fake_fetch(server_name, server_config=None):
+            return None if server_name == "b" else {"server_name": server_name}
+
+        with patch.object(anthropic_client, "fetch_server", side_effect=fake_fetch):
+            servers = list(anthropic_client.iter_servers(configs))
+
+        assert sorted(s["server_name"] for s in servers) == ["a", "c"]
+
+
+# =============================================================================
+# TEST: Shared HTTP Client
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSharedHttpClient:
+    """Tests for the connection pool shared across federation clients."""
+
+    def test_clients_share_connection_pool(self):
+        """Separately constructed clients reuse one httpx.Client."""
+        first = AnthropicFederationClient(endpoint="https://registry.example.com")
+        second = AsorFederationClient(endpoint="https://asor.example.com")
+
+        assert first.client is second.client
+        assert first.client is get_shared_http_client()
+
+    def test_close_replaces_shared_client(self):
+        """Closing the shared client makes the next client open a new pool."""
+        old_client = get_shared_http_client()
+        close_shared_http_client()
+
+        assert old_client.is_closed
+        assert get_shared_http_client() is not old_client
+
+    def test_injected_client_used(self):
+        """An explicitly passed client overrides the shared pool."""
+        custom = httpx.Client()
+        try:
+            client = AnthropicFederationClient(endpoint="https://x.example.com", client=custom)
+            assert client.client is custom
+        finally:
+            custom.close()
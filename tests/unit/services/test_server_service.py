@@ -810,6 +810,7 @@ class TestGetFilteredServers:
 
         # Assert
         assert result is False
+        mock_server_repository.get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_user_can_access_server_path_nonexistent(
@@ -822,7 +823,7 @@ class TestGetFilteredServers:
         mock_server_repository.get.return_value = None
 
         # Act
-        result = await server_service.user_can_access_server_path("/nonexistent", ["test-server"])
+        result = await server_service.user_can_access_server_path("/nonexistent", ["nonexistent"])
 
         # Assert
         assert result is False
@@ -1133,6 +1134,68 @@ class TestToggleService:
             mock_nginx_service.reload_nginx.assert_not_called()
 
 
+# =============================================================================
+# TEST: Bulk Upsert
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.servers
+class TestBulkUpsertServers:
+    """Test creating or updating many servers at once."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_single_repository_call(
+        self,
+        server_service: ServerService,
+        sample_server_dict: dict[str, Any],
+        sample_server_dict_2: dict[str, Any],
+        mock_server_repository,
+        mock_search_repository,
+    ):
+        """Test bulk upsert writes once, indexes each server and reloads nginx once."""
+        # Arrange
+        servers = [sample_server_dict, sample_server_dict_2]
+        mock_server_repository.bulk_upsert.return_value = ["/test-server", "/another-server"]
+
+        with patch("registry.core.nginx_service.nginx_service") as mock_nginx_service:
+            # Act
+            paths = await server_service.bulk_upsert_servers(servers)
+
+            # Assert
+            assert paths == ["/test-server", "/another-server"]
+            mock_server_repository.bulk_upsert.assert_awaited_once_with(servers, True)
+            mock_server_repository.create.assert_not_called()
+            mock_server_repository.set_state.assert_not_called()
+            assert mock_search_repository.index_server.await_count == 2
+            mock_nginx_service.generate_config.assert_called_once()
+            mock_nginx_service.reload_nginx.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_skips_failed_paths(
+        self,
+        server_service: ServerService,
+        sample_server_dict: dict[str, Any],
+        sample_server_dict_2: dict[str, Any],
+        mock_server_repository,
+        mock_search_repository,
+    ):
+        """Test only written servers are indexed, and nothing reloads when none are."""
+        # Arrange
+        mock_server_repository.bulk_upsert.return_value = []
+
+        with patch("registry.core.nginx_service.nginx_service") as mock_nginx_service:
+            # Act
+            paths = await server_service.bulk_upsert_servers(
+                [sample_server_dict, sample_server_dict_2]
+            )
+
+            # Assert
+            assert paths == []
+            mock_search_repository.index_server.assert_not_called()
+            mock_nginx_service.generate_config.assert_not_called()
+
+
 # =============================================================================
 # TEST: Reload State From Disk
 # =============================================================================
@@ -0,0 +1,59 @@
+"""
+Unit tests for credentials-provider/utils.py.
+
+Tests that credential redaction covers every key in the text, including keys
+that directly follow another credential's value.
+"""
+
+import logging
+
+import pytest
+
+from tests.fixtures.helpers import load_credentials_provider_module
+
+logger = logging.getLogger(__name__)
+
+utils = load_credentials_provider_module("utils")
+
+
+@pytest.mark.unit
+class TestRedactCredentialsInText:
+    """Tests for redact_credentials_in_text."""
+
+    def test_text_without_credentials_is_unchanged(self):
+        """Test text without credential keys is returned as-is."""
+        text = "Fetched 3 servers from the registry"
+
+        assert utils.redact_credentials_in_text(text) == text
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("token=abcdefghijkl", "token=abcdefgh****"),
+            ('"access_token": "abcdefghijkl"', '"access_token": "abcdefgh****"'),
+            ("PASSWORD: hunter2", "PASSWORD: *******"),
+        ],
+    )
+    def test_single_credential_is_redacted(self, text, expected):
+        """Test a single credential value is redacted after show_chars characters."""
+        assert utils.redact_credentials_in_text(text) == expected
+
+    @pytest.mark.parametrize(
+        ("text", "leaked"),
+        [
+            ("token=abc;password= hunter2", "hunter2"),
+            ("session_token=abc,client_secret: s3cr3t", "s3cr3t"),
+        ],
+    )
+    def test_credential_after_another_value_is_redacted(self, text, leaked):
+        """Test a key embedded in the previous credential's value is still redacted."""
+        redacted = utils.redact_credentials_in_text(text)
+
+        assert leaked not in redacted
+
+    def test_overlapping_keys_match_per_key_redaction(self):
+        """Test overlapping keys are redacted one key at a time."""
+        assert (
+            utils.redact_credentials_in_text("token=abc;password= hunter2")
+            == "token=abc;pass***** *******"
+        )
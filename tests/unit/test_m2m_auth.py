@@ -0,0 +1,144 @@
+"""
+Unit tests for credentials-provider/m2m_auth.py.
+
+Tests the in-process M2M token cache: hits skip the token endpoint and
+report the remaining lifetime, tokens are refetched a safety buffer before
+they expire, and invalidation drops cached tokens.
+"""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+
+from tests.fixtures.helpers import load_credentials_provider_module
+
+logger = logging.getLogger(__name__)
+
+m2m_auth = load_credentials_provider_module("m2m_auth")
+
+TOKEN_URL = "https://idp.example.com/oauth2/token"
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty token cache."""
+    m2m_auth.invalidate_m2m_token()
+    yield
+    m2m_auth.invalidate_m2m_token()
+
+
+@pytest.fixture
+def http_client(monkeypatch) -> MagicMock:
+    """Replace the shared HTTP client with one returning numbered tokens."""
+    client = MagicMock()
+    client.post.side_effect = lambda *args, **kwargs: httpx.Response(
+        200,
+        content=orjson.dumps(
+            {"access_token": f"token-{client.post.call_count}", "expires_in": 3600}
+        ),
+    )
+    monkeypatch.setattr(m2m_auth, "_http_client", client)
+    return client
+
+
+@pytest.fixture
+def monotonic():
+    """Control the monotonic clock used by the token cache."""
+    with patch.object(m2m_auth.time, "monotonic", return_value=1000.0) as mock_monotonic:
+        yield mock_monotonic
+
+
+def _authenticate(client_id: str = "client-a", **kwargs) -> dict:
+    return m2m_auth.perform_m2m_authentication(
+        TOKEN_URL, client_id, "secret", m2m_auth.Provider.KEYCLOAK, **kwargs
+    )
+
+
+# =============================================================================
+# TEST: Token cache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestM2MTokenCache:
+    """Tests for the M2M token cache."""
+
+    def test_cache_hit_skips_token_request(self, http_client, monotonic):
+        """Test a cached token is returned without another request."""
+        first = _authenticate()
+        second = _authenticate()
+
+        assert first["access_token"] == second["access_token"] == "token-1"
+        assert http_client.post.call_count == 1
+
+    def test_cache_hit_reports_remaining_lifetime(self, http_client, monotonic):
+        """Test expires_in on a cache hit counts down from the original lifetime."""
+        assert _authenticate()["expires_in"] == 3600
+
+        monotonic.return_value = 1100.0
+        cached = _authenticate()
+
+        assert cached["access_token"] == "token-1"
+        assert cached["expires_in"] == 3500
+
+    def test_token_refetched_within_safety_buffer(self, http_client, monotonic):
+        """Test a token is refetched once less than the safety buffer remains."""
+        _authenticate()
+
+        # 3600s token: buffer is min(300, 10%) = 300s, so refresh at 3300s
+        monotonic.return_value = 1000.0 + 3299
+        assert _authenticate()["access_token"] == "token-1"
+
+        monotonic.return_value = 1000.0 + 3300
+        assert _authenticate()["access_token"] == "token-2"
+
+    def test_short_lived_token_uses_proportional_buffer(self, http_client, monotonic):
+        """Test a short token is refetched when 10% of its lifetime remains."""
+        http_client.post.side_effect = lambda *args, **kwargs: httpx.Response(
+            200,
+            content=orjson.dumps(
+                {"access_token": f"token-{http_client.post.call_count}", "expires_in": 100}
+            ),
+        )
+        _authenticate()
+
+        monotonic.return_value = 1000.0 + 89
+        assert _authenticate()["access_token"] == "token-1"
+
+        monotonic.return_value = 1000.0 + 90
+        assert _authenticate()["access_token"] == "token-2"
+
+    def test_invalidate_single_client(self, http_client, monotonic):
+        """Test invalidating one client leaves other clients' tokens cached."""
+        _authenticate("client-a")
+        _authenticate("client-b")
+
+        m2m_auth.invalidate_m2m_token("client-a")
+
+        assert _authenticate("client-a")["access_token"] == "token-3"
+        assert _authenticate("client-b")["access_token"] == "token-2"
+
+    def test_invalidate_all_clients(self, http_client, monotonic):
+        """Test invalidating without a client ID drops every cached token."""
+        _authenticate("client-a")
+        _authenticate("client-b")
+
+        m2m_auth.invalidate_m2m_token()
+        _authenticate("client-a")
+        _authenticate("client-b")
+
+        assert http_client.post.call_count == 4
+
+    def test_use_cache_false_always_requests(self, http_client, monotonic):
+        """Test use_cache=False bypasses the cache."""
+        _authenticate()
+
+        assert _authenticate(use_cache=False)["access_token"] == "token-2"
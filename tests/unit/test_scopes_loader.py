@@ -0,0 +1,112 @@
+"""
+Unit tests for registry/common/scopes_loader.py.
+
+Tests that parsed scopes files are reused until they change on disk, that
+callers cannot modify the cached configuration, and that repository loads
+merge every group's details.
+"""
+
+import logging
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from registry.common import scopes_loader
+from registry.common.scopes_loader import load_scopes_from_repository, load_scopes_from_yaml
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def scopes_file(tmp_path) -> Path:
+    """Write a minimal scopes.yml and clear the parse cache."""
+    path = tmp_path / "scopes.yml"
+    path.write_text("group_mappings:\n  admins:\n    - admin-scope\n")
+    scopes_loader._yaml_cache.clear()
+    yield path
+    scopes_loader._yaml_cache.clear()
+
+
+@pytest.mark.unit
+class TestLoadScopesFromYaml:
+    """Tests for load_scopes_from_yaml caching."""
+
+    def test_unchanged_file_is_parsed_once(self, scopes_file):
+        """Test repeated loads of an unchanged file reuse the parsed config."""
+        with patch.object(scopes_loader.yaml, "load", wraps=scopes_loader.yaml.load) as mock_load:
+            first = load_scopes_from_yaml(str(scopes_file))
+            second = load_scopes_from_yaml(str(scopes_file))
+
+        assert first == second == {"group_mappings": {"admins": ["admin-scope"]}}
+        assert mock_load.call_count == 1
+
+    def test_changed_file_is_reparsed(self, scopes_file):
+        """Test a modified file is parsed again."""
+        load_scopes_from_yaml(str(scopes_file))
+
+        scopes_file.write_text("group_mappings:\n  users:\n    - user-scope\n    - extra\n")
+        stat = scopes_file.stat()
+        os.utime(scopes_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_scopes_from_yaml(str(scopes_file)) == {
+            "group_mappings": {"users": ["user-scope", "extra"]}
+        }
+
+    def test_callers_cannot_mutate_cache(self, scopes_file):
+        """Test mutating a returned config does not affect later loads."""
+        config = load_scopes_from_yaml(str(scopes_file))
+        config["group_mappings"]["admins"].append("injected")
+
+        assert load_scopes_from_yaml(str(scopes_file)) == {
+            "group_mappings": {"admins": ["admin-scope"]}
+        }
+
+
+@pytest.mark.unit
+class TestLoadScopesFromRepository:
+    """Tests for load_scopes_from_repository."""
+
+    async def test_builds_config_from_all_groups(self):
+        """Test every group's details are fetched and merged into the config."""
+        groups = {
+            "admin-scope": {
+                "group_mappings": ["admins"],
+                "server_access": [{"server": "*"}],
+                "ui_permissions": {"list_service": ["all"]},
+            },
+            "user-scope": {"group_mappings": ["users", "admins"], "server_access": []},
+        }
+        scope_repo = AsyncMock()
+        scope_repo.list_groups = AsyncMock(return_value={name: {} for name in groups})
+        scope_repo.get_group = AsyncMock(side_effect=lambda name: groups[name])
+
+        with patch("registry.repositories.factory.get_scope_repository", return_value=scope_repo):
+            config = await load_scopes_from_repository(max_retries=1)
+
+        assert scope_repo.get_group.await_count == 2
+        assert config["group_mappings"] == {
+            "admins": ["admin-scope", "user-scope"],
+            "users": ["user-scope"],
+        }
+        assert config["admin-scope"] == [{"server": "*"}]
+        assert "user-scope" not in config
+        assert config["UI-Scopes"] == {"admin-scope": {"list_service": ["all"]}}
+
+    async def test_retries_with_capped_jittered_backoff(self):
+        """Test failed loads are retried with sleeps no longer than the cap."""
+        scope_repo = AsyncMock()
+        scope_repo.load_all = AsyncMock(side_effect=ConnectionRefusedError("refused"))
+
+        with (
+            patch("registry.repositories.factory.get_scope_repository", return_value=scope_repo),
+            patch.object(scopes_loader.asyncio, "sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            config = await load_scopes_from_repository(max_retries=4, initial_delay=8.0)
+
+        assert config == {"group_mappings": {}}
+        assert scope_repo.load_all.await_count == 4
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(delays) == 3
+        assert all(0 <= delay <= scopes_loader._MAX_RETRY_DELAY_SECONDS for delay in delays)